@@ -7,8 +7,10 @@ from flask_admin import Admin
 from flask_wtf.csrf import CSRFProtect
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-from app.config import Config
-from app.extensions import db, bcrypt, login_manager, migrate, admin, limiter, csrf, mail
+from app.config import get_config
+from app.extensions import db, bcrypt, login_manager, migrate, admin, limiter, csrf, mail, compress, init_sqlite_pragmas
+from app.utils.db_pool import init_postgres_pool
+from app.utils.db_routing import replica_router
 
 # Import extensions from extensions.py
 db = db
@@ -19,14 +21,16 @@ login_manager.login_message_category = 'info'
 
 @login_manager.user_loader
 def load_user(user_id):
-    from app.models.user import User
-    return User.query.get(int(user_id))
+    # A cached snapshot, not the ORM row: authenticated requests skip the users SELECT
+    from app.utils.identity import identity_cache
+    return identity_cache.get(int(user_id))
 migrate = migrate
 admin = admin
 
-def create_app(config_class=Config):
+def create_app(config_class=None):
     app = Flask(__name__)
-    app.config.from_object(Config)
+    # Profile from APP_CONFIG (development by default) unless one is passed in
+    app.config.from_object(config_class or get_config())
     
     # Security headers
     @app.after_request
@@ -38,49 +42,34 @@ def create_app(config_class=Config):
         return response
     
     # Initialize extensions with app
+    init_postgres_pool(app)
     db.init_app(app)
+    init_sqlite_pragmas(app)
+    replica_router.init_app(app)
     bcrypt.init_app(app)
     login_manager.init_app(app)
-    migrate.init_app(app, db, render_as_batch=True)
+    # The search index table is managed by raw DDL in its migration
+    from app.utils.search import exclude_search_tables
+    migrate.init_app(app, db, render_as_batch=True, include_object=exclude_search_tables)
     admin.init_app(app)
     csrf.init_app(app)
     limiter.init_app(app)
     mail.init_app(app)
+    compress.init_app(app)
+    
+    # Static asset helpers (prebuilt stylesheets, cache headers)
+    from app.utils.assets import init_assets
+    init_assets(app)
+    
+    # Branding/contact values for templates, frozen once per app
+    # (in debug mode they are rebuilt only when the .env file changes)
+    from app.utils.env_context import EnvContext
+    env_context = EnvContext(app)
+    app.extensions['env_context'] = env_context
     
-    # Context processor to inject environment variables into all templates
     @app.context_processor
     def inject_env_vars():
-        import os
-        from dotenv import load_dotenv
-        
-        # In debug mode, reload .env on every request to pick up changes automatically
-        if app.debug:
-            load_dotenv()
-            # Update app.config with new values from OS environment
-            for key in app.config.keys():
-                if key in os.environ:
-                    app.config[key] = os.environ.get(key)
-
-        return {
-            'env': {
-                'CONTACT_EMAIL': app.config.get('CONTACT_EMAIL', ''),
-                'SUPPORT_EMAIL': app.config.get('SUPPORT_EMAIL', ''),
-                'CONTACT_PHONE': app.config.get('CONTACT_PHONE', ''),
-                'WHATSAPP_NUMBER': app.config.get('WHATSAPP_NUMBER', ''),
-                'BUSINESS_ADDRESS_LINE1': app.config.get('BUSINESS_ADDRESS_LINE1', ''),
-                'BUSINESS_ADDRESS_LINE2': app.config.get('BUSINESS_ADDRESS_LINE2', ''),
-                'BUSINESS_COUNTRY': app.config.get('BUSINESS_COUNTRY', ''),
-                'TWITTER_URL': app.config.get('TWITTER_URL', '#'),
-                'LINKEDIN_URL': app.config.get('LINKEDIN_URL', '#'),
-                'GITHUB_URL': app.config.get('GITHUB_URL', '#'),
-                'DISCORD_URL': app.config.get('DISCORD_URL', '#'),
-                'FACEBOOK_URL': app.config.get('FACEBOOK_URL', '#'),
-                'BRAND_NAME': app.config.get('BRAND_NAME', 'Platform'),
-                'BRAND_TAGLINE': app.config.get('BRAND_TAGLINE', ''),
-                'COPYRIGHT_YEAR': app.config.get('COPYRIGHT_YEAR', '2025'),
-                'COPYRIGHT_TEXT': app.config.get('COPYRIGHT_TEXT', 'All rights reserved.')
-            }
-        }
+        return {'env': env_context.get()}
     
     # Import and register blueprints
     from app.auth.routes import auth
@@ -91,6 +80,7 @@ def create_app(config_class=Config):
     from app.study_material.routes import study_material
     from app.youtube.routes import youtube
     from app.contact.routes import contact
+    from app.search.routes import search
     
     app.register_blueprint(auth)
     app.register_blueprint(admin_bp)
@@ -100,6 +90,31 @@ def create_app(config_class=Config):
     app.register_blueprint(study_material)
     app.register_blueprint(youtube)
     app.register_blueprint(contact)
+    app.register_blueprint(search)
+    
+    # Shared Jinja bytecode cache and optional template warm-up
+    from app.utils.templating import init_templating
+    init_templating(app)
+    
+    # Render the env-context-only pages (privacy, terms, cookies) up front
+    from app.utils.cache import prerendered_pages
+    prerendered_pages.warm(app)
+    
+    # Write-behind download counters, flushed in the background
+    from app.utils.counters import download_counter
+    download_counter.init_app(app)
+    
+    # Download events are queued and inserted in batches
+    from app.utils.event_log import download_log
+    download_log.init_app(app)
+    
+    # Static-site export of the public pages
+    from app.utils.freeze import freeze_command
+    app.cli.add_command(freeze_command)
+    
+    # Full-text search index maintenance (flask search rebuild)
+    from app.utils.search import search_cli
+    app.cli.add_command(search_cli)
     
     # Register error handlers
     @app.errorhandler(404)
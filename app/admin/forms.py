@@ -102,7 +102,7 @@ class StudyMaterialForm(FlaskForm):
     """Form for creating and editing study materials"""
     title = StringField('Title')
     description = TextAreaField('Description')
-    category = SelectField('Category', choices=[], validators=[DataRequired()])
+    category_id = SelectField('Category', coerce=int, choices=[], validators=[DataRequired()])
     file = FileField('Material File', validators=[Optional(), FileAllowed(['pdf', 'doc', 'docx', 'ppt', 'pptx'], 'Only PDF, DOC, DOCX, PPT, PPTX files allowed!')])
     doc_url = StringField('Document URL (Optional)', validators=[Optional(), Length(max=500)])
     thumbnail = FileField('Thumbnail Image', validators=[Optional(), FileAllowed(['jpg', 'png', 'jpeg', 'webp'], 'Images only!')])
@@ -141,7 +141,7 @@ class YouTubeVideoForm(FlaskForm):
     title = StringField('Title', validators=[DataRequired()])
     description = TextAreaField('Description', validators=[Optional()])
     video_url = StringField('YouTube URL', validators=[DataRequired()])
-    category = SelectField('Category', choices=[], validators=[DataRequired()])
+    category_id = SelectField('Category', coerce=int, choices=[], validators=[DataRequired()])
     is_active = SelectField('Status', choices=[('True', 'Active'), ('False', 'Inactive')], default='True')
     submit = SubmitField('Save')
 
@@ -21,7 +21,7 @@ import secrets
 # =========================================
 # THIRD-PARTY IMPORTS
 # =========================================
-from flask import render_template, redirect, url_for, flash, request
+from flask import current_app, render_template, redirect, url_for, flash, request, jsonify
 from flask_login import login_required, current_user
 from werkzeug.utils import secure_filename
 
@@ -62,6 +62,16 @@ from app.models.blog_category import BlogCategory
 from app.utils.helpers import save_image
 from app.utils.decorators import admin_required
 from app.utils.constants import ROLE_ADMIN, ROLE_USER
+from app.utils.query_options import project_listing_options, video_listing_options, material_listing_options
+from app.utils.stats import dashboard_stats
+from app.utils.identity import identity_cache
+from app.utils.db_pool import pool_metrics
+from app.utils.search import search_index
+from app.utils.cache import (
+    content_cache, page_cache, HOME_CONTENT_KEY, ABOUT_CONTENT_KEY, HOME_SKILLS_KEY, HOME_TEAM_KEY,
+    SERVICES_DATA_KEY, PAGE_TAG_HOME, PAGE_TAG_ABOUT, PAGE_TAG_BLOG, PAGE_TAG_PROJECTS, PAGE_TAG_SERVICES,
+    PAGE_TAG_MATERIALS, PAGE_TAG_VIDEOS
+)
 
 
 # =========================================
@@ -73,32 +83,24 @@ from app.utils.constants import ROLE_ADMIN, ROLE_USER
 @admin_required
 def admin_dashboard():
     """Admin dashboard with statistics and recent inquiries"""
-    # Get counts for dashboard
-    user_count = User.query.count()
-    service_count = Service.query.count()
-    project_count = Project.query.count()
-    material_count = StudyMaterial.query.count()
-    video_count = YouTubeVideo.query.count()
-    inquiry_count = Inquiry.query.count()
-    blog_count = BlogPost.query.count()
-    skill_count = Skill.query.count()
-    team_count = TeamMember.query.count()
+    # Cached counts (user_count, service_count, ...), recounted in one query when stale
+    counts = dashboard_stats.get()
     
     # Get recent inquiries
     recent_inquiries = Inquiry.query.order_by(Inquiry.created_at.desc()).limit(5).all()
     
     return render_template('admin/dashboard.html', 
                           title='Admin Dashboard',
-                          user_count=user_count,
-                          service_count=service_count,
-                          project_count=project_count,
-                          material_count=material_count,
-                          video_count=video_count,
-                          inquiry_count=inquiry_count,
-                          blog_count=blog_count,
-                          skill_count=skill_count,
-                          team_count=team_count,
-                          recent_inquiries=recent_inquiries)
+                          recent_inquiries=recent_inquiries,
+                          **counts)
+
+
+@admin_bp.route("/admin/metrics/db-pool")
+@login_required
+@admin_required
+def admin_db_pool_metrics():
+    """Connection pool usage and checkout waits for the worker serving the request"""
+    return jsonify(pool_metrics(db.engine))
 
 
 # =========================================
@@ -135,6 +137,7 @@ def admin_user_new():
             )
             db.session.add(user)
             db.session.commit()
+            dashboard_stats.invalidate('user_count')
             flash(f'New {form.role.data} account created for {user.username}!', 'success')
             return redirect(url_for('admin_bp.admin_users'))
             
@@ -152,6 +155,7 @@ def toggle_user_status(user_id):
     else:
         user.is_active = not user.is_active
         db.session.commit()
+        identity_cache.invalidate(user.id)
         status = "activated" if user.is_active else "deactivated"
         flash(f'User {user.username} has been {status}.', 'success')
     return redirect(url_for('admin_bp.admin_users'))
@@ -172,6 +176,8 @@ def admin_services():
         category = ServiceCategory(name=cat_form.name.data, description=cat_form.description.data)
         db.session.add(category)
         db.session.commit()
+        content_cache.bump(SERVICES_DATA_KEY)
+        page_cache.purge(PAGE_TAG_SERVICES)
         flash(f'Category "{category.name}" created successfully!', 'success')
         return redirect(url_for('admin_bp.admin_services'))
 
@@ -215,7 +221,12 @@ def admin_service_form(service_id=None):
         if not service.user_id:
             service.user_id = current_user.id
             
+        search_index.update(service)
         db.session.commit()
+        if not service_id:
+            dashboard_stats.invalidate('service_count')
+        content_cache.bump(SERVICES_DATA_KEY)
+        page_cache.purge(PAGE_TAG_SERVICES)
         flash('Service saved successfully!', 'success')
         return redirect(url_for('admin_bp.admin_services'))
         
@@ -228,8 +239,12 @@ def admin_service_form(service_id=None):
 def delete_service(service_id):
     """Delete service"""
     service = Service.query.get_or_404(service_id)
+    search_index.remove(service)
     db.session.delete(service)
     db.session.commit()
+    dashboard_stats.invalidate('service_count')
+    content_cache.bump(SERVICES_DATA_KEY)
+    page_cache.purge(PAGE_TAG_SERVICES)
     flash('Service deleted successfully!', 'success')
     return redirect(url_for('admin_bp.admin_services'))
 
@@ -263,6 +278,8 @@ def admin_category_form(category_id=None):
         
         form.populate_obj(category)
         db.session.commit()
+        content_cache.bump(SERVICES_DATA_KEY)
+        page_cache.purge(PAGE_TAG_SERVICES)
         flash('Category saved successfully!', 'success')
         return redirect(url_for('admin_bp.admin_categories'))
         
@@ -280,6 +297,8 @@ def delete_category(category_id):
     else:
         db.session.delete(category)
         db.session.commit()
+        content_cache.bump(SERVICES_DATA_KEY)
+        page_cache.purge(PAGE_TAG_SERVICES)
         flash('Category deleted successfully!', 'success')
     return redirect(url_for('admin_bp.admin_categories'))
 
@@ -299,17 +318,21 @@ def admin_projects():
         category = ProjectCategory(name=cat_form.name.data, description=cat_form.description.data)
         db.session.add(category)
         db.session.commit()
+        page_cache.purge(PAGE_TAG_PROJECTS)
         flash(f'Category "{category.name}" created successfully!', 'success')
         return redirect(url_for('admin_bp.admin_projects'))
 
     page = request.args.get('page', 1, type=int)
-    projects = Project.query.order_by(Project.created_at.desc()).paginate(page=page, per_page=10)
+    projects = Project.query.options(*project_listing_options()).order_by(Project.created_at.desc()).paginate(page=page, per_page=current_app.config['ADMIN_PROJECTS_PER_PAGE'])
     categories = ProjectCategory.query.all()
+    # One grouped count instead of loading every category's project list
+    project_counts = dict(db.session.query(Project.category_id, db.func.count(Project.id)).group_by(Project.category_id).all())
     
     return render_template('admin/projects.html', 
                          title='Manage Projects', 
                          projects=projects, 
                          categories=categories,
+                         project_counts=project_counts,
                          cat_form=cat_form)
 
 
@@ -352,7 +375,11 @@ def admin_project_form(project_id=None):
             project.category_id = None
             
         project.is_active = form.is_active.data == 'True'
+        search_index.update(project)
         db.session.commit()
+        if not project_id:
+            dashboard_stats.invalidate('project_count')
+        page_cache.purge(PAGE_TAG_PROJECTS)
         flash('Project saved successfully!', 'success')
         return redirect(url_for('admin_bp.admin_projects'))
         
@@ -365,8 +392,11 @@ def admin_project_form(project_id=None):
 def delete_project(project_id):
     """Delete project"""
     project = Project.query.get_or_404(project_id)
+    search_index.remove(project)
     db.session.delete(project)
     db.session.commit()
+    dashboard_stats.invalidate('project_count')
+    page_cache.purge(PAGE_TAG_PROJECTS)
     flash('Project deleted successfully!', 'success')
     return redirect(url_for('admin_bp.admin_projects'))
 
@@ -386,6 +416,7 @@ def admin_project_category_form(category_id):
     if form.validate_on_submit():
         form.populate_obj(category)
         db.session.commit()
+        page_cache.purge(PAGE_TAG_PROJECTS)
         flash('Category updated successfully!', 'success')
         return redirect(url_for('admin_bp.admin_projects'))
         
@@ -403,6 +434,7 @@ def delete_project_category(category_id):
     else:
         db.session.delete(category)
         db.session.commit()
+        page_cache.purge(PAGE_TAG_PROJECTS)
         flash('Category deleted successfully!', 'success')
     return redirect(url_for('admin_bp.admin_projects'))
 
@@ -417,7 +449,7 @@ def delete_project_category(category_id):
 def admin_materials():
     """List all study materials"""
     page = request.args.get('page', 1, type=int)
-    materials = StudyMaterial.query.order_by(StudyMaterial.created_at.desc()).paginate(page=page, per_page=10)
+    materials = StudyMaterial.query.options(*material_listing_options()).order_by(StudyMaterial.created_at.desc()).paginate(page=page, per_page=10)
     return render_template('admin/study_material.html', title='Manage Study Materials', materials=materials)
 
 
@@ -432,7 +464,7 @@ def admin_material_form(material_id=None):
     
     # Populate category choices
     categories = StudyMaterialCategory.query.all()
-    form.category.choices = [(c.name, c.name) for c in categories]
+    form.category_id.choices = [(c.id, c.name) for c in categories]
     
     if form.validate_on_submit():
         if not material:
@@ -469,7 +501,11 @@ def admin_material_form(material_id=None):
             material.thumbnail = image_file
             
         material.is_active = form.is_active.data == 'True'
+        search_index.update(material)
         db.session.commit()
+        if not material_id:
+            dashboard_stats.invalidate('material_count')
+        page_cache.purge(PAGE_TAG_MATERIALS)
         flash('Study material saved successfully!', 'success')
         return redirect(url_for('admin_bp.admin_materials'))
         
@@ -482,8 +518,11 @@ def admin_material_form(material_id=None):
 def delete_material(material_id):
     """Delete study material"""
     material = StudyMaterial.query.get_or_404(material_id)
+    search_index.remove(material)
     db.session.delete(material)
     db.session.commit()
+    dashboard_stats.invalidate('material_count')
+    page_cache.purge(PAGE_TAG_MATERIALS)
     flash('Study material deleted successfully!', 'success')
     return redirect(url_for('admin_bp.admin_materials'))
 
@@ -517,6 +556,7 @@ def admin_material_category_form(category_id=None):
             
         form.populate_obj(category)
         db.session.commit()
+        page_cache.purge(PAGE_TAG_MATERIALS)
         flash('Category saved successfully!', 'success')
         return redirect(url_for('admin_bp.admin_material_categories'))
         
@@ -529,8 +569,11 @@ def admin_material_category_form(category_id=None):
 def delete_material_category(category_id):
     """Delete material category"""
     category = StudyMaterialCategory.query.get_or_404(category_id)
+    # Materials in the category become uncategorized, as they did with the old name column
+    StudyMaterial.query.filter_by(category_id=category.id).update({'category_id': None})
     db.session.delete(category)
     db.session.commit()
+    page_cache.purge(PAGE_TAG_MATERIALS)
     flash('Category deleted successfully!', 'success')
     return redirect(url_for('admin_bp.admin_material_categories'))
 
@@ -545,7 +588,7 @@ def delete_material_category(category_id):
 def admin_videos():
     """List all YouTube videos"""
     page = request.args.get('page', 1, type=int)
-    videos = YouTubeVideo.query.order_by(YouTubeVideo.created_at.desc()).paginate(page=page, per_page=10)
+    videos = YouTubeVideo.query.options(*video_listing_options()).order_by(YouTubeVideo.created_at.desc()).paginate(page=page, per_page=10)
     return render_template('admin/youtube_videos.html', title='Manage YouTube Videos', videos=videos)
 
 
@@ -560,7 +603,7 @@ def admin_video_form(video_id=None):
     
     # Populate category choices
     categories = YouTubeCategory.query.all()
-    form.category.choices = [(c.name, c.name) for c in categories]
+    form.category_id.choices = [(c.id, c.name) for c in categories]
     
     # Pre-populate URL if editing
     if request.method == 'GET' and video and video.video_id:
@@ -586,7 +629,11 @@ def admin_video_form(video_id=None):
              return render_template('admin/video_form.html', title='Edit YouTube Video' if video else 'New YouTube Video', form=form, video=video)
 
         video.is_active = form.is_active.data == 'True'
+        search_index.update(video)
         db.session.commit()
+        if not video_id:
+            dashboard_stats.invalidate('video_count')
+        page_cache.purge(PAGE_TAG_VIDEOS)
         flash('YouTube video saved successfully!', 'success')
         return redirect(url_for('admin_bp.admin_videos'))
         
@@ -599,8 +646,11 @@ def admin_video_form(video_id=None):
 def delete_video(video_id):
     """Delete YouTube video"""
     video = YouTubeVideo.query.get_or_404(video_id)
+    search_index.remove(video)
     db.session.delete(video)
     db.session.commit()
+    dashboard_stats.invalidate('video_count')
+    page_cache.purge(PAGE_TAG_VIDEOS)
     flash('YouTube video deleted successfully!', 'success')
     return redirect(url_for('admin_bp.admin_videos'))
 
@@ -628,16 +678,14 @@ def admin_youtube_category_form(category_id=None):
     form = YouTubeCategoryForm(obj=category)
     
     if form.validate_on_submit():
+        # Videos reference the category by id, so a rename only touches this row
         if not category:
             category = YouTubeCategory()
             db.session.add(category)
-        else:
-            # If editing and name changed, update all associated videos
-            if category.name != form.name.data:
-                YouTubeVideo.query.filter_by(category=category.name).update({'category': form.name.data})
             
         form.populate_obj(category)
         db.session.commit()
+        page_cache.purge(PAGE_TAG_VIDEOS)
         flash('Category saved successfully!', 'success')
         return redirect(url_for('admin_bp.admin_youtube_categories'))
         
@@ -650,11 +698,12 @@ def admin_youtube_category_form(category_id=None):
 def delete_youtube_category(category_id):
     """Delete YouTube category"""
     category = YouTubeCategory.query.get_or_404(category_id)
-    if YouTubeVideo.query.filter_by(category=category.name).first():
+    if YouTubeVideo.query.filter_by(category_id=category.id).first():
         flash(f'Cannot delete category "{category.name}" as it is assigned to videos.', 'error')
     else:
         db.session.delete(category)
         db.session.commit()
+        page_cache.purge(PAGE_TAG_VIDEOS)
         flash('Category deleted successfully!', 'success')
     return redirect(url_for('admin_bp.admin_youtube_categories'))
 
@@ -698,6 +747,7 @@ def delete_inquiry(inquiry_id):
     inquiry = Inquiry.query.get_or_404(inquiry_id)
     db.session.delete(inquiry)
     db.session.commit()
+    dashboard_stats.invalidate('inquiry_count')
     flash('Inquiry deleted successfully!', 'success')
     return redirect(url_for('admin_bp.admin_inquiries'))
 
@@ -748,6 +798,8 @@ def admin_home_page():
         content.hire_button_text = form.hire_button_text.data
         
         db.session.commit()
+        content_cache.bump(HOME_CONTENT_KEY)
+        page_cache.purge(PAGE_TAG_HOME)
         flash('Home page content updated successfully!', 'success')
         return redirect(url_for('admin_bp.admin_content_home_page'))
     
@@ -850,6 +902,8 @@ def admin_content_about_edit():
         content.cta_button_2_link = form.cta_button_2_link.data
         
         db.session.commit()
+        content_cache.bump(ABOUT_CONTENT_KEY)
+        page_cache.purge(PAGE_TAG_ABOUT)
         flash('About page content updated successfully!', 'success')
         return redirect(url_for('admin_bp.admin_content_home_about'))
         
@@ -906,6 +960,9 @@ def admin_skill_create():
         )
         db.session.add(skill)
         db.session.commit()
+        dashboard_stats.invalidate('skill_count')
+        content_cache.bump(HOME_SKILLS_KEY)
+        page_cache.purge(PAGE_TAG_HOME)
         flash('Skill added successfully!', 'success')
         return redirect(url_for('admin_bp.admin_skills'))
     
@@ -939,6 +996,8 @@ def admin_skill_edit(id):
         skill.is_active = form.is_active.data == 'True'
         
         db.session.commit()
+        content_cache.bump(HOME_SKILLS_KEY)
+        page_cache.purge(PAGE_TAG_HOME)
         flash('Skill updated successfully!', 'success')
         return redirect(url_for('admin_bp.admin_skills'))
     
@@ -957,6 +1016,9 @@ def admin_skill_delete(id):
     skill = Skill.query.get_or_404(id)
     db.session.delete(skill)
     db.session.commit()
+    dashboard_stats.invalidate('skill_count')
+    content_cache.bump(HOME_SKILLS_KEY)
+    page_cache.purge(PAGE_TAG_HOME)
     flash('Skill deleted successfully!', 'success')
     return redirect(url_for('admin_bp.admin_skills'))
 
@@ -1047,6 +1109,9 @@ def admin_team_member_create():
         )
         db.session.add(team_member)
         db.session.commit()
+        dashboard_stats.invalidate('team_count')
+        content_cache.bump(HOME_TEAM_KEY)
+        page_cache.purge(PAGE_TAG_HOME)
         flash('Team member added successfully!', 'success')
         return redirect(url_for('admin_bp.admin_team_members'))
     
@@ -1088,6 +1153,8 @@ def admin_team_member_edit(id):
         team_member.is_active = form.is_active.data == 'True'
         
         db.session.commit()
+        content_cache.bump(HOME_TEAM_KEY)
+        page_cache.purge(PAGE_TAG_HOME)
         flash('Team member updated successfully!', 'success')
         return redirect(url_for('admin_bp.admin_team_members'))
     
@@ -1106,6 +1173,9 @@ def admin_team_member_delete(id):
     team_member = TeamMember.query.get_or_404(id)
     db.session.delete(team_member)
     db.session.commit()
+    dashboard_stats.invalidate('team_count')
+    content_cache.bump(HOME_TEAM_KEY)
+    page_cache.purge(PAGE_TAG_HOME)
     flash('Team member deleted successfully!', 'success')
     return redirect(url_for('admin_bp.admin_team_members'))
 
@@ -1146,6 +1216,9 @@ def admin_team_create():
             
         db.session.add(member)
         db.session.commit()
+        dashboard_stats.invalidate('team_count')
+        content_cache.bump(HOME_TEAM_KEY)
+        page_cache.purge(PAGE_TAG_HOME)
         flash('Team member added successfully!', 'success')
         return redirect(url_for('admin_bp.admin_team'))
         
@@ -1174,6 +1247,8 @@ def admin_team_edit(id):
             member.image_url = image_file
             
         db.session.commit()
+        content_cache.bump(HOME_TEAM_KEY)
+        page_cache.purge(PAGE_TAG_HOME)
         flash('Team member updated successfully!', 'success')
         return redirect(url_for('admin_bp.admin_team'))
         
@@ -1188,6 +1263,9 @@ def admin_team_delete(id):
     member = TeamMember.query.get_or_404(id)
     db.session.delete(member)
     db.session.commit()
+    dashboard_stats.invalidate('team_count')
+    content_cache.bump(HOME_TEAM_KEY)
+    page_cache.purge(PAGE_TAG_HOME)
     flash('Team member deleted successfully!', 'success')
     return redirect(url_for('admin_bp.admin_team'))
 
@@ -1233,7 +1311,13 @@ def admin_blog_form(blog_id=None):
             blog.thumbnail = image_file
             
         blog.is_active = form.is_active.data == 'True'
+        # Listing cards read the stored excerpt instead of stripping the content per render
+        blog.update_excerpt()
+        search_index.update(blog)
         db.session.commit()
+        if not blog_id:
+            dashboard_stats.invalidate('blog_count')
+        page_cache.purge(PAGE_TAG_BLOG)
         flash('Blog post saved successfully!', 'success')
         return redirect(url_for('admin_bp.admin_blogs'))
         
@@ -1246,8 +1330,11 @@ def admin_blog_form(blog_id=None):
 def delete_blog(blog_id):
     """Delete blog post"""
     blog = BlogPost.query.get_or_404(blog_id)
+    search_index.remove(blog)
     db.session.delete(blog)
     db.session.commit()
+    dashboard_stats.invalidate('blog_count')
+    page_cache.purge(PAGE_TAG_BLOG)
     flash('Blog post deleted successfully!', 'success')
     return redirect(url_for('admin_bp.admin_blogs'))
 
@@ -1281,6 +1368,7 @@ def admin_blog_category_form(category_id=None):
             
         form.populate_obj(category)
         db.session.commit()
+        page_cache.purge(PAGE_TAG_BLOG)
         flash('Category saved successfully!', 'success')
         return redirect(url_for('admin_bp.admin_blog_categories'))
         
@@ -1295,5 +1383,6 @@ def delete_blog_category(category_id):
     category = BlogCategory.query.get_or_404(category_id)
     db.session.delete(category)
     db.session.commit()
+    page_cache.purge(PAGE_TAG_BLOG)
     flash('Category deleted successfully!', 'success')
     return redirect(url_for('admin_bp.admin_blog_categories'))
@@ -7,6 +7,13 @@ Manages all configuration settings loaded from environment variables:
 - Contact Details
 - Social Media Links
 - Email Settings
+- Caching
+- Compression
+- Templating
+- Static Export
+- Write-behind Counters & Event Logging
+- Full-text Search
+- Production Profile (PostgreSQL connection pool)
 """
 
 # =========================================
@@ -40,6 +47,24 @@ class Config:
     # =====================================
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///site.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Optional read replica for public GET traffic (same schema, replicated from the primary)
+    REPLICA_DATABASE_URL = os.environ.get('REPLICA_DATABASE_URL')
+    SQLALCHEMY_BINDS = {'replica': REPLICA_DATABASE_URL} if REPLICA_DATABASE_URL else {}
+    # Seconds the replica may trail the primary before reads fall back to the primary
+    REPLICA_MAX_LAG = float(os.environ.get('REPLICA_MAX_LAG') or 10)
+    # Seconds between replica lag probes in each worker (writes force an earlier probe)
+    REPLICA_LAG_CHECK_INTERVAL = float(os.environ.get('REPLICA_LAG_CHECK_INTERVAL') or 5)
+    # Pragmas applied to every SQLite connection (ignored on other databases).
+    # WAL lets readers run alongside the single writer; with WAL, NORMAL sync
+    # stays consistent but may lose the last commits on power loss.
+    SQLITE_JOURNAL_MODE = os.environ.get('SQLITE_JOURNAL_MODE', 'WAL')
+    SQLITE_SYNCHRONOUS = os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL')
+    # Milliseconds a connection waits for a lock before raising "database is locked"
+    SQLITE_BUSY_TIMEOUT = int(os.environ.get('SQLITE_BUSY_TIMEOUT') or 5000)
+    # Bytes of the database file memory-mapped for reads (256 MiB)
+    SQLITE_MMAP_SIZE = int(os.environ.get('SQLITE_MMAP_SIZE') or 268435456)
+    # Page cache per connection; negative values are KiB (20 MiB)
+    SQLITE_CACHE_SIZE = int(os.environ.get('SQLITE_CACHE_SIZE') or -20000)
     
     # =====================================
     # BRAND INFORMATION
@@ -84,4 +109,136 @@ class Config:
     MAIL_PORT = int(os.environ.get('MAIL_PORT') or 587)
     MAIL_USE_TLS = os.environ.get('MAIL_USE_TLS', 'true').lower() in ['true', 'on', '1']
     MAIL_USERNAME = os.environ.get('MAIL_USERNAME')
-    MAIL_PASSWORD = os.environ.get('MAIL_PASSWORD')
\ No newline at end of file
+    MAIL_PASSWORD = os.environ.get('MAIL_PASSWORD')
+
+    # =====================================
+    # CACHING
+    # =====================================
+    # Directory holding the cross-worker cache version stamps (defaults to instance/cache_versions)
+    CACHE_VERSION_DIR = os.environ.get('CACHE_VERSION_DIR')
+    PAGE_CACHE_ENABLED = os.environ.get('PAGE_CACHE_ENABLED', 'true').lower() in ['true', 'on', '1']
+    PAGE_CACHE_MAX_ENTRIES = int(os.environ.get('PAGE_CACHE_MAX_ENTRIES') or 500)
+    # Change per deploy to retire detail-page ETags issued for older templates
+    ETAG_SALT = os.environ.get('ETAG_SALT', '')
+    # Seconds a listing's approximate total (item / page counts) is reused before recounting
+    PAGINATION_TOTAL_TTL = int(os.environ.get('PAGINATION_TOTAL_TTL') or 300)
+    # Items per page on the public listings and the admin project listing
+    PROJECTS_PER_PAGE = int(os.environ.get('PROJECTS_PER_PAGE') or 6)
+    SERVICES_PER_PAGE = int(os.environ.get('SERVICES_PER_PAGE') or 6)
+    VIDEOS_PER_PAGE = int(os.environ.get('VIDEOS_PER_PAGE') or 9)
+    STUDY_MATERIALS_PER_PAGE = int(os.environ.get('STUDY_MATERIALS_PER_PAGE') or 12)
+    BLOG_PER_PAGE = int(os.environ.get('BLOG_PER_PAGE') or 9)
+    ADMIN_PROJECTS_PER_PAGE = int(os.environ.get('ADMIN_PROJECTS_PER_PAGE') or 10)
+    # Seconds the admin dashboard counts are reused when nothing invalidated them
+    ADMIN_STATS_TTL = int(os.environ.get('ADMIN_STATS_TTL') or 60)
+    # Seconds a signed-in user's identity (id, role, is_active) is reused before reloading
+    IDENTITY_CACHE_TTL = int(os.environ.get('IDENTITY_CACHE_TTL') or 60)
+    # Rewrite url_for('static', ...) to content-hashed, immutably cached URLs
+    ASSET_HASHING = os.environ.get('ASSET_HASHING', 'true').lower() in ['true', 'on', '1']
+
+    # =====================================
+    # COMPRESSION (Flask-Compress)
+    # =====================================
+    COMPRESS_ALGORITHM = ['br', 'gzip']
+    COMPRESS_MIMETYPES = [
+        'text/html', 'text/css', 'text/plain', 'text/xml', 'text/javascript',
+        'application/json', 'application/javascript', 'application/xml', 'image/svg+xml'
+    ]
+    COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE') or 500)
+    COMPRESS_LEVEL = 6
+    COMPRESS_BR_LEVEL = 5
+
+    # =====================================
+    # TEMPLATING
+    # =====================================
+    # Bytecode cache shared by all workers (defaults to instance/jinja_cache)
+    JINJA_BYTECODE_CACHE_DIR = os.environ.get('JINJA_BYTECODE_CACHE_DIR')
+    # Compile every template in create_app, before the worker accepts traffic
+    TEMPLATE_WARMUP = os.environ.get('TEMPLATE_WARMUP', 'false').lower() in ['true', 'on', '1']
+
+    # =====================================
+    # STATIC EXPORT (flask freeze)
+    # =====================================
+    FREEZE_DESTINATION = os.environ.get('FREEZE_DESTINATION', 'build')
+    # Absolute site URL written into sitemap.xml, e.g. https://example.com;
+    # sitemap.xml is skipped when it is not set
+    FREEZE_BASE_URL = os.environ.get('FREEZE_BASE_URL', '')
+
+    # =====================================
+    # WRITE-BEHIND COUNTERS
+    # =====================================
+    # Seconds between background flushes of buffered download_count increments
+    DOWNLOAD_COUNT_FLUSH_INTERVAL = float(os.environ.get('DOWNLOAD_COUNT_FLUSH_INTERVAL') or 10)
+
+    # =====================================
+    # EVENT LOGGING (download events)
+    # =====================================
+    EVENT_LOG_QUEUE_SIZE = int(os.environ.get('EVENT_LOG_QUEUE_SIZE') or 1000)
+    EVENT_LOG_BATCH_SIZE = int(os.environ.get('EVENT_LOG_BATCH_SIZE') or 200)
+    EVENT_LOG_FLUSH_INTERVAL = float(os.environ.get('EVENT_LOG_FLUSH_INTERVAL') or 2)
+    # Seconds a request waits for room in a full queue before dropping the event
+    EVENT_LOG_PUT_TIMEOUT = float(os.environ.get('EVENT_LOG_PUT_TIMEOUT') or 0.05)
+    # Insert attempts per row before a failing batch is dropped
+    EVENT_LOG_MAX_ATTEMPTS = int(os.environ.get('EVENT_LOG_MAX_ATTEMPTS') or 5)
+
+    # =====================================
+    # FULL-TEXT SEARCH
+    # =====================================
+    SEARCH_PER_PAGE = int(os.environ.get('SEARCH_PER_PAGE') or 10)
+    # Deepest result page served; ranked results are paged with OFFSET
+    SEARCH_MAX_PAGE = int(os.environ.get('SEARCH_MAX_PAGE') or 50)
+
+
+# =========================================
+# PRODUCTION PROFILE
+# =========================================
+
+class ProductionConfig(Config):
+    """Production settings: PostgreSQL pool sized for the gunicorn deployment"""
+
+    # =====================================
+    # GUNICORN DEPLOYMENT
+    # =====================================
+    # Must match the gunicorn -w / --threads flags the app is served with
+    GUNICORN_WORKERS = int(os.environ.get('WEB_CONCURRENCY') or 4)
+    GUNICORN_THREADS = int(os.environ.get('GUNICORN_THREADS') or 4)
+
+    # =====================================
+    # DATABASE CONNECTION POOL (per worker)
+    # =====================================
+    # One connection per request thread, plus the download counter flusher
+    # and the event log writer
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE') or GUNICORN_THREADS + 2)
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW') or 2)
+    # Seconds a request waits for a free connection before failing
+    DB_POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT') or 10)
+    # Seconds before a connection is replaced, below typical proxy/firewall idle limits
+    DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE') or 1800)
+    DB_CONNECT_TIMEOUT = int(os.environ.get('DB_CONNECT_TIMEOUT') or 5)
+    # Server-side limits, in milliseconds
+    DB_STATEMENT_TIMEOUT = int(os.environ.get('DB_STATEMENT_TIMEOUT') or 5000)
+    DB_IDLE_IN_TRANSACTION_TIMEOUT = int(os.environ.get('DB_IDLE_IN_TRANSACTION_TIMEOUT') or 15000)
+    # Connections this app may hold across all workers (server max_connections minus headroom)
+    DB_MAX_CONNECTIONS = int(os.environ.get('DB_MAX_CONNECTIONS') or 90)
+
+
+# =========================================
+# PROFILE SELECTION
+# =========================================
+CONFIG_PROFILES = {
+    'development': Config,
+    'production': ProductionConfig,
+}
+
+
+def get_config():
+    """
+    Return the config class named by the APP_CONFIG environment variable.
+
+    Returns:
+        type: Config subclass (Config when APP_CONFIG is unset)
+    """
+    name = os.environ.get('APP_CONFIG', 'development').lower()
+    if name not in CONFIG_PROFILES:
+        raise ValueError(f"Unknown APP_CONFIG profile: {name}")
+    return CONFIG_PROFILES[name]
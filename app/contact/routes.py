@@ -19,6 +19,7 @@ from app.extensions import db, limiter, mail
 from app.contact import contact
 from app.contact.forms import ContactForm
 from app.models.inquiry import Inquiry
+from app.utils.stats import dashboard_stats
 
 
 # =========================================
@@ -41,6 +42,7 @@ def contact_form():
         )
         db.session.add(inquiry)
         db.session.commit()
+        dashboard_stats.invalidate('inquiry_count')
         
         # Send email notification
         try:
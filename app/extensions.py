@@ -7,6 +7,9 @@ Initializes all Flask extensions used throughout the application:
 - Admin Panel (Flask-Admin)
 - Security (CSRF Protection, Rate Limiting)
 - Email (Flask-Mail)
+- Response Compression (Flask-Compress)
+- SQLite Connection Tuning (WAL, busy timeout, pragmas)
+- Read-replica Routing Session
 """
 
 # =========================================
@@ -21,7 +24,13 @@ from flask_wtf.csrf import CSRFProtect
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_mail import Mail
-from sqlalchemy import MetaData
+from flask_compress import Compress
+from sqlalchemy import MetaData, event
+
+# =========================================
+# LOCAL APPLICATION IMPORTS
+# =========================================
+from app.utils.db_routing import RoutingSession
 
 
 # =========================================
@@ -36,14 +45,83 @@ naming_convention = {
     "pk": "pk_%(table_name)s"
 }
 
+# Accepted values for the pragmas that take keywords rather than numbers
+SQLITE_JOURNAL_MODES = {'DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'}
+SQLITE_SYNCHRONOUS_LEVELS = {'OFF', 'NORMAL', 'FULL', 'EXTRA'}
+
 # =========================================
 # EXTENSION INSTANCES
 # =========================================
-db = SQLAlchemy(metadata=MetaData(naming_convention=naming_convention))
+# Reads from public GET requests may go to the read replica (see app/utils/db_routing.py)
+db = SQLAlchemy(metadata=MetaData(naming_convention=naming_convention), session_options={'class_': RoutingSession})
 bcrypt = Bcrypt()
 login_manager = LoginManager()
 migrate = Migrate()
 admin = Admin()
 csrf = CSRFProtect()
 limiter = Limiter(key_func=get_remote_address)
-mail = Mail()
\ No newline at end of file
+mail = Mail()
+compress = Compress()
+
+
+# =========================================
+# SQLITE CONNECTION TUNING
+# =========================================
+
+def sqlite_pragmas(config):
+    """
+    Build the PRAGMA statements run on every new SQLite connection.
+
+    Args:
+        config: Application config holding the SQLITE_* settings
+
+    Returns:
+        list: PRAGMA statements, in the order they must run
+    """
+    journal_mode = config.get('SQLITE_JOURNAL_MODE', 'WAL').upper()
+    synchronous = config.get('SQLITE_SYNCHRONOUS', 'NORMAL').upper()
+    if journal_mode not in SQLITE_JOURNAL_MODES:
+        raise ValueError(f"Unsupported SQLITE_JOURNAL_MODE: {journal_mode}")
+    if synchronous not in SQLITE_SYNCHRONOUS_LEVELS:
+        raise ValueError(f"Unsupported SQLITE_SYNCHRONOUS: {synchronous}")
+
+    return [
+        # busy_timeout first, so switching the journal mode can wait for other writers
+        f"PRAGMA busy_timeout = {int(config.get('SQLITE_BUSY_TIMEOUT', 5000))}",
+        f"PRAGMA journal_mode = {journal_mode}",
+        f"PRAGMA synchronous = {synchronous}",
+        f"PRAGMA mmap_size = {int(config.get('SQLITE_MMAP_SIZE', 0))}",
+        f"PRAGMA cache_size = {int(config.get('SQLITE_CACHE_SIZE', -2000))}",
+    ]
+
+
+def init_sqlite_pragmas(app, engine=None):
+    """
+    Apply the SQLITE_* pragmas to each connection the engine opens.
+
+    Does nothing for other database backends.
+
+    Args:
+        app: Flask application whose config holds the pragma settings
+        engine: Engine to tune; defaults to every engine of the app
+            (the primary and any SQLALCHEMY_BINDS, such as a read replica)
+    """
+    if engine is None:
+        with app.app_context():
+            engines = list(db.engines.values())
+        for bound_engine in engines:
+            init_sqlite_pragmas(app, bound_engine)
+        return
+    if engine.dialect.name != 'sqlite':
+        return
+
+    pragmas = sqlite_pragmas(app.config)
+
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
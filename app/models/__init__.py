@@ -1,7 +1,7 @@
 # Models package initialization
 
 from .user import User
-from .base import BaseModel
+from .base import BaseModel, ListingModel
 from .download import Download
 from .service import Service
 from .project import Project
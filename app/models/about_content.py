@@ -8,6 +8,7 @@ Manages editable about page content
 # =========================================
 from app.extensions import db
 from app.models.base import BaseModel
+from app.utils.cache import content_cache, detach, ABOUT_CONTENT_KEY
 
 
 # =========================================
@@ -98,3 +99,8 @@ class AboutContent(BaseModel):
             db.session.add(content)
             db.session.commit()
         return content
+    
+    @staticmethod
+    def get_cached_content():
+        """Get the about page content from the per-worker content cache"""
+        return content_cache.get(ABOUT_CONTENT_KEY, lambda: detach(AboutContent.get_content()))
@@ -36,4 +36,17 @@ class BaseModel(db.Model):
     def delete(self):
         """Delete the current instance from the database"""
         db.session.delete(self)
-        db.session.commit()
\ No newline at end of file
+        db.session.commit()
+
+
+class ListingModel(BaseModel):
+    """
+    Base for the public listings, which are keyset-paginated on (created_at, id).
+
+    created_at is NOT NULL here: a NULL would sort outside the keyset filter
+    and could not be encoded into a cursor.
+    """
+
+    __abstract__ = True
+
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
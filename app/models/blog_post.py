@@ -1,6 +1,6 @@
 """
 Blog Post Model Module
-Manages blog posts and articles
+Manages blog posts and articles, with a stored plain-text excerpt for listings
 """
 
 # =========================================
@@ -8,10 +8,16 @@ Manages blog posts and articles
 # =========================================
 from datetime import datetime
 
+# =========================================
+# THIRD-PARTY IMPORTS
+# =========================================
+from markupsafe import Markup
+
 # =========================================
 # LOCAL APPLICATION IMPORTS
 # =========================================
 from app.extensions import db
+from app.utils.constants import BLOG_EXCERPT_LENGTH
 
 
 # =========================================
@@ -27,12 +33,41 @@ class BlogPost(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     content = db.Column(db.Text, nullable=False)
+    excerpt = db.Column(db.String(200), nullable=True)  # Plain-text preview, set by update_excerpt()
     thumbnail = db.Column(db.String(200), nullable=True)
     category = db.Column(db.String(50), nullable=True)
     read_time = db.Column(db.String(20), default='5 min read')
     is_active = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)  # Keyset pagination sort key
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Indexes
+    __table_args__ = (
+        db.Index('ix_blog_posts_active_created_at', 'is_active', 'created_at', postgresql_where=is_active),
+    )
+
+    # Methods
+    @staticmethod
+    def build_excerpt(content, length=BLOG_EXCERPT_LENGTH):
+        """
+        Plain-text preview of HTML content, as `striptags | truncate(length)` renders it.
+
+        Args:
+            content: Post body (HTML)
+            length: Maximum length before the text is cut at a word boundary
+
+        Returns:
+            str: Excerpt ending in '...' when truncated
+        """
+        text = Markup(content or '').striptags()
+        # Same leeway and ellipsis as Jinja's truncate filter
+        if len(text) <= length + 5:
+            return text
+        return text[:length - 3].rsplit(' ', 1)[0] + '...'
+
+    def update_excerpt(self):
+        """Recompute the stored excerpt from the current content"""
+        self.excerpt = self.build_excerpt(self.content)
+
     def __repr__(self):
         return f'<BlogPost {self.title}>'
@@ -8,6 +8,7 @@ Manages editable home page content and settings
 # =========================================
 from app.extensions import db
 from app.models.base import BaseModel
+from app.utils.cache import content_cache, detach, HOME_CONTENT_KEY
 
 
 # =========================================
@@ -65,3 +66,8 @@ class HomeContent(BaseModel):
             db.session.add(content)
             db.session.commit()
         return content
+    
+    @staticmethod
+    def get_cached_content():
+        """Get the home page content from the per-worker content cache"""
+        return content_cache.get(HOME_CONTENT_KEY, lambda: detach(HomeContent.get_content()))
@@ -12,6 +12,7 @@ from datetime import datetime
 # LOCAL APPLICATION IMPORTS
 # =========================================
 from app import db
+from app.utils.cache import content_cache, detach, HOME_SKILLS_KEY, HOME_TEAM_KEY
 
 
 # =========================================
@@ -73,8 +74,20 @@ class Skill(db.Model):
     is_active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
+    # Indexes
+    __table_args__ = (
+        db.Index('ix_skills_active_order', 'is_active', 'order', 'id', postgresql_where=is_active),
+    )
+    
     def __repr__(self):
         return f'<Skill {self.name}>'
+    
+    @staticmethod
+    def get_active_cached():
+        """Get active skills in display order from the per-worker content cache"""
+        return content_cache.get(HOME_SKILLS_KEY, lambda: detach(
+            Skill.query.filter_by(is_active=True).order_by(Skill.order, Skill.id).all()
+        ))
 
 
 # =========================================
@@ -101,5 +114,17 @@ class TeamMember(db.Model):
     is_active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
+    # Indexes
+    __table_args__ = (
+        db.Index('ix_team_members_active_order', 'is_active', 'order', 'id', postgresql_where=is_active),
+    )
+    
     def __repr__(self):
         return f'<TeamMember {self.name}>'
+    
+    @staticmethod
+    def get_active_cached():
+        """Get active team members in display order from the per-worker content cache"""
+        return content_cache.get(HOME_TEAM_KEY, lambda: detach(
+            TeamMember.query.filter_by(is_active=True).order_by(TeamMember.order, TeamMember.id).all()
+        ))
@@ -7,7 +7,7 @@ Manages downloadable projects and demos
 # LOCAL APPLICATION IMPORTS
 # =========================================
 from app.extensions import db
-from app.models.base import BaseModel
+from app.models.base import ListingModel
 from app.utils.constants import PROJECT_FREE, PROJECT_DEMO
 
 
@@ -15,7 +15,7 @@ from app.utils.constants import PROJECT_FREE, PROJECT_DEMO
 # PROJECT MODEL
 # =========================================
 
-class Project(BaseModel):
+class Project(ListingModel):
     """Model for projects"""
     
     __tablename__ = 'projects'
@@ -38,5 +38,10 @@ class Project(BaseModel):
         """Legacy property for backward compatibility"""
         return self.project_category.name if self.project_category else None
     
+    # Indexes
+    __table_args__ = (
+        db.Index('ix_projects_active_created_at', 'is_active', 'created_at', postgresql_where=is_active),
+    )
+    
     def __repr__(self):
         return f"Project('{self.title}', '{self.project_type}')"
\ No newline at end of file
@@ -7,14 +7,14 @@ Manages freelancing services offered on the platform
 # LOCAL APPLICATION IMPORTS
 # =========================================
 from app.extensions import db
-from app.models.base import BaseModel
+from app.models.base import ListingModel
 
 
 # =========================================
 # SERVICE MODEL
 # =========================================
 
-class Service(BaseModel):
+class Service(ListingModel):
     """Model for freelancing services"""
     
     __tablename__ = 'services'
@@ -28,6 +28,11 @@ class Service(BaseModel):
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
     is_active = db.Column(db.Boolean, default=True)
     
+    # Indexes
+    __table_args__ = (
+        db.Index('ix_services_active_created_at', 'is_active', 'created_at', postgresql_where=is_active),
+    )
+    
     # Relationships
     user = db.relationship('User', backref='services', lazy=True)
     category = db.relationship('ServiceCategory', viewonly=True)
@@ -7,7 +7,7 @@ Manages educational resources and downloadable materials
 # LOCAL APPLICATION IMPORTS
 # =========================================
 from app.extensions import db
-from app.models.base import BaseModel
+from app.models.base import ListingModel
 from app.utils.constants import MATERIAL_FREE, MATERIAL_PAID
 
 
@@ -15,7 +15,7 @@ from app.utils.constants import MATERIAL_FREE, MATERIAL_PAID
 # STUDY MATERIAL MODEL
 # =========================================
 
-class StudyMaterial(BaseModel):
+class StudyMaterial(ListingModel):
     """Model for study materials (PDFs, documents, etc.)"""
     
     __tablename__ = 'study_materials'
@@ -23,7 +23,7 @@ class StudyMaterial(BaseModel):
     # Columns
     title = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text, nullable=False)
-    category = db.Column(db.String(50), nullable=True)
+    category_id = db.Column(db.Integer, db.ForeignKey('study_material_categories.id'), nullable=True)
     price = db.Column(db.Float, nullable=True)  # None for free materials
     file_path = db.Column(db.String(200), nullable=True)  # Path to the PDF file (optional if doc_url is provided)
     doc_url = db.Column(db.String(500), nullable=True)  # External document URL (Google Docs, etc.)
@@ -32,5 +32,18 @@ class StudyMaterial(BaseModel):
     is_active = db.Column(db.Boolean, default=True)
     download_count = db.Column(db.Integer, default=0)
     
+    # Indexes
+    __table_args__ = (
+        db.Index('ix_study_materials_active_created_at', 'is_active', 'created_at', postgresql_where=is_active),
+        # Category-filtered listings; also serves plain category_id lookups
+        db.Index('ix_study_materials_category_active_created_at', 'category_id', 'is_active', 'created_at'),
+    )
+    
+    # Properties
+    @property
+    def category(self):
+        """Legacy property for backward compatibility"""
+        return self.material_category.name if self.material_category else None
+    
     def __repr__(self):
         return f"StudyMaterial('{self.title}', '{self.material_type}')"
\ No newline at end of file
@@ -23,5 +23,8 @@ class StudyMaterialCategory(BaseModel):
     name = db.Column(db.String(50), nullable=False, unique=True)
     description = db.Column(db.String(200), nullable=True)
     
+    # Relationships
+    materials = db.relationship('StudyMaterial', backref='material_category', lazy=True)
+    
     def __repr__(self):
         return f"StudyMaterialCategory('{self.name}')"
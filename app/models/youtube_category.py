@@ -23,5 +23,8 @@ class YouTubeCategory(BaseModel):
     name = db.Column(db.String(50), nullable=False, unique=True)
     description = db.Column(db.String(200))
     
+    # Relationships
+    videos = db.relationship('YouTubeVideo', backref='video_category', lazy=True)
+    
     def __repr__(self):
         return f"YouTubeCategory('{self.name}')"
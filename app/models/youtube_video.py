@@ -7,14 +7,14 @@ Manages YouTube video entries and educational content
 # LOCAL APPLICATION IMPORTS
 # =========================================
 from app.extensions import db
-from app.models.base import BaseModel
+from app.models.base import ListingModel
 
 
 # =========================================
 # YOUTUBE VIDEO MODEL
 # =========================================
 
-class YouTubeVideo(BaseModel):
+class YouTubeVideo(ListingModel):
     """Model for YouTube video entries"""
     
     __tablename__ = 'youtube_videos'
@@ -23,8 +23,19 @@ class YouTubeVideo(BaseModel):
     title = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text, nullable=True)
     video_id = db.Column(db.String(50), nullable=False)
-    category = db.Column(db.String(50), nullable=True)
+    category_id = db.Column(db.Integer, db.ForeignKey('youtube_categories.id'), nullable=True, index=True)
     is_active = db.Column(db.Boolean, default=True)
     
+    # Indexes
+    __table_args__ = (
+        db.Index('ix_youtube_videos_active_created_at', 'is_active', 'created_at', postgresql_where=is_active),
+    )
+    
+    # Properties
+    @property
+    def category(self):
+        """Legacy property for backward compatibility"""
+        return self.video_category.name if self.video_category else None
+    
     def __repr__(self):
         return f"YouTubeVideo('{self.title}', '{self.video_id}')"
\ No newline at end of file
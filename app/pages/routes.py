@@ -3,14 +3,14 @@ Pages Routes Module
 Handles public-facing page routes:
 - Home Page
 - About Page
-- Blog Listing & Details
+- Blog Listing (paginated, excerpts only) & Details
 - Policy Pages (Privacy, Terms, Cookies)
 """
 
 # =========================================
 # THIRD-PARTY IMPORTS
 # =========================================
-from flask import render_template, abort
+from flask import current_app, render_template, abort, request
 
 # =========================================
 # LOCAL APPLICATION IMPORTS
@@ -20,6 +20,10 @@ from app.models.home_content import HomeContent
 from app.models.about_content import AboutContent
 from app.models.home_page import Skill, TeamMember
 from app.models.blog_post import BlogPost
+from app.utils.decorators import cache_page, conditional_get, prerendered
+from app.utils.cache import PAGE_TAG_ABOUT, PAGE_TAG_BLOG, PAGE_TAG_HOME
+from app.utils.pagination import keyset_paginate
+from app.utils.query_options import blog_listing_options
 
 
 # =========================================
@@ -27,11 +31,12 @@ from app.models.blog_post import BlogPost
 # =========================================
 
 @pages.route("/")
+@cache_page(timeout=300, tags=(PAGE_TAG_HOME,))
 def home():
     """Render home page with dynamic content, skills, and team members"""
-    content = HomeContent.get_content()
-    skills = Skill.query.filter_by(is_active=True).order_by(Skill.order, Skill.id).all()
-    team_members = TeamMember.query.filter_by(is_active=True).order_by(TeamMember.order, TeamMember.id).all()
+    content = HomeContent.get_cached_content()
+    skills = Skill.get_active_cached()
+    team_members = TeamMember.get_active_cached()
     return render_template('pages/home.html', title='Home', content=content, skills=skills, team_members=team_members)
 
 
@@ -40,9 +45,10 @@ def home():
 # =========================================
 
 @pages.route("/about")
+@cache_page(timeout=600, tags=(PAGE_TAG_ABOUT,))
 def about():
     """Render about page with dynamic content"""
-    content = AboutContent.get_content()
+    content = AboutContent.get_cached_content()
     return render_template('pages/about.html', title='About', content=content)
 
 
@@ -61,13 +67,20 @@ def contact():
 # =========================================
 
 @pages.route("/blog")
+@cache_page(timeout=300, tags=(PAGE_TAG_BLOG,))
 def blog():
-    """Render blog listing page with all active posts"""
-    posts = BlogPost.query.filter_by(is_active=True).order_by(BlogPost.created_at.desc()).all()
+    """Render paginated blog listing page with active posts"""
+    cursor = request.args.get('cursor')
+    
+    # Listing cards use the stored excerpt; the full content is never loaded here
+    query = BlogPost.query.options(*blog_listing_options()).filter_by(is_active=True)
+    posts = keyset_paginate(query, BlogPost, per_page=current_app.config['BLOG_PER_PAGE'], cursor=cursor, total_key='blog')
     return render_template('pages/blog.html', title='Blog', posts=posts)
 
 
 @pages.route("/blog/<int:blog_id>")
+@conditional_get(BlogPost, 'blog_id', tags=(PAGE_TAG_BLOG,))
+@cache_page(timeout=600, tags=(PAGE_TAG_BLOG,))
 def blog_detail(blog_id):
     """Render individual blog post detail page"""
     post = BlogPost.query.get_or_404(blog_id)
@@ -81,18 +94,21 @@ def blog_detail(blog_id):
 # =========================================
 
 @pages.route("/privacy")
+@prerendered
 def privacy():
     """Render privacy policy page"""
     return render_template('pages/privacy.html', title='Privacy Policy')
 
 
 @pages.route("/terms")
+@prerendered
 def terms():
     """Render terms of service page"""
     return render_template('pages/terms.html', title='Terms of Service')
 
 
 @pages.route("/cookies")
+@prerendered
 def cookies():
     """Render cookie policy page"""
     return render_template('pages/cookies.html', title='Cookie Policy')
\ No newline at end of file
@@ -15,18 +15,22 @@ import os
 # =========================================
 # THIRD-PARTY IMPORTS
 # =========================================
-from flask import render_template, request, send_file, redirect, url_for, flash
+from flask import current_app, render_template, request, send_file, redirect, url_for, flash
 from flask_login import current_user
 
 # =========================================
 # LOCAL APPLICATION IMPORTS
 # =========================================
-from app.extensions import db
 from app.projects import projects
 from app.models.project import Project
 from app.models.project_category import ProjectCategory
-from app.models.download import Download
 from app.utils.constants import ITEM_TYPE_PROJECT
+from app.utils.decorators import cache_page, conditional_get
+from app.utils.cache import PAGE_TAG_PROJECTS
+from app.utils.query_options import project_listing_options
+from app.utils.pagination import keyset_paginate
+from app.utils.counters import download_counter
+from app.utils.event_log import download_log
 
 
 # =========================================
@@ -34,20 +38,21 @@ from app.utils.constants import ITEM_TYPE_PROJECT
 # =========================================
 
 @projects.route("/projects")
+@cache_page(timeout=300, tags=(PAGE_TAG_PROJECTS,))
 def projects_list():
     """Display paginated list of projects with category filtering"""
-    page = request.args.get('page', 1, type=int)
+    cursor = request.args.get('cursor')
     category_name = request.args.get('category', 'All')
     
     # Base query for active projects
-    projects_query = Project.query.filter_by(is_active=True)
+    projects_query = Project.query.options(*project_listing_options()).filter_by(is_active=True)
     
     # Filter by category if specified
     if category_name != 'All':
         projects_query = projects_query.join(Project.project_category).filter(ProjectCategory.name == category_name)
     
-    projects_query = projects_query.order_by(Project.created_at.desc())
-    projects_paginated = projects_query.paginate(page=page, per_page=6)
+    projects_paginated = keyset_paginate(projects_query, Project, per_page=current_app.config['PROJECTS_PER_PAGE'], cursor=cursor,
+                                         total_key=f"projects:{category_name}")
     
     # Get all active categories for the filters
     categories_obj = ProjectCategory.query.all()
@@ -65,6 +70,8 @@ def projects_list():
 # =========================================
 
 @projects.route("/project/<int:project_id>")
+@conditional_get(Project, 'project_id', tags=(PAGE_TAG_PROJECTS,))
+@cache_page(timeout=600, tags=(PAGE_TAG_PROJECTS,))
 def project_detail(project_id):
     """Display individual project details"""
     project = Project.query.get_or_404(project_id)
@@ -86,19 +93,17 @@ def download_project(project_id):
         flash('This project is not available for download.', 'warning')
         return redirect(url_for('projects.projects_list'))
     
-    # Record download only if user is logged in
+    # Record download only if user is logged in (inserted in batches by a background worker)
     if current_user.is_authenticated:
-        download = Download(
+        download_log.record(
             user_id=current_user.id,
             item_type=ITEM_TYPE_PROJECT,
             item_id=project.id,
             filename=project.title
         )
-        db.session.add(download)
     
-    # Increment download count
-    project.download_count += 1
-    db.session.commit()
+    # Buffered and flushed in the background as download_count = download_count + n
+    download_counter.increment(Project, project.id)
     
     # Priority: GitHub > Google Drive > Uploaded File
     if project.github_link:
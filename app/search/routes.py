@@ -0,0 +1,76 @@
+"""
+Search Routes Module
+Handles site-wide full-text search:
+- Ranked, Paginated Search Page
+- JSON Search API
+- Filtering by Content Type
+- Rate Limiting
+"""
+
+# =========================================
+# THIRD-PARTY IMPORTS
+# =========================================
+from flask import render_template, request, jsonify, current_app
+
+# =========================================
+# LOCAL APPLICATION IMPORTS
+# =========================================
+from app.extensions import limiter
+from app.search import search
+from app.utils.search import SEARCH_TYPES, search_index
+
+
+# =========================================
+# REQUEST HELPERS
+# =========================================
+
+def _search_args():
+    """
+    Read and bound the search query arguments.
+
+    Returns:
+        tuple: (query text, item type or None, page number)
+    """
+    terms = (request.args.get('q') or '').strip()[:200]
+    item_type = request.args.get('type')
+    if item_type not in SEARCH_TYPES:
+        item_type = None
+    page = request.args.get('page', 1, type=int)
+    page = min(max(page, 1), current_app.config.get('SEARCH_MAX_PAGE', 50))
+    return terms, item_type, page
+
+
+# =========================================
+# SEARCH ROUTES
+# =========================================
+
+@search.route("/search")
+@limiter.limit("60 per minute")
+def search_page():
+    """Display ranked search results across all content types"""
+    terms, item_type, page = _search_args()
+    results = search_index.search(terms, item_type=item_type, page=page) if terms else None
+    
+    return render_template('search/search.html',
+                         title=f'Search: {terms}' if terms else 'Search',
+                         query=terms,
+                         current_type=item_type,
+                         search_types=SEARCH_TYPES,
+                         results=results)
+
+
+@search.route("/api/search")
+@limiter.limit("60 per minute")
+def search_api():
+    """Return ranked search results as JSON"""
+    terms, item_type, page = _search_args()
+    results = search_index.search(terms, item_type=item_type, page=page)
+    
+    return jsonify({
+        'query': terms,
+        'type': item_type,
+        'page': results.page,
+        'pages': results.pages,
+        'total': results.total,
+        'results': [hit.to_dict() for hit in results.items],
+    })
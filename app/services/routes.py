@@ -7,10 +7,17 @@ Handles service listing, details, and data API:
 - JSON API for Client-side Filtering
 """
 
+# =========================================
+# STANDARD LIBRARY IMPORTS
+# =========================================
+import hashlib
+import json
+
 # =========================================
 # THIRD-PARTY IMPORTS
 # =========================================
-from flask import render_template, request
+from flask import current_app, render_template, request
+from sqlalchemy import select, union_all
 
 # =========================================
 # LOCAL APPLICATION IMPORTS
@@ -19,6 +26,9 @@ from app.extensions import db
 from app.services import services
 from app.models.service import Service
 from app.models.service_category import ServiceCategory
+from app.utils.decorators import cache_page, conditional_get, etag_matches
+from app.utils.cache import content_cache, PAGE_TAG_SERVICES, SERVICES_DATA_KEY
+from app.utils.pagination import keyset_paginate
 
 
 # =========================================
@@ -26,9 +36,10 @@ from app.models.service_category import ServiceCategory
 # =========================================
 
 @services.route("/services")
+@cache_page(timeout=300, tags=(PAGE_TAG_SERVICES,))
 def services_list():
     """Display paginated list of services with category filtering"""
-    page = request.args.get('page', 1, type=int)
+    cursor = request.args.get('cursor')
     category_name = request.args.get('category', 'All')
     
     # Base query for active services
@@ -38,8 +49,8 @@ def services_list():
     if category_name != 'All':
         services_query = services_query.join(Service.category).filter(ServiceCategory.name == category_name)
     
-    services_query = services_query.order_by(Service.created_at.desc())
-    services_paginated = services_query.paginate(page=page, per_page=6)
+    services_paginated = keyset_paginate(services_query, Service, per_page=current_app.config['SERVICES_PER_PAGE'], cursor=cursor,
+                                         total_key=f"services:{category_name}")
     
     # Get all active categories for the filters
     categories_obj = ServiceCategory.query.all()
@@ -59,28 +70,65 @@ def services_list():
 @services.route("/services-data")
 def services_data():
     """API endpoint to return services data in JSON format for client-side filtering"""
-    services_query = Service.query.filter_by(is_active=True).all()
+    body, etag = content_cache.get(SERVICES_DATA_KEY, build_services_data)
+    if etag_matches(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def build_services_data():
+    """
+    Build the /services-data payload from a single query.
+    
+    Categories are left-joined to the active services, and the services
+    without a (known) category are appended with UNION ALL, so one result set
+    yields every service and every category (with or without services).
+    This avoids FULL OUTER JOIN, which SQLite only supports from 3.39.
+    
+    Returns:
+        tuple: (JSON-encoded bytes, strong ETag)
+    """
+    active = select(
+        Service.id, Service.title, Service.description, Service.price,
+        Service.image_url, Service.category_id, Service.created_at
+    ).where(Service.is_active == True).subquery()
+    
+    categorized = select(active, ServiceCategory.id.label('cat_id'), ServiceCategory.name.label('cat_name')) \
+        .select_from(ServiceCategory) \
+        .outerjoin(active, active.c.category_id == ServiceCategory.id)
+    uncategorized = select(active, ServiceCategory.id.label('cat_id'), ServiceCategory.name.label('cat_name')) \
+        .select_from(active) \
+        .outerjoin(ServiceCategory, active.c.category_id == ServiceCategory.id) \
+        .where(ServiceCategory.id.is_(None))
+    combined = union_all(categorized, uncategorized).subquery()
+    
+    rows = db.session.execute(select(combined).order_by(combined.c.id, combined.c.cat_id)).all()
     
     services_list = []
-    for service in services_query:
+    categories = {}
+    for row in rows:
+        if row.cat_id is not None:
+            categories[row.cat_id] = row.cat_name
+        if row.id is None:
+            continue
         services_list.append({
-            'id': service.id,
-            'title': service.title,
-            'description': service.description,
-            'price': service.price,
-            'image_url': service.image_url,
-            'category': service.category.name if service.category else 'General',
-            'category_id': service.category.id if service.category else None,
-            'created_at': service.created_at.isoformat() if service.created_at else None
+            'id': row.id,
+            'title': row.title,
+            'description': row.description,
+            'price': row.price,
+            'image_url': row.image_url,
+            'category': row.cat_name or 'General',
+            'category_id': row.cat_id,
+            'created_at': row.created_at.isoformat() if row.created_at else None
         })
     
-    categories = ServiceCategory.query.all()
-    categories_list = [{'id': cat.id, 'name': cat.name} for cat in categories]
-    
-    return {
-        'services': services_list,
-        'categories': categories_list
-    }
+    categories_list = [{'id': cat_id, 'name': name} for cat_id, name in sorted(categories.items())]
+    body = json.dumps({'services': services_list, 'categories': categories_list}, separators=(',', ':')).encode('utf-8')
+    return body, hashlib.sha256(body).hexdigest()
 
 
 # =========================================
@@ -88,6 +136,8 @@ def services_data():
 # =========================================
 
 @services.route("/services/service/<int:service_id>")
+@conditional_get(Service, 'service_id', tags=(PAGE_TAG_SERVICES,))
+@cache_page(timeout=600, tags=(PAGE_TAG_SERVICES,))
 def service_detail(service_id):
     """Display individual service details"""
     service = Service.query.get_or_404(service_id)
@@ -1,50 +1,93 @@
 // Materials Page JavaScript
-// Handles client-side filtering and animations
+// Swaps the server-filtered material grid in place and handles animations
 
-function filterMaterials(category) {
-    const items = document.querySelectorAll('.material-item');
+function setActiveCategory(category) {
     const buttons = document.querySelectorAll('.category-filter');
 
-    // Update functionality
     buttons.forEach(btn => {
         const checkIcon = btn.querySelector('.check-icon');
         const checkSpan = checkIcon.querySelector('span');
+        const isActive = btn.dataset.category === category;
 
-        if (btn.dataset.category === category) {
-            checkIcon.classList.add('bg-primary', 'border-primary');
-            checkSpan.classList.remove('hidden');
-        } else {
-            checkIcon.classList.remove('bg-primary', 'border-primary');
-            checkSpan.classList.add('hidden');
-        }
+        btn.classList.toggle('active', isActive);
+        checkIcon.classList.toggle('bg-primary', isActive);
+        checkIcon.classList.toggle('border-primary', isActive);
+        checkSpan.classList.toggle('hidden', !isActive);
     });
+}
 
-    // Filter items
-    let visibleCount = 0;
+function animateMaterials() {
+    const items = document.querySelectorAll('#materials-grid .material-item');
     items.forEach((item, index) => {
-        const itemCategory = item.dataset.category;
-
-        if (category === 'All' || itemCategory === category) {
-            item.style.display = 'flex';
-            // Reset animation
-            item.style.animation = 'none';
-            item.offsetHeight; /* trigger reflow */
-            item.style.animation = `fadeInUp 0.5s ease-out forwards ${visibleCount * 0.05}s`;
-            visibleCount++;
-        } else {
-            item.style.display = 'none';
-        }
+        item.style.animation = `fadeInUp 0.5s ease-out forwards ${index * 0.05}s`;
     });
+}
 
-    // Show/Hide No Results Message
-    const noResultsMsg = document.getElementById('no-results-message');
-    if (noResultsMsg) {
-        if (visibleCount === 0) {
-            noResultsMsg.classList.remove('hidden');
-            noResultsMsg.classList.add('flex');
-        } else {
-            noResultsMsg.classList.add('hidden');
-            noResultsMsg.classList.remove('flex');
-        }
+// Fetch the grid fragment for a page URL (same query string) and swap it in.
+// Falls back to a full page load when the fragment cannot be fetched, or when
+// the page has no grid URL (the static export, where links are plain pages).
+function loadMaterials(pageUrl, pushHistory = true) {
+    const container = document.getElementById('materials-grid');
+    if (!container || !container.dataset.gridUrl) {
+        window.location.href = pageUrl;
+        return;
+    }
+
+    const url = new URL(pageUrl, window.location.href);
+    const gridUrl = container.dataset.gridUrl + url.search;
+
+    container.setAttribute('aria-busy', 'true');
+    fetch(gridUrl, { headers: { 'X-Requested-With': 'XMLHttpRequest' } })
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`Grid request failed: ${response.status}`);
+            }
+            return response.text();
+        })
+        .then(html => {
+            container.innerHTML = html;
+            container.removeAttribute('aria-busy');
+            setActiveCategory(url.searchParams.get('category') || 'All');
+            animateMaterials();
+            if (pushHistory) {
+                history.pushState({ materials: true }, '', url.pathname + url.search);
+            }
+        })
+        .catch(() => {
+            window.location.href = url.href;
+        });
+}
+
+function filterMaterials(category) {
+    const url = new URL(window.location.href);
+    url.search = '';
+    if (category && category !== 'All') {
+        url.searchParams.set('category', category);
     }
+    loadMaterials(url.href);
 }
+
+document.addEventListener('DOMContentLoaded', () => {
+    // Category links and pagination inside the grid load only the fragment
+    const container = document.getElementById('materials-grid');
+    if (!container || !container.dataset.gridUrl) {
+        return;
+    }
+
+    document.addEventListener('click', event => {
+        const link = event.target.closest('.category-filter, .category-link, #materials-grid .grid-link');
+        if (!link || event.metaKey || event.ctrlKey || event.shiftKey || event.button !== 0) {
+            return;
+        }
+        event.preventDefault();
+        if (link.dataset.category) {
+            filterMaterials(link.dataset.category);
+        } else {
+            loadMaterials(link.href);
+        }
+    });
+
+    window.addEventListener('popstate', () => {
+        loadMaterials(window.location.href, false);
+    });
+});
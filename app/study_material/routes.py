@@ -2,7 +2,8 @@
 Study Material Routes Module
 Handles study material listing, details, and downloads:
 - Material Browsing & Filtering
-- Category-based Filtering
+- Category-based Filtering (in SQL)
+- Grid Fragment for In-page Category Switching
 - Material Detail Pages
 - Download Management
 - External Document Links
@@ -16,33 +17,57 @@ import os
 # =========================================
 # THIRD-PARTY IMPORTS
 # =========================================
-from flask import render_template, request, send_file, redirect, url_for, flash
+from flask import current_app, render_template, request, send_file, redirect, url_for, flash
 from flask_login import login_required, current_user
 
 # =========================================
 # LOCAL APPLICATION IMPORTS
 # =========================================
-from app.extensions import db
 from app.study_material import study_material
 from app.models.study_material import StudyMaterial
 from app.models.study_material_category import StudyMaterialCategory
-from app.models.download import Download
 from app.utils.constants import ITEM_TYPE_STUDY_MATERIAL
+from app.utils.decorators import cache_page, conditional_get
+from app.utils.cache import PAGE_TAG_MATERIALS
+from app.utils.pagination import keyset_paginate
+from app.utils.query_options import material_listing_options
+from app.utils.counters import download_counter
+from app.utils.event_log import download_log
 
 
 # =========================================
 # MATERIAL LISTING ROUTES
 # =========================================
 
+def _materials_page(category_filter, cursor):
+    """
+    Load one page of active materials, filtered by category name in SQL.
+
+    Args:
+        category_filter: Category name, or None / 'All' for every category
+        cursor: Keyset cursor from the previous page link
+
+    Returns:
+        KeysetPage: The requested page
+    """
+    query = StudyMaterial.query.options(*material_listing_options()).filter_by(is_active=True)
+    if category_filter:
+        # Served by ix_study_materials_category_active_created_at
+        query = query.join(StudyMaterial.material_category).filter(StudyMaterialCategory.name == category_filter)
+    return keyset_paginate(query, StudyMaterial, per_page=current_app.config['STUDY_MATERIALS_PER_PAGE'], cursor=cursor,
+                           total_key=f"study_materials:{category_filter or ''}")
+
+
 @study_material.route("/study-materials")
+@cache_page(timeout=300, tags=(PAGE_TAG_MATERIALS,))
 def materials_list():
     """Display paginated list of study materials with category filtering"""
-    page = request.args.get('page', 1, type=int)
-    category_filter = request.args.get('category', None)
+    cursor = request.args.get('cursor')
+    category_filter = request.args.get('category')
+    if category_filter == 'All':
+        category_filter = None
     
-    query = StudyMaterial.query.filter_by(is_active=True)
-        
-    materials_paginated = query.order_by(StudyMaterial.created_at.desc()).paginate(page=page, per_page=100)
+    materials_paginated = _materials_page(category_filter, cursor)
     
     # Get all unique categories for sidebar
     categories = [c.name for c in StudyMaterialCategory.query.order_by(StudyMaterialCategory.name).all()]
@@ -54,11 +79,29 @@ def materials_list():
                          current_category=category_filter)
 
 
+@study_material.route("/study-materials/grid")
+@cache_page(timeout=300, tags=(PAGE_TAG_MATERIALS,))
+def materials_grid():
+    """Render only the material grid and pagination, for in-page category switching"""
+    cursor = request.args.get('cursor')
+    category_filter = request.args.get('category')
+    if category_filter == 'All':
+        category_filter = None
+    
+    materials_paginated = _materials_page(category_filter, cursor)
+    
+    return render_template('study_material/material_grid.html',
+                         materials=materials_paginated,
+                         current_category=category_filter)
+
+
 # =========================================
 # MATERIAL DETAIL ROUTES
 # =========================================
 
 @study_material.route("/study-material/<int:material_id>")
+@conditional_get(StudyMaterial, 'material_id', tags=(PAGE_TAG_MATERIALS,))
+@cache_page(timeout=600, tags=(PAGE_TAG_MATERIALS,))
 def material_detail(material_id):
     """Display individual study material details"""
     material = StudyMaterial.query.get_or_404(material_id)
@@ -87,8 +130,7 @@ def download_material(material_id):
     
     # Check if external document URL is provided
     if material.doc_url:
-        material.download_count += 1
-        db.session.commit()
+        download_counter.increment(StudyMaterial, material.id)
         return redirect(material.doc_url)
     
     # Check if file exists
@@ -96,19 +138,17 @@ def download_material(material_id):
         flash('Study material file not found.', 'danger')
         return redirect(url_for('study_material.material_detail', material_id=material.id))
     
-    # Record download only if user is logged in
+    # Record download only if user is logged in (inserted in batches by a background worker)
     if current_user.is_authenticated:
-        download = Download(
+        download_log.record(
             user_id=current_user.id,
             item_type=ITEM_TYPE_STUDY_MATERIAL,
             item_id=material.id,
             filename=os.path.basename(material.file_path)
         )
-        db.session.add(download)
     
-    # Increment download count
-    material.download_count += 1
-    db.session.commit()
+    # Buffered and flushed in the background as download_count = download_count + n
+    download_counter.increment(StudyMaterial, material.id)
     
     # Send file for download
     return send_file(material.file_path, as_attachment=True)
\ No newline at end of file
@@ -0,0 +1,319 @@
+"""
+Static Asset Utilities Module
+Helpers for serving front-end assets efficiently:
+- Prebuilt Tailwind Stylesheets
+- Content-hashed Static URLs (asset manifest)
+- Immutable Cache Headers for Hashed Assets
+- Precompressed (.br / .gz) Static Variants
+- Asset Build CLI Commands
+"""
+
+# =========================================
+# STANDARD LIBRARY IMPORTS
+# =========================================
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+
+# =========================================
+# THIRD-PARTY IMPORTS
+# =========================================
+import click
+from flask import current_app, request, send_from_directory, url_for
+from flask.cli import AppGroup
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli ships with Flask-Compress
+    brotli = None
+
+
+# =========================================
+# ASSET CONSTANTS
+# =========================================
+# Stylesheets produced by `npm run build:css` (see package.json)
+BUILT_STYLESHEETS = {
+    'site': 'css/dist/site.min.css',
+    'admin': 'css/dist/admin.min.css',
+    'login': 'css/dist/login.min.css',
+}
+
+# Written by `flask assets build`, relative to the static folder
+MANIFEST_FILENAME = 'asset-manifest.json'
+
+IMMUTABLE_MAX_AGE = 31536000
+IMMUTABLE_CACHE_CONTROL = f'public, max-age={IMMUTABLE_MAX_AGE}, immutable'
+
+# Files uploaded at runtime are hashed on first use instead of at startup
+RUNTIME_ASSET_PREFIX = 'uploads/'
+
+# Number of hex digits of the content hash kept in hashed filenames
+DIGEST_LENGTH = 12
+# 'dir/name.<digest>.ext' -> ('dir/name', '<digest>', '.ext')
+HASHED_NAME_RE = re.compile(rf'^(?P<root>.+)\.(?P<digest>[0-9a-f]{{{DIGEST_LENGTH}}})(?P<ext>\.[^./]+)?$')
+
+# Precompressed siblings written by `flask assets build`, in order of preference
+PRECOMPRESSED_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+COMPRESSIBLE_EXTENSIONS = {'.css', '.js', '.json', '.svg', '.txt', '.xml', '.html', '.map'}
+
+
+# =========================================
+# HELPER FUNCTIONS
+# =========================================
+
+def file_digest(path, length=DIGEST_LENGTH):
+    """
+    Return a short content hash for a file.
+
+    Args:
+        path: Absolute path of the file
+        length: Number of hex characters to keep
+
+    Returns:
+        str: Hex digest prefix
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:length]
+
+
+def iter_static_files(static_folder, include_precompressed=False):
+    """Yield static filenames relative to the static folder, using forward slashes"""
+    for root, _, files in os.walk(static_folder):
+        for name in files:
+            filename = os.path.relpath(os.path.join(root, name), static_folder).replace(os.sep, '/')
+            if filename == MANIFEST_FILENAME:
+                continue
+            if not include_precompressed and filename.endswith(tuple(PRECOMPRESSED_SUFFIXES.values())):
+                continue
+            yield filename
+
+
+def write_precompressed(path):
+    """
+    Write .gz (and .br when brotli is available) siblings for a static file.
+
+    Args:
+        path: Absolute path of the file to compress
+
+    Returns:
+        list: Encodings that were written
+    """
+    with open(path, 'rb') as fh:
+        data = fh.read()
+
+    written = []
+    with open(path + PRECOMPRESSED_SUFFIXES['gzip'], 'wb') as fh:
+        # mtime=0 keeps the output byte-identical across builds
+        fh.write(gzip.compress(data, compresslevel=9, mtime=0))
+    written.append('gzip')
+
+    if brotli is not None:
+        with open(path + PRECOMPRESSED_SUFFIXES['br'], 'wb') as fh:
+            fh.write(brotli.compress(data, quality=11))
+        written.append('br')
+    return written
+
+
+# =========================================
+# ASSET MANIFEST
+# =========================================
+
+class AssetManifest:
+    """
+    Maps static filenames to content-hashed names and back.
+
+    'css/projects.css' becomes 'css/projects.<hash>.css', so the URL changes
+    whenever the file content does and can be cached by browsers forever.
+    """
+
+    def __init__(self, static_folder, hashed=None):
+        self.static_folder = static_folder
+        self.hashed = {}
+        self.originals = {}
+        self.precompressed = {}
+        for filename, hashed_name in (hashed or {}).items():
+            self._register(filename, hashed_name)
+
+    def _register(self, filename, hashed_name):
+        self.hashed[filename] = hashed_name
+        if hashed_name != filename:
+            self.originals[hashed_name] = filename
+
+    def add(self, filename):
+        """Hash a file under the static folder and record it"""
+        path = os.path.join(self.static_folder, filename)
+        if not os.path.isfile(path):
+            # Remember misses too so unknown names are not checked again
+            self._register(filename, filename)
+            return filename
+        root, ext = os.path.splitext(filename)
+        hashed_name = f"{root}.{file_digest(path)}{ext}"
+        self._register(filename, hashed_name)
+        return hashed_name
+
+    def lookup(self, filename):
+        """Return the hashed name for a static filename (or the name itself)"""
+        hashed_name = self.hashed.get(filename)
+        if hashed_name is None:
+            if not filename.startswith(RUNTIME_ASSET_PREFIX):
+                return filename
+            hashed_name = self.add(filename)
+        return hashed_name
+
+    def resolve(self, filename):
+        """
+        Map a hashed name back to its static filename.
+
+        Runtime uploads may have been hashed by another worker, so unknown
+        hashed names under RUNTIME_ASSET_PREFIX are checked against the file
+        on disk instead of this worker's memory.
+
+        Args:
+            filename: Requested static filename
+
+        Returns:
+            str or None: Original filename, or None when it is not a known hashed name
+        """
+        original = self.originals.get(filename)
+        if original is not None or not filename.startswith(RUNTIME_ASSET_PREFIX):
+            return original
+
+        match = HASHED_NAME_RE.match(filename)
+        if match is None:
+            return None
+        candidate = match.group('root') + (match.group('ext') or '')
+        path = safe_join(self.static_folder, candidate)
+        if path is None or not os.path.isfile(path) or file_digest(path) != match.group('digest'):
+            return None
+        self._register(candidate, filename)
+        return candidate
+
+    def preferred_encoding(self, filename, accept_encodings):
+        """Return the best precompressed encoding of a file the client accepts"""
+        available = self.precompressed.get(filename)
+        if not available:
+            return None
+        for encoding in PRECOMPRESSED_SUFFIXES:
+            if encoding in available and accept_encodings[encoding]:
+                return encoding
+        return None
+
+    def scan_precompressed(self):
+        """Record which static files have precompressed siblings"""
+        self.precompressed = {}
+        for filename in iter_static_files(self.static_folder, include_precompressed=True):
+            for encoding, suffix in PRECOMPRESSED_SUFFIXES.items():
+                if filename.endswith(suffix):
+                    self.precompressed.setdefault(filename[:-len(suffix)], set()).add(encoding)
+
+    @classmethod
+    def build(cls, static_folder):
+        """Hash every file under the static folder"""
+        manifest = cls(static_folder)
+        for filename in iter_static_files(static_folder):
+            manifest.add(filename)
+        return manifest
+
+    @classmethod
+    def load(cls, static_folder):
+        """Load the manifest written at build time, or build it now"""
+        path = os.path.join(static_folder, MANIFEST_FILENAME)
+        if os.path.exists(path):
+            with open(path) as fh:
+                return cls(static_folder, json.load(fh))
+        return cls.build(static_folder)
+
+    def save(self):
+        """Write the manifest next to the static files"""
+        hashed = {name: hashed_name for name, hashed_name in self.hashed.items() if hashed_name != name}
+        with open(os.path.join(self.static_folder, MANIFEST_FILENAME), 'w') as fh:
+            json.dump(hashed, fh, indent=2, sort_keys=True)
+
+
+# =========================================
+# CLI COMMANDS
+# =========================================
+assets_cli = AppGroup('assets', help='Build static asset artifacts.')
+
+
+@assets_cli.command('build')
+def build_assets():
+    """Write precompressed variants and the asset manifest"""
+    static_folder = current_app.static_folder
+    min_size = current_app.config.get('COMPRESS_MIN_SIZE', 500)
+
+    compressed = 0
+    for filename in iter_static_files(static_folder):
+        path = os.path.join(static_folder, filename)
+        if os.path.splitext(filename)[1].lower() in COMPRESSIBLE_EXTENSIONS and os.path.getsize(path) >= min_size:
+            write_precompressed(path)
+            compressed += 1
+
+    manifest = AssetManifest.build(static_folder)
+    manifest.save()
+    click.echo(f"Precompressed {compressed} files; wrote {MANIFEST_FILENAME} with {len(manifest.originals)} hashed assets.")
+
+
+# =========================================
+# APPLICATION SETUP
+# =========================================
+
+def init_assets(app):
+    """
+    Register asset helpers on the application.
+
+    The manifest is loaded (or computed) once here, never per request.
+    url_for('static', ...) is rewritten to hashed names through a URL
+    defaults hook, and the static view maps them back to the real files.
+    """
+    manifest = AssetManifest.load(app.static_folder)
+    manifest.scan_precompressed()
+    app.extensions['asset_manifest'] = manifest
+
+    @app.url_defaults
+    def hashed_static_url(endpoint, values):
+        if endpoint == 'static' and app.config.get('ASSET_HASHING', True) and 'filename' in values:
+            values['filename'] = manifest.lookup(values['filename'])
+
+    def static(filename):
+        original = manifest.resolve(filename)
+        is_hashed = original is not None
+        original = original or filename
+
+        encoding = manifest.preferred_encoding(original, request.accept_encodings)
+        if not is_hashed and encoding is None:
+            return app.send_static_file(filename)
+
+        # Serve the precompressed sibling as-is; Flask-Compress skips encoded responses
+        served = original + PRECOMPRESSED_SUFFIXES[encoding] if encoding else original
+        response = send_from_directory(app.static_folder, served,
+                                       mimetype=mimetypes.guess_type(original)[0],
+                                       max_age=IMMUTABLE_MAX_AGE if is_hashed else None)
+        if original in manifest.precompressed:
+            response.vary.add('Accept-Encoding')
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        if is_hashed:
+            response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+    app.view_functions['static'] = static
+
+    built = {name for name, filename in BUILT_STYLESHEETS.items()
+             if os.path.exists(os.path.join(app.static_folder, filename))}
+
+    def built_stylesheet(name):
+        """Return the URL of a prebuilt stylesheet, or None if it was not built"""
+        if name not in built:
+            return None
+        return url_for('static', filename=BUILT_STYLESHEETS[name])
+
+    app.jinja_env.globals['built_stylesheet'] = built_stylesheet
+    app.cli.add_command(assets_cli)
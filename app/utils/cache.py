@@ -0,0 +1,344 @@
+"""
+Cache Utilities Module
+In-process caches shared by the public routes:
+- Versioned Content Cache (per-worker singletons)
+- Full-page Response Cache (anonymous visitors)
+- Prerendered Pages (env-context only)
+- Cross-worker Invalidation via Version Stamps
+"""
+
+# =========================================
+# STANDARD LIBRARY IMPORTS
+# =========================================
+import hashlib
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from urllib.parse import urlencode
+
+# =========================================
+# THIRD-PARTY IMPORTS
+# =========================================
+from flask import current_app, make_response, request, session
+from sqlalchemy import inspect
+
+# =========================================
+# LOCAL APPLICATION IMPORTS
+# =========================================
+from app.extensions import db
+
+
+# =========================================
+# CACHE KEYS
+# =========================================
+HOME_CONTENT_KEY = 'home_content'
+ABOUT_CONTENT_KEY = 'about_content'
+HOME_SKILLS_KEY = 'home_skills'
+HOME_TEAM_KEY = 'home_team'
+SERVICES_DATA_KEY = 'services_data'
+
+
+# =========================================
+# PAGE CACHE TAGS
+# =========================================
+PAGE_TAG_HOME = 'home'
+PAGE_TAG_ABOUT = 'about'
+PAGE_TAG_BLOG = 'blog'
+PAGE_TAG_PROJECTS = 'projects'
+PAGE_TAG_SERVICES = 'services'
+PAGE_TAG_MATERIALS = 'study_material'
+PAGE_TAG_VIDEOS = 'youtube'
+
+
+# =========================================
+# VERSION STAMPS
+# =========================================
+
+def _stamp_path(key):
+    """Return the path of the version stamp file for a cache key"""
+    folder = current_app.config.get('CACHE_VERSION_DIR') or os.path.join(current_app.instance_path, 'cache_versions')
+    return os.path.join(folder, f"{key}.version")
+
+
+def read_version(key):
+    """Read the current shared version of a cache key"""
+    try:
+        with open(_stamp_path(key)) as stamp:
+            return stamp.read().strip() or '0'
+    except FileNotFoundError:
+        return '0'
+
+
+def read_version_time(key):
+    """Return when a cache key's version was last bumped (naive UTC), or None if never"""
+    try:
+        return datetime.utcfromtimestamp(os.path.getmtime(_stamp_path(key)))
+    except FileNotFoundError:
+        return None
+
+
+def bump_version(key):
+    """Write a new shared version for a cache key, visible to every worker"""
+    path = _stamp_path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Write then rename so readers never see a half-written stamp
+    new_version = uuid.uuid4().hex
+    tmp_path = f"{path}.{new_version}"
+    with open(tmp_path, 'w') as stamp:
+        stamp.write(new_version)
+    os.replace(tmp_path, path)
+    return new_version
+
+
+# =========================================
+# VERSIONED CONTENT CACHE
+# =========================================
+
+class VersionedCache:
+    """
+    Per-worker cache whose entries are invalidated by shared version stamps.
+
+    Each key has a small stamp file in the instance folder. Every gunicorn
+    worker keeps its own copy of the cached value together with the stamp it
+    was loaded under, and reloads it once another worker bumps the stamp.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, loader):
+        """
+        Return the cached value for a key, loading it when the stamp changed.
+
+        Args:
+            key: Cache key name
+            loader: Callable that builds the value on a miss
+
+        Returns:
+            The cached (or freshly loaded) value
+        """
+        # Read the version before loading so a concurrent bump forces a reload
+        version = read_version(key)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        value = loader()
+        with self._lock:
+            self._entries[key] = (version, value)
+        return value
+
+    def bump(self, key):
+        """Invalidate a key in every worker by writing a new version stamp"""
+        bump_version(key)
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop every entry held by this worker"""
+        with self._lock:
+            self._entries.clear()
+
+
+# =========================================
+# FULL-PAGE RESPONSE CACHE
+# =========================================
+
+class ResponseCache:
+    """
+    Per-worker cache of rendered responses for anonymous GET requests.
+
+    Entries are keyed by host, path and sorted query string, expire after a
+    per-route timeout and are grouped under tags. Purging a tag bumps its
+    version stamp, which evicts the matching entries in every worker.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _tag_key(tag):
+        return f"page_{tag}"
+
+    @staticmethod
+    def make_key():
+        """Build the cache key for the current request"""
+        # Re-encode the pairs so a value containing '&' or '=' cannot alias another URL
+        query = urlencode(sorted(request.args.items(multi=True)))
+        return f"{request.host}{request.path}?{query}"
+
+    @staticmethod
+    def is_cacheable_request():
+        """Only anonymous GET/HEAD requests without session state are cached"""
+        if not current_app.config.get('PAGE_CACHE_ENABLED', True):
+            return False
+        if request.method not in ('GET', 'HEAD'):
+            return False
+        remember_cookie = current_app.config.get('REMEMBER_COOKIE_NAME', 'remember_token')
+        if remember_cookie in request.cookies:
+            return False
+        # Any session data (login, flashed messages, CSRF token) bypasses the cache
+        return not session
+
+    def get(self, key):
+        """
+        Return a cached (status, headers, body) tuple or None on a miss.
+
+        Args:
+            key: Key built by make_key()
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, tag_versions, payload = entry
+        if expires_at < time.monotonic() or any(read_version(self._tag_key(tag)) != version
+                                                for tag, version in tag_versions):
+            with self._lock:
+                self._entries.pop(key, None)
+            return None
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        return payload
+
+    def set(self, key, response, timeout, tags):
+        """
+        Store a rendered response under the given tags.
+
+        Args:
+            key: Key built by make_key()
+            response: Finalised Flask response object
+            timeout: Lifetime in seconds
+            tags: Iterable of purge tags the page depends on
+        """
+        tag_versions = tuple((tag, read_version(self._tag_key(tag))) for tag in tags)
+        headers = [(name, value) for name, value in response.headers if name.lower() != 'set-cookie']
+        payload = (response.status_code, headers, response.get_data())
+        max_entries = current_app.config.get('PAGE_CACHE_MAX_ENTRIES', 500)
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + timeout, tag_versions, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def tag_state(self, tags):
+        """
+        Describe the current versions of a set of purge tags.
+
+        Args:
+            tags: Iterable of purge tags
+
+        Returns:
+            tuple: (versions, purged_at) - the tags' version stamps joined into
+                one string, and the time of the latest purge (None if never)
+        """
+        keys = [self._tag_key(tag) for tag in tags]
+        purge_times = [t for t in (read_version_time(key) for key in keys) if t is not None]
+        return ','.join(read_version(key) for key in keys), max(purge_times, default=None)
+
+    def purge(self, *tags):
+        """Evict every page cached under any of the given tags, in all workers"""
+        for tag in tags:
+            bump_version(self._tag_key(tag))
+        with self._lock:
+            stale = [key for key, (_, tag_versions, _) in self._entries.items()
+                     if any(tag in tags for tag, _ in tag_versions)]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop every entry held by this worker"""
+        with self._lock:
+            self._entries.clear()
+
+
+# =========================================
+# PRERENDERED PAGES
+# =========================================
+
+class PrerenderedPages:
+    """
+    Rendered bytes of pages whose only dynamic input is the template env context.
+
+    Each entry remembers the env context version it was rendered under and
+    is rendered again once EnvContext rebuilds the mapping.
+    """
+
+    def __init__(self):
+        self._pages = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint, render):
+        """
+        Return (body, etag) for an endpoint, rendering it if missing or stale.
+
+        Args:
+            endpoint: Endpoint name of the page
+            render: Callable returning the view's response
+
+        Returns:
+            tuple or None: None when the render is not cacheable
+        """
+        env_context = current_app.extensions['env_context']
+        env_context.get()  # Picks up .env changes in debug mode
+        version = env_context.version
+
+        page = self._pages.get(endpoint)
+        if page is not None and page[0] == version:
+            return page[1], page[2]
+
+        response = make_response(render())
+        if response.status_code != 200 or session.modified:
+            return None
+        body = response.get_data()
+        page = (version, body, hashlib.sha256(body).hexdigest())
+        with self._lock:
+            self._pages[endpoint] = page
+        return page[1], page[2]
+
+    def warm(self, app):
+        """Render every view decorated with @prerendered, before the first request"""
+        for rule in app.url_map.iter_rules():
+            view = app.view_functions.get(rule.endpoint)
+            if getattr(view, 'prerendered', False) and not rule.arguments:
+                with app.test_request_context(rule.rule):
+                    view()
+
+
+# =========================================
+# HELPER FUNCTIONS
+# =========================================
+
+def detach(instances):
+    """
+    Fully load and expunge model instances so they outlive the request session.
+
+    Args:
+        instances: A model instance or a list of instances
+
+    Returns:
+        The same instance(s), detached from the session
+    """
+    items = instances if isinstance(instances, list) else [instances]
+    for item in items:
+        if inspect(item).expired_attributes:
+            db.session.refresh(item)
+        db.session.expunge(item)
+    return instances
+
+
+# =========================================
+# CACHE INSTANCES
+# =========================================
+content_cache = VersionedCache()
+page_cache = ResponseCache()
+prerendered_pages = PrerenderedPages()
@@ -6,6 +6,7 @@ Defines constant values used throughout the application:
 - Project Types
 - Material Types
 - Inquiry Statuses
+- Blog Excerpts
 """
 
 # =========================================
@@ -41,4 +42,10 @@ MATERIAL_PAID = 'paid'
 # =========================================
 INQUIRY_NEW = 'new'
 INQUIRY_CONTACTED = 'contacted'
-INQUIRY_CLOSED = 'closed'
\ No newline at end of file
+INQUIRY_CLOSED = 'closed'
+
+
+# =========================================
+# BLOG EXCERPTS
+# =========================================
+BLOG_EXCERPT_LENGTH = 120  # Characters shown on the blog listing cards
@@ -0,0 +1,196 @@
+"""
+Database Pool Utilities Module
+Connection pooling for the production PostgreSQL engine:
+- Engine Options Built from the DB_* Config Values
+- Statement and Idle-in-transaction Timeouts
+- Queue Pool That Times Every Checkout
+- Per-worker Checkout Wait Metrics
+"""
+
+# =========================================
+# STANDARD LIBRARY IMPORTS
+# =========================================
+import os
+import threading
+import time
+
+# =========================================
+# THIRD-PARTY IMPORTS
+# =========================================
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+
+# =========================================
+# CHECKOUT METRICS
+# =========================================
+# Upper bounds (milliseconds) of the checkout wait histogram buckets
+WAIT_BUCKETS_MS = (1, 5, 25, 100, 500, 2000)
+
+
+class PoolMetrics:
+    """
+    Running totals of how long requests waited for a pooled connection.
+
+    Counts are per worker process, since every gunicorn worker owns its pool.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear every counter"""
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def record(self, wait, timed_out=False):
+        """
+        Record one checkout attempt.
+
+        Args:
+            wait: Seconds spent acquiring the connection
+            timed_out: True when the pool raised TimeoutError
+        """
+        wait_ms = wait * 1000
+        bucket = next((i for i, bound in enumerate(WAIT_BUCKETS_MS) if wait_ms <= bound), len(WAIT_BUCKETS_MS))
+        with self._lock:
+            self.checkouts += 1
+            self.timeouts += int(timed_out)
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self.buckets[bucket] += 1
+
+    def snapshot(self):
+        """
+        Return the current totals.
+
+        Returns:
+            dict: Checkout count, timeouts, average/max wait and histogram
+        """
+        with self._lock:
+            labels = [f"le_{bound}ms" for bound in WAIT_BUCKETS_MS] + ['inf']
+            return {
+                'checkouts': self.checkouts,
+                'timeouts': self.timeouts,
+                'avg_wait_ms': round(self.total_wait * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                'max_wait_ms': round(self.max_wait * 1000, 3),
+                'wait_histogram': dict(zip(labels, self.buckets)),
+            }
+
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool that records how long each connection checkout waited.
+
+    The wait covers queueing for a free connection, opening an overflow
+    connection and the pre-ping.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - started)
+        return connection
+
+
+# =========================================
+# ENGINE OPTIONS
+# =========================================
+
+def postgres_engine_options(config):
+    """
+    Build SQLALCHEMY_ENGINE_OPTIONS for a PostgreSQL database.
+
+    Args:
+        config: Application config holding the DB_* settings
+
+    Returns:
+        dict: Engine options for Flask-SQLAlchemy
+    """
+    server_options = ' '.join([
+        f"-c statement_timeout={int(config['DB_STATEMENT_TIMEOUT'])}",
+        f"-c idle_in_transaction_session_timeout={int(config['DB_IDLE_IN_TRANSACTION_TIMEOUT'])}",
+    ])
+    return {
+        'poolclass': TimedQueuePool,
+        'pool_size': config['DB_POOL_SIZE'],
+        'max_overflow': config['DB_MAX_OVERFLOW'],
+        'pool_timeout': config['DB_POOL_TIMEOUT'],
+        'pool_recycle': config['DB_POOL_RECYCLE'],
+        # Drop connections the server or a proxy closed while they sat idle
+        'pool_pre_ping': True,
+        # Reuse the most recent connection so idle extras can age out via recycle
+        'pool_use_lifo': True,
+        'connect_args': {
+            'connect_timeout': config['DB_CONNECT_TIMEOUT'],
+            'options': server_options,
+        },
+    }
+
+
+def init_postgres_pool(app):
+    """
+    Apply the pool profile when the app runs against PostgreSQL.
+
+    Does nothing unless the config defines DB_POOL_SIZE (see ProductionConfig)
+    and the database URL is PostgreSQL. Explicit SQLALCHEMY_ENGINE_OPTIONS
+    keys win over the generated ones. Must run before db.init_app().
+
+    Args:
+        app: Flask application
+    """
+    uri = app.config.get('SQLALCHEMY_DATABASE_URI') or ''
+    if app.config.get('DB_POOL_SIZE') is None or not uri.startswith('postgresql'):
+        return
+
+    options = postgres_engine_options(app.config)
+    options.update(app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+
+    # Every worker holds its own pool, so the server sees workers x (size + overflow)
+    peak = app.config['GUNICORN_WORKERS'] * (options['pool_size'] + options['max_overflow'])
+    if peak > app.config['DB_MAX_CONNECTIONS']:
+        app.logger.warning(
+            f"Database pool may open {peak} connections, above DB_MAX_CONNECTIONS "
+            f"({app.config['DB_MAX_CONNECTIONS']}); lower DB_POOL_SIZE or DB_MAX_OVERFLOW"
+        )
+
+
+# =========================================
+# METRICS REPORTING
+# =========================================
+
+def pool_metrics(engine):
+    """
+    Describe the pool of an engine for the metrics endpoint.
+
+    Args:
+        engine: SQLAlchemy engine
+
+    Returns:
+        dict: Pool sizing, current usage and, for TimedQueuePool, wait metrics
+    """
+    pool = engine.pool
+    report = {'pid': os.getpid(), 'pool': type(pool).__name__, 'status': pool.status()}
+    if isinstance(pool, QueuePool):
+        report.update({
+            'size': pool.size(),
+            'checked_out': pool.checkedout(),
+            'checked_in': pool.checkedin(),
+            'overflow': pool.overflow(),
+        })
+    if isinstance(pool, TimedQueuePool):
+        report.update(pool.metrics.snapshot())
+    return report
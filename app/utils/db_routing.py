@@ -0,0 +1,212 @@
+"""
+Database Routing Utilities Module
+Sends read-only public traffic to a read replica:
+- Routing Session (replica for public GET reads, primary for everything else)
+- Per-request Routing Decision by Blueprint and Endpoint
+- Replica Lag Probe with Fallback to the Primary
+- Cross-worker Write Fence (primary-only reads right after a write)
+
+The replica is the `replica` entry of SQLALCHEMY_BINDS, set from
+REPLICA_DATABASE_URL. Without it every query goes to the primary.
+"""
+
+# =========================================
+# STANDARD LIBRARY IMPORTS
+# =========================================
+import os
+import threading
+import time
+
+# =========================================
+# THIRD-PARTY IMPORTS
+# =========================================
+from flask import g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, text
+from sqlalchemy.sql.dml import UpdateBase
+
+
+# =========================================
+# ROUTING RULES
+# =========================================
+REPLICA_BIND_KEY = 'replica'
+
+# Blueprints whose GET requests only read published content
+REPLICA_BLUEPRINTS = ('pages', 'projects', 'services', 'study_material', 'youtube', 'search')
+
+# Public endpoints that must see the primary (forms, download tracking)
+PRIMARY_ENDPOINTS = {
+    'pages.contact',
+    'projects.download_project',
+    'study_material.download_material',
+}
+
+# Version stamp bumped after each session commit that wrote to the primary
+WRITE_FENCE_KEY = 'replica_write_fence'
+
+# Lag (seconds) of a PostgreSQL standby; 0 once it has replayed all it received
+POSTGRES_LAG_SQL = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+# =========================================
+# ROUTING SESSION
+# =========================================
+
+class RoutingSession(Session):
+    """
+    Flask-SQLAlchemy session that reads from the replica when allowed.
+
+    A statement goes to the replica only when the current request was marked
+    read-only by ReplicaRouter and this session has not written anything yet;
+    flushes, INSERT/UPDATE/DELETE statements and every read after them use the
+    primary, so a request always sees its own writes.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self._use_replica(clause):
+            return self._db.engines[REPLICA_BIND_KEY]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _use_replica(self, clause):
+        if self._flushing or self.info.get('wrote') or isinstance(clause, UpdateBase):
+            return False
+        if not has_request_context() or not g.get('read_replica', False):
+            return False
+        return REPLICA_BIND_KEY in self._db.engines
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _mark_flush_written(session, flush_context):
+    session.info['wrote'] = True
+
+
+@event.listens_for(RoutingSession, 'do_orm_execute')
+def _mark_dml_written(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info['wrote'] = True
+
+
+@event.listens_for(RoutingSession, 'after_commit')
+def _fence_committed_writes(session):
+    if session.info.pop('wrote', False) and REPLICA_BIND_KEY in session._db.engines:
+        from app.utils.cache import bump_version
+        bump_version(WRITE_FENCE_KEY)
+
+
+@event.listens_for(RoutingSession, 'after_rollback')
+def _clear_rolled_back_writes(session):
+    session.info.pop('wrote', None)
+
+
+# =========================================
+# REPLICA ROUTER
+# =========================================
+
+class ReplicaRouter:
+    """
+    Decides per request whether reads may use the replica.
+
+    Public GET/HEAD requests qualify unless their endpoint is listed in
+    PRIMARY_ENDPOINTS. Replica lag is probed at most every
+    REPLICA_LAG_CHECK_INTERVAL seconds per worker; while it exceeds
+    REPLICA_MAX_LAG, or the probe fails, reads stay on the primary. After any
+    worker commits a write (the write fence), reads stay on the primary for
+    REPLICA_MAX_LAG seconds, so pages re-rendered after an admin change never
+    come from a replica that has not applied it yet.
+    """
+
+    def __init__(self):
+        self.app = None
+        self._state = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """Route reads for an application that has a replica bind"""
+        if REPLICA_BIND_KEY not in (app.config.get('SQLALCHEMY_BINDS') or {}):
+            return
+        self.app = app
+        app.before_request(self.route_request)
+
+    def route_request(self):
+        """before_request hook: mark read-only public requests for the replica"""
+        g.read_replica = (
+            request.method in ('GET', 'HEAD')
+            and request.blueprint in REPLICA_BLUEPRINTS
+            and request.endpoint not in PRIMARY_ENDPOINTS
+            and self.replica_usable()
+        )
+
+    def replica_usable(self):
+        """
+        Check whether the replica is within REPLICA_MAX_LAG of the primary.
+
+        Returns:
+            bool: True when reads may go to the replica
+        """
+        from app.utils.cache import read_version
+
+        fence = read_version(WRITE_FENCE_KEY)
+        max_lag = self.app.config.get('REPLICA_MAX_LAG', 10)
+        now = time.monotonic()
+        state = self._state
+        if state is not None and state[0] == fence and state[1] > now:
+            return state[2]
+
+        if state is not None and state[0] != fence:
+            # A write just committed: the replica may be up to max_lag behind it,
+            # so read from the primary (and refill page caches from it) until then
+            usable, expires_at = False, now + max_lag
+        else:
+            lag = self.measure_lag()
+            usable = lag is not None and lag <= max_lag
+            if not usable:
+                self.app.logger.warning(f"Read replica unavailable or lagging ({lag} s); reading from the primary")
+            expires_at = now + self.app.config.get('REPLICA_LAG_CHECK_INTERVAL', 5)
+
+        with self._lock:
+            self._state = (fence, expires_at, usable)
+        return usable
+
+    def measure_lag(self):
+        """
+        Estimate how far the replica trails the primary.
+
+        PostgreSQL standbys report their replay delay. For SQLite, whose
+        replicas are file copies (sqlite3 .backup, Litestream restore, ...),
+        the lag is how much newer the primary's files are than the replica's.
+
+        Returns:
+            float or None: Lag in seconds, or None when the probe failed
+        """
+        from app.extensions import db
+
+        primary = db.engines[None]
+        replica = db.engines[REPLICA_BIND_KEY]
+        try:
+            if replica.dialect.name == 'postgresql':
+                with replica.connect() as connection:
+                    return float(connection.execute(POSTGRES_LAG_SQL).scalar() or 0)
+            if replica.dialect.name == 'sqlite':
+                return max(0.0, _sqlite_mtime(primary) - _sqlite_mtime(replica))
+        except Exception as e:
+            self.app.logger.error(f"Replica lag probe failed: {e}")
+            return None
+        return 0.0
+
+
+def _sqlite_mtime(engine):
+    """Latest modification time of a SQLite database file and its WAL"""
+    path = engine.url.database
+    times = [os.path.getmtime(path)]
+    if os.path.exists(f"{path}-wal"):
+        times.append(os.path.getmtime(f"{path}-wal"))
+    return max(times)
+
+
+# =========================================
+# ROUTER INSTANCES
+# =========================================
+replica_router = ReplicaRouter()
@@ -1,22 +1,33 @@
 """
 Custom Decorators Module
-Provides custom decorators for route protection:
+Provides custom decorators for route protection and caching:
 - Admin Access Control
 - Authentication Requirements
 - AJAX Endpoint Protection
+- Full-page Response Caching
+- Conditional GET (ETag / Last-Modified) Handling
+- Prerendered Pages Served from Memory
 """
 
 # =========================================
 # STANDARD LIBRARY IMPORTS
 # =========================================
+import hashlib
+from datetime import timezone
 from functools import wraps
 
 # =========================================
 # THIRD-PARTY IMPORTS
 # =========================================
-from flask import abort, redirect, url_for, flash
+from flask import abort, redirect, url_for, flash, current_app, make_response, request, session
 from flask_login import current_user
 
+# =========================================
+# LOCAL APPLICATION IMPORTS
+# =========================================
+from app.extensions import db
+from app.utils.cache import page_cache, prerendered_pages
+
 
 # =========================================
 # AUTHENTICATION DECORATORS
@@ -26,7 +37,8 @@ def admin_required(f):
     """
     Decorator to restrict access to admin users only.
     
-    Checks if user is authenticated and has admin role.
+    Checks if user is authenticated and has admin role. The role comes from
+    the cached identity snapshot, so the check itself runs no query.
     Redirects to login or home page if unauthorized.
     """
     @wraps(f)
@@ -52,4 +64,156 @@ def login_required_ajax(f):
         if not current_user.is_authenticated:
             return {'error': 'Authentication required'}, 401
         return f(*args, **kwargs)
-    return decorated_function
\ No newline at end of file
+    return decorated_function
+
+
+# =========================================
+# CACHING HELPERS
+# =========================================
+
+def etag_matches(etag):
+    """
+    Check the request's If-None-Match header against an ETag.
+    
+    Flask-Compress appends ":<encoding>" to the ETags it sends, so that
+    suffix is ignored. GET validation uses weak comparison.
+    """
+    if not request.if_none_match:
+        return False
+    if request.if_none_match.star_tag:
+        return True
+    client_tags = {tag.split(':', 1)[0] for tag in request.if_none_match.as_set(include_weak=True)}
+    return etag in client_tags
+
+
+# =========================================
+# CACHING DECORATORS
+# =========================================
+
+def cache_page(timeout=300, tags=None):
+    """
+    Decorator to serve anonymous GET requests from the full-page cache.
+    
+    Requests carrying a session (login, flashed messages, CSRF token) are
+    always rendered. Only 200 responses that did not touch the session are
+    stored. Admin routes evict pages with page_cache.purge(tag).
+    
+    Args:
+        timeout: Cache lifetime in seconds for this route
+        tags: Purge tags the page depends on (defaults to the blueprint name)
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if not page_cache.is_cacheable_request():
+                return f(*args, **kwargs)
+            
+            key = page_cache.make_key()
+            cached = page_cache.get(key)
+            if cached is not None:
+                status, headers, body = cached
+                response = current_app.response_class(body, status=status, headers=headers)
+                response.headers['X-Cache'] = 'HIT'
+                return response
+            
+            response = make_response(f(*args, **kwargs))
+            if response.status_code == 200 and not session.modified and not response.direct_passthrough:
+                page_cache.set(key, response, timeout, tags or (request.blueprint,))
+            response.headers['X-Cache'] = 'MISS'
+            return response
+        return decorated_function
+    return decorator
+
+
+def conditional_get(model, id_arg, tags=None):
+    """
+    Decorator to answer conditional GETs on detail pages from the row's updated_at.
+    
+    Only the row's timestamps are queried before the view runs. A matching
+    If-None-Match / If-Modified-Since gets a 304 without rendering; other
+    200 responses are sent with ETag and Last-Modified validators.
+    
+    Detail pages also render related rows (categories) and the env context,
+    which do not touch the row's updated_at. The validators therefore also
+    cover the page-cache tag versions, which admin writes to the section and
+    its categories bump, and the env context fingerprint.
+    
+    Args:
+        model: Model class rendered by the detail page
+        id_arg: Name of the URL argument holding the row id
+        tags: Purge tags the page depends on (defaults to the blueprint name)
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            # Pending flashed messages must be rendered, never answered with a 304
+            if request.method not in ('GET', 'HEAD') or '_flashes' in session:
+                return f(*args, **kwargs)
+            
+            row = db.session.query(model.updated_at, model.created_at) \
+                .filter(model.id == kwargs[id_arg], model.is_active == True).first()
+            modified = row and (row.updated_at or row.created_at)
+            if not modified:
+                return f(*args, **kwargs)
+            
+            tag_versions, purged_at = page_cache.tag_state(tags or (request.blueprint,))
+            env_context = current_app.extensions['env_context']
+            env_context.get()  # Picks up .env changes in debug mode
+            modified = max(t for t in (modified, purged_at, env_context.modified_at) if t is not None)
+            
+            # HTTP dates carry whole seconds only
+            last_modified = modified.replace(microsecond=0, tzinfo=timezone.utc)
+            
+            # The header differs for signed-in users, and ETAG_SALT lets a deploy retire old validators
+            validator = (f"{request.path}|{modified.isoformat()}|{tag_versions}|{env_context.fingerprint}|"
+                         f"{current_user.is_authenticated}|{current_app.config.get('ETAG_SALT', '')}")
+            etag = hashlib.sha1(validator.encode('utf-8')).hexdigest()
+            
+            if request.if_none_match:
+                not_modified = etag_matches(etag)
+            else:
+                not_modified = request.if_modified_since is not None and request.if_modified_since >= last_modified
+            
+            if not_modified:
+                response = current_app.response_class(status=304)
+            else:
+                response = make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            
+            response.set_etag(etag, weak=True)
+            response.last_modified = last_modified
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+        return decorated_function
+    return decorator
+
+
+def prerendered(f):
+    """
+    Decorator to serve a page that depends only on the template env context.
+    
+    The page is rendered once at boot (see PrerenderedPages.warm) and again
+    whenever the env context is rebuilt. Anonymous requests get the bytes
+    from memory with a strong ETag; requests with session state fall
+    through to the view.
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if not page_cache.is_cacheable_request():
+            return f(*args, **kwargs)
+        
+        page = prerendered_pages.get(request.endpoint, lambda: f(*args, **kwargs))
+        if page is None:
+            return f(*args, **kwargs)
+        
+        body, etag = page
+        if etag_matches(etag):
+            response = current_app.response_class(status=304)
+        else:
+            response = current_app.response_class(body, mimetype='text/html')
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+    decorated_function.prerendered = True
+    return decorated_function
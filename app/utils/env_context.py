@@ -0,0 +1,136 @@
+"""
+Template Environment Context Module
+Builds the branding/contact values exposed to templates as `env`:
+- Immutable Mapping Built Once at App Creation
+- Development .env Watcher (mtime based)
+- Content Fingerprint for HTTP Validators
+"""
+
+# =========================================
+# STANDARD LIBRARY IMPORTS
+# =========================================
+import hashlib
+import os
+import threading
+from datetime import datetime
+from types import MappingProxyType
+
+# =========================================
+# THIRD-PARTY IMPORTS
+# =========================================
+from dotenv import find_dotenv, load_dotenv
+
+
+# =========================================
+# CONTEXT KEYS
+# =========================================
+# (config key, fallback) pairs exposed to every template
+ENV_CONTEXT_KEYS = (
+    ('CONTACT_EMAIL', ''),
+    ('SUPPORT_EMAIL', ''),
+    ('CONTACT_PHONE', ''),
+    ('WHATSAPP_NUMBER', ''),
+    ('BUSINESS_ADDRESS_LINE1', ''),
+    ('BUSINESS_ADDRESS_LINE2', ''),
+    ('BUSINESS_COUNTRY', ''),
+    ('TWITTER_URL', '#'),
+    ('LINKEDIN_URL', '#'),
+    ('GITHUB_URL', '#'),
+    ('DISCORD_URL', '#'),
+    ('FACEBOOK_URL', '#'),
+    ('BRAND_NAME', 'Platform'),
+    ('BRAND_TAGLINE', ''),
+    ('COPYRIGHT_YEAR', '2025'),
+    ('COPYRIGHT_TEXT', 'All rights reserved.'),
+)
+
+
+# =========================================
+# HELPER FUNCTIONS
+# =========================================
+
+def build_env_context(config):
+    """
+    Freeze the template `env` values from the application config.
+
+    Args:
+        config: Flask config mapping
+
+    Returns:
+        MappingProxyType: Read-only mapping of the context keys
+    """
+    return MappingProxyType({key: config.get(key, default) for key, default in ENV_CONTEXT_KEYS})
+
+
+def fingerprint_env_context(mapping):
+    """Return a short digest of the mapping's values, equal in every worker that shares them"""
+    return hashlib.sha1(repr(sorted(mapping.items())).encode('utf-8')).hexdigest()[:12]
+
+
+# =========================================
+# ENV CONTEXT HOLDER
+# =========================================
+
+class EnvContext:
+    """
+    Holds the frozen template `env` mapping for an application.
+
+    In production the mapping never changes. In debug mode the .env file's
+    mtime is checked on access and the mapping is rebuilt only when the
+    file was modified. `version` increases on every rebuild so dependent
+    caches (e.g. prerendered pages) can tell when to refresh; `fingerprint`
+    digests the values themselves, so it also changes across restarts and
+    is the same in every worker (used in detail-page ETags).
+    """
+
+    def __init__(self, app, dotenv_path=None):
+        self.app = app
+        self.dotenv_path = dotenv_path if dotenv_path is not None else find_dotenv()
+        self.mapping = build_env_context(app.config)
+        self.fingerprint = fingerprint_env_context(self.mapping)
+        self.version = 0
+        self._mtime = self._read_mtime()
+        self._lock = threading.Lock()
+
+    def _read_mtime(self):
+        if not self.dotenv_path:
+            return None
+        try:
+            return os.stat(self.dotenv_path).st_mtime_ns
+        except OSError:
+            return None
+
+    @property
+    def modified_at(self):
+        """Naive UTC modification time of the .env file, or None without one"""
+        if self._mtime is None:
+            return None
+        return datetime.utcfromtimestamp(self._mtime / 1e9)
+
+    def get(self):
+        """Return the current mapping, reloading .env first in debug mode"""
+        if self.app.debug:
+            self.reload_if_changed()
+        return self.mapping
+
+    def reload_if_changed(self):
+        """Rebuild the mapping if the .env file changed since the last build"""
+        mtime = self._read_mtime()
+        if mtime == self._mtime:
+            return False
+
+        with self._lock:
+            if mtime == self._mtime:
+                return False
+            load_dotenv(self.dotenv_path, override=True)
+
+            # Only the template keys are refreshed; typed settings keep their parsed values
+            for key, _ in ENV_CONTEXT_KEYS:
+                if key in os.environ:
+                    self.app.config[key] = os.environ[key]
+
+            self.mapping = build_env_context(self.app.config)
+            self.fingerprint = fingerprint_env_context(self.mapping)
+            self.version += 1
+            self._mtime = mtime
+        return True
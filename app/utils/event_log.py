@@ -0,0 +1,176 @@
+"""
+Event Log Utilities Module
+Asynchronous, batched inserts for append-only event rows such as Download:
+- Bounded In-process Queue (per worker)
+- Background Batch INSERTs
+- Events Dropped and Counted When the Queue Is Full
+- Failed Batches Re-queued with a Retry Limit
+- Flush on Shutdown
+"""
+
+# =========================================
+# STANDARD LIBRARY IMPORTS
+# =========================================
+import atexit
+import os
+import queue
+import threading
+from datetime import datetime
+
+# =========================================
+# LOCAL APPLICATION IMPORTS
+# =========================================
+from app.extensions import db
+from app.models.download import Download
+
+
+# =========================================
+# EVENT QUEUE
+# =========================================
+
+class EventLog:
+    """
+    Queues rows for one model and inserts them in batches from a daemon thread.
+
+    record() only puts a dict on a bounded queue. The worker waits up to
+    EVENT_LOG_FLUSH_INTERVAL seconds for rows, then inserts up to
+    EVENT_LOG_BATCH_SIZE of them with a single executemany INSERT. When the
+    queue is full the caller waits at most EVENT_LOG_PUT_TIMEOUT seconds and
+    then drops the event and counts it in `dropped`; the request thread never
+    touches the database, so a stalled database cannot slow downloads down.
+
+    A batch that fails to insert is rolled back and its rows are put back on
+    the queue, each up to EVENT_LOG_MAX_ATTEMPTS times, so a short database
+    outage delays events instead of losing them.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.app = None
+        self._queue = None
+        self._pid = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self.dropped = 0
+
+    def init_app(self, app):
+        """Bind the log to an application and flush it at exit"""
+        self.app = app
+        self._queue = queue.Queue(maxsize=app.config.get('EVENT_LOG_QUEUE_SIZE', 1000))
+        atexit.register(self.shutdown)
+
+    def record(self, **values):
+        """
+        Queue one row for insertion.
+
+        Args:
+            **values: Column values; created_at defaults to the time of the event
+        """
+        now = datetime.utcnow()
+        values.setdefault('created_at', now)
+        values.setdefault('updated_at', now)
+        self._ensure_worker()
+
+        try:
+            self._queue.put((0, values), timeout=self.app.config.get('EVENT_LOG_PUT_TIMEOUT', 0.05))
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                dropped = self.dropped
+            self.app.logger.warning(
+                f"{self.model.__tablename__} event queue full; event dropped ({dropped} dropped so far)"
+            )
+
+    def _ensure_worker(self):
+        # Threads do not survive gunicorn's fork, so each worker starts its own
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name=f"{self.model.__tablename__}-writer", daemon=True)
+        self._thread.start()
+
+    def _drain(self, limit=None):
+        """Take up to `limit` queued (attempts, row) entries without blocking"""
+        rows = []
+        while limit is None or len(rows) < limit:
+            try:
+                rows.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return rows
+
+    def _run(self):
+        interval = self.app.config.get('EVENT_LOG_FLUSH_INTERVAL', 2)
+        batch_size = self.app.config.get('EVENT_LOG_BATCH_SIZE', 200)
+        while not self._stopping.is_set():
+            try:
+                first = self._queue.get(timeout=interval)
+            except queue.Empty:
+                continue
+            if not self._insert([first] + self._drain(batch_size - 1)):
+                # Give the database a moment before retrying the re-queued rows
+                self._stopping.wait(interval)
+
+    def _insert(self, entries):
+        """
+        Insert queued entries in one transaction.
+
+        Failures are logged, not raised: the transaction is rolled back and
+        the rows are re-queued until they reach EVENT_LOG_MAX_ATTEMPTS.
+
+        Args:
+            entries: List of (attempts, row) tuples taken from the queue
+
+        Returns:
+            int: Number of rows written
+        """
+        if not entries:
+            return 0
+        try:
+            with self.app.app_context(), db.engine.begin() as connection:
+                connection.execute(self.model.__table__.insert(), [row for _, row in entries])
+        except Exception as e:
+            self._requeue(entries, e)
+            return 0
+        return len(entries)
+
+    def _requeue(self, entries, error):
+        """Put the rows of a failed batch back on the queue, dropping those out of attempts"""
+        max_attempts = self.app.config.get('EVENT_LOG_MAX_ATTEMPTS', 5)
+        dropped = 0
+        for attempts, row in entries:
+            if attempts + 1 >= max_attempts:
+                dropped += 1
+                continue
+            try:
+                self._queue.put_nowait((attempts + 1, row))
+            except queue.Full:
+                dropped += 1
+        self.app.logger.error(
+            f"Failed to insert {len(entries)} {self.model.__tablename__} rows "
+            f"({len(entries) - dropped} re-queued, {dropped} dropped): {error}"
+        )
+
+    def flush(self):
+        """Insert everything queued so far; returns the number of rows written"""
+        if self._queue is None:
+            return 0
+        return self._insert(self._drain())
+
+    def shutdown(self):
+        """Stop the worker and write whatever is still queued"""
+        self._stopping.set()
+        if self._thread is not None and self._pid == os.getpid():
+            # Let an in-flight batch finish before draining the rest
+            self._thread.join(timeout=self.app.config.get('EVENT_LOG_FLUSH_INTERVAL', 2) + 5)
+        self.flush()
+
+
+# =========================================
+# EVENT LOG INSTANCES
+# =========================================
+download_log = EventLog(Download)
@@ -0,0 +1,292 @@
+"""
+Static Export Utilities Module
+`flask freeze` renders the public portfolio into plain files:
+- Public Endpoint Discovery (routes, content rows, in-page links)
+- Query-string Pages Mapped to Static Paths
+- Sitemap Generation
+- Static Asset Copy (including content-hashed names)
+"""
+
+# =========================================
+# STANDARD LIBRARY IMPORTS
+# =========================================
+import html
+import os
+import re
+import shutil
+from collections import deque
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl, urlencode, urlsplit
+from xml.sax.saxutils import escape
+
+# =========================================
+# THIRD-PARTY IMPORTS
+# =========================================
+import click
+from flask import current_app
+from werkzeug.exceptions import HTTPException
+from werkzeug.routing import RequestRedirect
+
+# =========================================
+# LOCAL APPLICATION IMPORTS
+# =========================================
+from app.models.blog_post import BlogPost
+from app.models.project import Project
+from app.models.project_category import ProjectCategory
+from app.models.service import Service
+from app.models.study_material import StudyMaterial
+from app.models.study_material_category import StudyMaterialCategory
+from app.models.youtube_video import YouTubeVideo
+from app.utils.assets import PRECOMPRESSED_SUFFIXES
+
+
+# =========================================
+# EXPORT CONSTANTS
+# =========================================
+# Blueprints whose GET pages can be served as static files
+PUBLIC_BLUEPRINTS = ('pages', 'projects', 'services', 'study_material', 'youtube')
+
+# Endpoints that need the live application (forms, download tracking) or only
+# serve fragments for in-page updates, which ignore the query string once frozen
+DYNAMIC_ENDPOINTS = {
+    'pages.contact',
+    'projects.download_project',
+    'study_material.download_material',
+    'study_material.materials_grid',
+}
+
+# WSGI environ flag set on every request the freezer renders; templates check
+# it to drop features that need the live application
+STATIC_EXPORT_ENVIRON_KEY = 'portfolio.static_export'
+
+# Detail endpoints are seeded from the database: endpoint -> (model, URL argument)
+DETAIL_ENDPOINTS = {
+    'pages.blog_detail': (BlogPost, 'blog_id'),
+    'projects.project_detail': (Project, 'project_id'),
+    'services.service_detail': (Service, 'service_id'),
+    'study_material.material_detail': (StudyMaterial, 'material_id'),
+    'youtube.video_detail': (YouTubeVideo, 'video_id'),
+}
+
+# Listings filtered by ?category=<name>, reached through filter buttons rather
+# than links: endpoint -> category model
+CATEGORY_LISTINGS = {
+    'projects.projects_list': ProjectCategory,
+    'study_material.materials_list': StudyMaterialCategory,
+}
+
+HREF_PATTERN = re.compile(r'href="([^"]*)"')
+
+
+# =========================================
+# HELPER FUNCTIONS
+# =========================================
+
+def slugify(value):
+    """Return a filesystem- and URL-safe version of a query value"""
+    return re.sub(r'[^a-z0-9]+', '-', value.lower()).strip('-') or 'none'
+
+
+def normalize_url(url):
+    """
+    Return a site-relative URL with its query arguments sorted, or None.
+
+    External links, fragments and anything outside the application are
+    ignored so only pages the app itself renders are followed.
+    """
+    parts = urlsplit(html.unescape(url))
+    if parts.scheme or parts.netloc or not parts.path.startswith('/'):
+        return None
+    args = sorted(parse_qsl(parts.query))
+    return parts.path + (f"?{urlencode(args)}" if args else '')
+
+
+def output_path(url, is_html):
+    """
+    Map a normalized URL to the file it is written to, relative to the output root.
+
+    '/projects?category=Web Apps&page=2' becomes
+    'projects/category/web-apps/page/2/index.html'.
+    """
+    path, _, query = url.partition('?')
+    segments = [segment for segment in path.split('/') if segment]
+    for key, value in parse_qsl(query):
+        segments.extend([slugify(key), slugify(value)])
+
+    if is_html:
+        segments.append('index.html')
+    return '/'.join(segments) or 'index.html'
+
+
+def public_url(filename):
+    """Return the URL a file server exposes a written file under"""
+    if filename.endswith('index.html'):
+        return '/' + filename[:-len('index.html')]
+    return '/' + filename
+
+
+def is_public_endpoint(endpoint):
+    """Check whether an endpoint belongs in the static export"""
+    blueprint = endpoint.partition('.')[0]
+    return blueprint in PUBLIC_BLUEPRINTS and endpoint not in DYNAMIC_ENDPOINTS
+
+
+# =========================================
+# STATIC SITE FREEZER
+# =========================================
+
+class Freezer:
+    """
+    Renders every public page of an application into a directory.
+
+    Pages are requested through the test client, so they go through the same
+    views, templates and context processors as live traffic. Links between
+    frozen pages are rewritten to their static paths; links to dynamic
+    endpoints (contact form, downloads, admin) are left pointing at the
+    live application.
+    """
+
+    def __init__(self, app, destination, base_url=''):
+        self.app = app
+        self.destination = destination
+        self.base_url = base_url.rstrip('/')
+        self.adapter = app.url_map.bind('localhost')
+        self.pages = {}
+
+    def seed_urls(self):
+        """Return the URLs of every argument-free public GET route, category listing and detail page"""
+        urls = []
+        for rule in self.app.url_map.iter_rules():
+            if 'GET' in rule.methods and not rule.arguments and is_public_endpoint(rule.endpoint):
+                urls.append(rule.rule)
+
+        for endpoint, (model, id_arg) in DETAIL_ENDPOINTS.items():
+            rows = model.query.with_entities(model.id).filter(model.is_active == True).order_by(model.id)
+            urls.extend(self.adapter.build(endpoint, {id_arg: row.id}) for row in rows)
+
+        for endpoint, model in CATEGORY_LISTINGS.items():
+            rows = model.query.with_entities(model.name).order_by(model.name)
+            urls.extend(self.adapter.build(endpoint, {'category': row.name}) for row in rows)
+        return urls
+
+    def endpoint_for(self, url):
+        """Resolve a normalized URL to its endpoint, or None if it is not served"""
+        path = url.partition('?')[0]
+        if path.startswith(self.app.static_url_path + '/'):
+            return None
+        try:
+            endpoint, _ = self.adapter.match(path, method='GET')
+        except (HTTPException, RequestRedirect):
+            return None
+        return endpoint
+
+    def crawl(self):
+        """Render the seed URLs and every public page they link to"""
+        queue = deque(normalize_url(url) for url in self.seed_urls())
+        seen = set(queue)
+
+        with self.app.test_client() as client:
+            client.environ_base[STATIC_EXPORT_ENVIRON_KEY] = True
+            while queue:
+                url = queue.popleft()
+                response = client.get(url)
+                if response.status_code != 200:
+                    click.echo(f"Skipped {url} ({response.status_code})")
+                    continue
+
+                is_html = response.mimetype == 'text/html'
+                body = response.get_data()
+                self.pages[url] = (output_path(url, is_html), is_html, body)
+                if not is_html:
+                    continue
+
+                for href in HREF_PATTERN.findall(body.decode('utf-8')):
+                    link = normalize_url(href)
+                    if link and link not in seen and is_public_endpoint(self.endpoint_for(link) or ''):
+                        seen.add(link)
+                        queue.append(link)
+
+    def rewrite_links(self, body):
+        """Point links to frozen pages at their static paths"""
+        def replace(match):
+            link = normalize_url(match.group(1))
+            page = self.pages.get(link)
+            if page is None:
+                return match.group(0)
+            fragment = urlsplit(html.unescape(match.group(1))).fragment
+            target = public_url(page[0]) + (f"#{fragment}" if fragment else '')
+            return f'href="{html.escape(target)}"'
+
+        return HREF_PATTERN.sub(replace, body.decode('utf-8')).encode('utf-8')
+
+    def write_pages(self):
+        """Write every rendered page below the destination"""
+        for filename, is_html, body in self.pages.values():
+            path = os.path.join(self.destination, *filename.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as fh:
+                fh.write(self.rewrite_links(body) if is_html else body)
+
+    def has_absolute_base_url(self):
+        """Check whether the base URL can prefix sitemap locations (which must be absolute)"""
+        parts = urlsplit(self.base_url)
+        return parts.scheme in ('http', 'https') and bool(parts.netloc)
+
+    def write_sitemap(self):
+        """Write sitemap.xml listing every frozen HTML page"""
+        today = datetime.now(timezone.utc).date().isoformat()
+        urls = sorted({public_url(filename) for filename, is_html, _ in self.pages.values() if is_html})
+        entries = ''.join(
+            f"  <url><loc>{escape(self.base_url + url)}</loc><lastmod>{today}</lastmod></url>\n"
+            for url in urls
+        )
+        with open(os.path.join(self.destination, 'sitemap.xml'), 'w', encoding='utf-8') as fh:
+            fh.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                     '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+                     f"{entries}</urlset>\n")
+
+    def copy_static(self):
+        """Copy the static folder, adding the content-hashed names the pages reference"""
+        target = os.path.join(self.destination, self.app.static_url_path.strip('/'))
+        ignored = shutil.ignore_patterns(*(f"*{suffix}" for suffix in PRECOMPRESSED_SUFFIXES.values()))
+        shutil.copytree(self.app.static_folder, target, ignore=ignored, dirs_exist_ok=True)
+
+        manifest = self.app.extensions['asset_manifest']
+        for hashed_name, original in manifest.originals.items():
+            source = os.path.join(self.app.static_folder, original)
+            if os.path.isfile(source):
+                shutil.copy2(source, os.path.join(target, hashed_name))
+
+    def freeze(self):
+        """Run the full export and return the number of pages written"""
+        self.crawl()
+        os.makedirs(self.destination, exist_ok=True)
+        self.write_pages()
+        if self.has_absolute_base_url():
+            self.write_sitemap()
+        else:
+            click.echo("Warning: skipped sitemap.xml; set --base-url or FREEZE_BASE_URL to the absolute "
+                       "site URL (e.g. https://example.com)", err=True)
+        self.copy_static()
+        return len(self.pages)
+
+
+# =========================================
+# CLI COMMANDS
+# =========================================
+
+@click.command('freeze')
+@click.option('--destination', '-d', default=None, help='Output directory (defaults to FREEZE_DESTINATION).')
+@click.option('--base-url', default=None, help='Absolute site URL used in sitemap.xml (defaults to FREEZE_BASE_URL).')
+@click.option('--clean/--no-clean', default=True, help='Empty the output directory first.')
+def freeze_command(destination, base_url, clean):
+    """Export the public pages as a static site"""
+    app = current_app._get_current_object()
+    destination = os.path.abspath(destination or app.config['FREEZE_DESTINATION'])
+    base_url = base_url if base_url is not None else app.config['FREEZE_BASE_URL']
+
+    if clean and os.path.isdir(destination):
+        shutil.rmtree(destination)
+
+    written = Freezer(app, destination, base_url).freeze()
+    click.echo(f"Froze {written} pages into {destination}")
@@ -0,0 +1,114 @@
+"""
+Identity Utilities Module
+Lightweight user identities for Flask-Login's user_loader:
+- Immutable User Snapshots (id, username, role, is_active)
+- Short-TTL Per-worker Identity Cache
+- Cross-worker Invalidation via Version Stamps
+"""
+
+# =========================================
+# STANDARD LIBRARY IMPORTS
+# =========================================
+import threading
+import time
+
+# =========================================
+# THIRD-PARTY IMPORTS
+# =========================================
+from flask import current_app
+from flask_login import UserMixin
+
+# =========================================
+# LOCAL APPLICATION IMPORTS
+# =========================================
+from app.extensions import db
+from app.utils.cache import bump_version, read_version
+from app.utils.constants import ROLE_ADMIN
+
+
+# =========================================
+# USER SNAPSHOT
+# =========================================
+
+class UserSnapshot(UserMixin):
+    """
+    Read-only stand-in for a User row, used as `current_user`.
+
+    Carries only what requests read from the signed-in user, so checking
+    authentication or the admin role never touches the database. Code that
+    needs the full row loads it explicitly with User.query.get(current_user.id).
+    """
+
+    __slots__ = ('id', 'username', 'role', 'is_active')
+
+    def __init__(self, id, username, role, is_active):
+        self.id = id
+        self.username = username
+        self.role = role
+        self.is_active = bool(is_active)
+
+    def is_admin(self):
+        """Check if the user has admin privileges"""
+        return self.role == ROLE_ADMIN
+
+    def __repr__(self):
+        return f"UserSnapshot({self.id}, '{self.username}', '{self.role}')"
+
+
+# =========================================
+# IDENTITY CACHE
+# =========================================
+
+class IdentityCache:
+    """
+    Per-worker cache of UserSnapshot objects keyed by user id.
+
+    Entries expire after IDENTITY_CACHE_TTL seconds. Changing a user's role
+    or status must call invalidate(), which bumps a per-user version stamp
+    so every worker drops its snapshot on that user's next request.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _stamp_key(user_id):
+        return f"identity_{user_id}"
+
+    def get(self, user_id):
+        """
+        Return the snapshot for a user id, loading it on a miss.
+
+        Returns:
+            UserSnapshot or None: None when the user no longer exists
+        """
+        from app.models.user import User
+
+        version = read_version(self._stamp_key(user_id))
+        entry = self._entries.get(user_id)
+        if entry is not None and entry[0] == version and entry[1] > time.monotonic():
+            return entry[2]
+
+        row = db.session.query(User.id, User.username, User.role, User.is_active) \
+            .filter(User.id == user_id).first()
+        if row is None:
+            return None
+
+        snapshot = UserSnapshot(row.id, row.username, row.role, row.is_active)
+        expires_at = time.monotonic() + current_app.config.get('IDENTITY_CACHE_TTL', 60)
+        with self._lock:
+            self._entries[user_id] = (version, expires_at, snapshot)
+        return snapshot
+
+    def invalidate(self, user_id):
+        """Drop a user's snapshot in every worker"""
+        bump_version(self._stamp_key(user_id))
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+
+# =========================================
+# IDENTITY INSTANCES
+# =========================================
+identity_cache = IdentityCache()
@@ -0,0 +1,203 @@
+"""
+Pagination Utilities Module
+Cursor-based pagination for the public listing pages:
+- Keyset Pagination on (created_at, id)
+- Opaque, Signed Next/Prev Cursor Tokens
+- Approximate Totals Cached per Filter
+"""
+
+# =========================================
+# STANDARD LIBRARY IMPORTS
+# =========================================
+import math
+import threading
+import time
+from datetime import datetime
+
+# =========================================
+# THIRD-PARTY IMPORTS
+# =========================================
+from flask import current_app
+from itsdangerous import BadData, URLSafeSerializer
+from sqlalchemy import tuple_
+
+
+# =========================================
+# PAGINATION CONSTANTS
+# =========================================
+CURSOR_SALT = 'keyset-cursor'
+DIRECTION_NEXT = 'n'
+DIRECTION_PREV = 'p'
+
+
+# =========================================
+# CURSOR TOKENS
+# =========================================
+
+def _serializer():
+    return URLSafeSerializer(current_app.config['SECRET_KEY'], salt=CURSOR_SALT)
+
+
+def encode_cursor(row, direction, page):
+    """
+    Build an opaque token pointing just past a row.
+
+    Args:
+        row: Boundary row (last row for next, first row for prev)
+        direction: DIRECTION_NEXT or DIRECTION_PREV
+        page: Page number the token leads to
+
+    Returns:
+        str: URL-safe signed token
+    """
+    return _serializer().dumps([row.created_at.isoformat(), row.id, direction, page])
+
+
+def decode_cursor(token):
+    """
+    Decode a cursor token.
+
+    Tampered, malformed or outdated (e.g. after a SECRET_KEY change) tokens
+    fall back to the first page instead of failing the request.
+
+    Returns:
+        tuple or None: (created_at, id, direction, page), None for the first page
+    """
+    if not token:
+        return None
+    try:
+        created_at, row_id, direction, page = _serializer().loads(token)
+        return datetime.fromisoformat(created_at), int(row_id), direction, int(page)
+    except (BadData, ValueError, TypeError):
+        return None
+
+
+# =========================================
+# APPROXIMATE TOTALS
+# =========================================
+
+class ApproximateCounts:
+    """
+    Per-worker cache of listing totals, keyed by filter.
+
+    Totals are only used for "N items" and "page X of Y" labels, so a count
+    that is up to PAGINATION_TOTAL_TTL seconds old is good enough and saves
+    a COUNT(*) on every request.
+    """
+
+    def __init__(self):
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, query):
+        """
+        Return the cached total for a filter key, counting the query on a miss.
+
+        Args:
+            key: Filter key, e.g. 'projects:All'
+            query: Unordered query matching the listing
+        """
+        entry = self._counts.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        total = query.order_by(None).count()
+        ttl = current_app.config.get('PAGINATION_TOTAL_TTL', 300)
+        with self._lock:
+            self._counts[key] = (time.monotonic() + ttl, total)
+        return total
+
+    def clear(self):
+        """Drop every cached total held by this worker"""
+        with self._lock:
+            self._counts.clear()
+
+
+approximate_counts = ApproximateCounts()
+
+
+# =========================================
+# KEYSET PAGINATION
+# =========================================
+
+class KeysetPage:
+    """
+    One page of a keyset-paginated listing.
+
+    Exposes `items`, `page`, `pages`, `total`, `has_prev` and `has_next` like
+    Flask-SQLAlchemy's Pagination, plus `prev_cursor` / `next_cursor` tokens
+    for the navigation links. `prev_cursor` is None when the previous page is
+    the first one, so that link points at the plain listing URL.
+    """
+
+    def __init__(self, items, per_page, page, has_prev, has_next, prev_cursor, next_cursor, total=None):
+        self.items = items
+        self.per_page = per_page
+        self.page = page
+        self.has_prev = has_prev
+        self.has_next = has_next
+        self.prev_cursor = prev_cursor
+        self.next_cursor = next_cursor
+        self.total = total
+
+    @property
+    def pages(self):
+        """Approximate page count; never less than the pages known to exist"""
+        known = self.page + (1 if self.has_next else 0)
+        if self.total is None:
+            return known
+        return max(math.ceil(self.total / self.per_page), known)
+
+
+def keyset_paginate(query, model, per_page, cursor=None, total_key=None):
+    """
+    Paginate a query newest-first on (created_at, id) without OFFSET or COUNT.
+
+    Each page seeks past the boundary row carried in the cursor, so deep
+    pages cost the same as the first one and can use the
+    (is_active, created_at) listing indexes.
+
+    Args:
+        query: Filtered, unordered query of `model`
+        model: Model class with created_at and id columns
+        per_page: Number of items per page
+        cursor: Token from a previous page's next/prev link
+        total_key: Optional filter key; when given, an approximate cached
+            total is attached to the page
+
+    Returns:
+        KeysetPage: The requested page
+    """
+    sort_key = tuple_(model.created_at, model.id)
+    position = decode_cursor(cursor)
+
+    if position is None:
+        direction, page = DIRECTION_NEXT, 1
+        page_query = query.order_by(model.created_at.desc(), model.id.desc())
+    else:
+        created_at, row_id, direction, page = position
+        if direction == DIRECTION_PREV:
+            page_query = query.filter(sort_key > tuple_(created_at, row_id)) \
+                .order_by(model.created_at.asc(), model.id.asc())
+        else:
+            page_query = query.filter(sort_key < tuple_(created_at, row_id)) \
+                .order_by(model.created_at.desc(), model.id.desc())
+
+    # One extra row tells whether another page exists in the scan direction
+    rows = page_query.limit(per_page + 1).all()
+    has_more = len(rows) > per_page
+    items = rows[:per_page]
+
+    if direction == DIRECTION_PREV:
+        items.reverse()
+        has_prev, has_next = has_more, True
+        if not has_prev:
+            page = 1
+    else:
+        has_prev, has_next = page > 1, has_more
+
+    next_cursor = encode_cursor(items[-1], DIRECTION_NEXT, page + 1) if has_next and items else None
+    prev_cursor = encode_cursor(items[0], DIRECTION_PREV, page - 1) if has_prev and items and page > 2 else None
+
+    total = approximate_counts.get(total_key, query) if total_key else None
+    return KeysetPage(items, per_page, page, has_prev, has_next, prev_cursor, next_cursor, total)
@@ -0,0 +1,66 @@
+"""
+Query Options Module
+Loader options shared by listing queries, so related rows used by the
+templates are fetched in bulk instead of once per item:
+- Project Listings (category)
+- Video and Study Material Listings (category)
+- Blog Listings (full post body left unloaded)
+"""
+
+# =========================================
+# THIRD-PARTY IMPORTS
+# =========================================
+from sqlalchemy.orm import defer, joinedload
+
+# =========================================
+# LOCAL APPLICATION IMPORTS
+# =========================================
+from app.models.blog_post import BlogPost
+from app.models.project import Project
+from app.models.study_material import StudyMaterial
+from app.models.youtube_video import YouTubeVideo
+
+
+# =========================================
+# PROJECT QUERY OPTIONS
+# =========================================
+
+def project_listing_options():
+    """
+    Loader options for pages that render `project.category` per row.
+
+    The category is many-to-one, so it is joined into the page query without
+    multiplying rows, and LIMIT-based pagination stays correct.
+
+    Returns:
+        tuple: Options to pass to Query.options()
+    """
+    return (joinedload(Project.project_category),)
+
+
+# =========================================
+# VIDEO & MATERIAL QUERY OPTIONS
+# =========================================
+
+def video_listing_options():
+    """Loader options for pages that render `video.category` per row"""
+    return (joinedload(YouTubeVideo.video_category),)
+
+
+def material_listing_options():
+    """Loader options for pages that render `material.category` per row"""
+    return (joinedload(StudyMaterial.material_category),)
+
+
+# =========================================
+# BLOG QUERY OPTIONS
+# =========================================
+
+def blog_listing_options():
+    """
+    Loader options for the blog listing, which shows `post.excerpt`.
+
+    `content` is deferred with raiseload, so a template that reaches for the
+    full body raises instead of issuing one query per post.
+    """
+    return (defer(BlogPost.content, raiseload=True),)
@@ -0,0 +1,314 @@
+"""
+Search Utilities Module
+Unified full-text search across blog posts, projects, services, study
+materials and videos:
+- One `search_index` Table (SQLite FTS5 or PostgreSQL tsvector + GIN)
+- Incremental Updates from the Admin Save/Delete Routes
+- Ranked, Paginated Queries with Highlighted Snippets
+- `flask search rebuild` CLI Command
+
+The table is created by a migration that picks the backend-specific
+definition, so it is not part of the SQLAlchemy metadata.
+"""
+
+# =========================================
+# STANDARD LIBRARY IMPORTS
+# =========================================
+import math
+import re
+
+# =========================================
+# THIRD-PARTY IMPORTS
+# =========================================
+import click
+from flask import current_app, url_for
+from flask.cli import AppGroup
+from markupsafe import Markup, escape
+from sqlalchemy import text
+
+# =========================================
+# LOCAL APPLICATION IMPORTS
+# =========================================
+from app.extensions import db
+from app.models.blog_post import BlogPost
+from app.models.project import Project
+from app.models.service import Service
+from app.models.study_material import StudyMaterial
+from app.models.youtube_video import YouTubeVideo
+
+
+# =========================================
+# SEARCHABLE CONTENT
+# =========================================
+SEARCH_TABLE = 'search_index'
+
+# Snippet highlight markers; escaped text is wrapped in <mark> afterwards,
+# so stored content can never inject markup into results
+HIGHLIGHT_START = '\x02'
+HIGHLIGHT_END = '\x03'
+
+
+class SearchType:
+    """How one model is indexed and linked from search results"""
+
+    def __init__(self, model, label, endpoint, id_arg, body):
+        self.model = model
+        self.label = label
+        self.endpoint = endpoint
+        self.id_arg = id_arg
+        self.body = body
+
+
+# item_type -> SearchType
+SEARCH_TYPES = {
+    'blog': SearchType(BlogPost, 'Blog', 'pages.blog_detail', 'blog_id',
+                       lambda post: Markup(post.content or '').striptags()),
+    'project': SearchType(Project, 'Project', 'projects.project_detail', 'project_id',
+                          lambda project: project.description),
+    'service': SearchType(Service, 'Service', 'services.service_detail', 'service_id',
+                          lambda service: service.description),
+    'material': SearchType(StudyMaterial, 'Study Material', 'study_material.material_detail', 'material_id',
+                           lambda material: material.description),
+    'video': SearchType(YouTubeVideo, 'Video', 'youtube.video_detail', 'video_id',
+                        lambda video: video.description),
+}
+
+MODEL_TYPES = {search_type.model: item_type for item_type, search_type in SEARCH_TYPES.items()}
+
+
+# =========================================
+# BACKEND QUERIES
+# =========================================
+# bm25() is lower-is-better; titles weigh 10x the body. Ties are broken by
+# key so OFFSET pages never repeat or skip a hit
+SQLITE_SEARCH_SQL = """
+    SELECT item_type, item_id, title,
+           snippet(search_index, 1, :mark_start, :mark_end, '...', 24) AS snippet,
+           bm25(search_index, 10.0, 1.0) AS rank
+    FROM search_index
+    WHERE search_index MATCH :query {type_filter}
+    ORDER BY rank, item_type, item_id
+    LIMIT :limit OFFSET :offset
+"""
+SQLITE_COUNT_SQL = "SELECT count(*) FROM search_index WHERE search_index MATCH :query {type_filter}"
+
+POSTGRES_SEARCH_SQL = """
+    SELECT item_type, item_id, title,
+           ts_headline('english', body, query, :headline_options) AS snippet,
+           ts_rank_cd(document, query) AS rank
+    FROM search_index, websearch_to_tsquery('english', :query) AS query
+    WHERE document @@ query {type_filter}
+    ORDER BY rank DESC, item_type, item_id
+    LIMIT :limit OFFSET :offset
+"""
+POSTGRES_COUNT_SQL = """
+    SELECT count(*) FROM search_index, websearch_to_tsquery('english', :query) AS query
+    WHERE document @@ query {type_filter}
+"""
+
+
+def fts5_query(terms):
+    """
+    Turn free text into a safe FTS5 MATCH expression.
+
+    Every word is quoted, so FTS5 operators and punctuation in user input are
+    matched literally; the last word also matches as a prefix (search-as-you-type).
+
+    Args:
+        terms: Raw query string
+
+    Returns:
+        str: MATCH expression, or '' when the input has no words
+    """
+    words = re.findall(r'\w+', terms.lower())
+    if not words:
+        return ''
+    quoted = [f'"{word}"' for word in words]
+    quoted[-1] += '*'
+    return ' '.join(quoted)
+
+
+def highlight(snippet):
+    """Escape a raw snippet and turn the highlight markers into <mark> tags"""
+    return Markup(str(escape(snippet or ''))
+                  .replace(HIGHLIGHT_START, '<mark>')
+                  .replace(HIGHLIGHT_END, '</mark>'))
+
+
+# =========================================
+# SEARCH RESULTS
+# =========================================
+
+class SearchHit:
+    """One ranked search result"""
+
+    def __init__(self, item_type, item_id, title, snippet, rank):
+        search_type = SEARCH_TYPES[item_type]
+        self.item_type = item_type
+        self.item_id = item_id
+        self.label = search_type.label
+        self.title = title
+        self.snippet = highlight(snippet)
+        self.rank = rank
+        self.url = url_for(search_type.endpoint, **{search_type.id_arg: item_id})
+
+    def to_dict(self):
+        """Serialize for the JSON API"""
+        return {
+            'type': self.item_type,
+            'id': self.item_id,
+            'label': self.label,
+            'title': self.title,
+            'snippet': str(self.snippet),
+            'url': self.url,
+        }
+
+
+class SearchResults:
+    """A page of search hits with the attributes the pagination templates use"""
+
+    def __init__(self, items, page, per_page, total):
+        self.items = items
+        self.page = page
+        self.per_page = per_page
+        self.total = total
+        self.pages = max(1, math.ceil(total / per_page)) if per_page else 1
+        self.has_prev = page > 1
+        self.has_next = page < self.pages
+        self.prev_num = page - 1 if self.has_prev else None
+        self.next_num = page + 1 if self.has_next else None
+
+
+# =========================================
+# SEARCH INDEX
+# =========================================
+
+class SearchIndex:
+    """
+    Reads and writes the `search_index` table.
+
+    update() and remove() run in the caller's session, so an admin save and
+    its index change commit (or roll back) together. Only active items are
+    indexed; saving an inactive item removes it from the index.
+    """
+
+    @staticmethod
+    def _dialect():
+        return db.engine.dialect.name
+
+    @staticmethod
+    def _key(item):
+        return MODEL_TYPES[type(item)], item.id
+
+    def update(self, item):
+        """
+        Re-index one item (call before committing the admin save).
+
+        Args:
+            item: BlogPost, Project, Service, StudyMaterial or YouTubeVideo
+        """
+        if item.id is None:
+            db.session.flush()
+        self.remove(item)
+        if not item.is_active:
+            return
+        item_type, item_id = self._key(item)
+        db.session.execute(
+            text("INSERT INTO search_index (item_type, item_id, title, body) "
+                 "VALUES (:item_type, :item_id, :title, :body)"),
+            {'item_type': item_type, 'item_id': item_id, 'title': item.title or '',
+             'body': SEARCH_TYPES[item_type].body(item) or ''},
+        )
+
+    def remove(self, item):
+        """Drop one item from the index (call before committing the delete)"""
+        item_type, item_id = self._key(item)
+        db.session.execute(
+            text("DELETE FROM search_index WHERE item_type = :item_type AND item_id = :item_id"),
+            {'item_type': item_type, 'item_id': item_id},
+        )
+
+    def rebuild(self):
+        """
+        Re-index every active item from scratch.
+
+        Returns:
+            int: Number of items indexed
+        """
+        db.session.execute(text("DELETE FROM search_index"))
+        indexed = 0
+        for search_type in SEARCH_TYPES.values():
+            for item in search_type.model.query.filter_by(is_active=True).all():
+                self.update(item)
+                indexed += 1
+        db.session.commit()
+        return indexed
+
+    def search(self, terms, item_type=None, page=1, per_page=None):
+        """
+        Run a ranked full-text query.
+
+        Args:
+            terms: Free-text query
+            item_type: Optional key of SEARCH_TYPES to restrict results
+            page: 1-based page number
+            per_page: Results per page (defaults to SEARCH_PER_PAGE)
+
+        Returns:
+            SearchResults: Best matches first
+        """
+        per_page = per_page or current_app.config.get('SEARCH_PER_PAGE', 10)
+        params = {'limit': per_page, 'offset': (page - 1) * per_page}
+        type_filter = ''
+        if item_type in SEARCH_TYPES:
+            type_filter = 'AND item_type = :item_type'
+            params['item_type'] = item_type
+
+        if self._dialect() == 'postgresql':
+            if not terms.strip():
+                return SearchResults([], page, per_page, 0)
+            params.update(query=terms, headline_options=(
+                f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, MaxWords=35, MinWords=15"))
+            search_sql, count_sql = POSTGRES_SEARCH_SQL, POSTGRES_COUNT_SQL
+        else:
+            match = fts5_query(terms)
+            if not match:
+                return SearchResults([], page, per_page, 0)
+            params.update(query=match, mark_start=HIGHLIGHT_START, mark_end=HIGHLIGHT_END)
+            search_sql, count_sql = SQLITE_SEARCH_SQL, SQLITE_COUNT_SQL
+
+        total = db.session.execute(text(count_sql.format(type_filter=type_filter)), params).scalar()
+        rows = db.session.execute(text(search_sql.format(type_filter=type_filter)), params).all() if total else []
+        items = [SearchHit(row.item_type, row.item_id, row.title, row.snippet, row.rank) for row in rows]
+        return SearchResults(items, page, per_page, total)
+
+
+def exclude_search_tables(obj, name, type_, reflected, compare_to):
+    """
+    Alembic include_object hook: skip the search table and FTS5 shadow tables.
+
+    They are created by raw DDL in their migration, so autogenerate must not
+    try to drop them.
+    """
+    if type_ == 'table' and name and (name == SEARCH_TABLE or name.startswith(f"{SEARCH_TABLE}_")):
+        return False
+    return True
+
+
+# =========================================
+# SEARCH INSTANCES
+# =========================================
+search_index = SearchIndex()
+
+
+# =========================================
+# CLI COMMANDS
+# =========================================
+search_cli = AppGroup('search', help='Manage the full-text search index.')
+
+
+@search_cli.command('rebuild')
+def rebuild_search_index():
+    """Re-index every active blog post, project, service, material and video"""
+    indexed = search_index.rebuild()
+    click.echo(f"Indexed {indexed} items.")
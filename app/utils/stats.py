@@ -0,0 +1,112 @@
+"""
+Statistics Utilities Module
+Row counts shown on the admin dashboard:
+- All Counts in One SELECT of Scalar Subqueries
+- Short-TTL Per-worker Cache
+- Per-count Invalidation via Version Stamps
+"""
+
+# =========================================
+# STANDARD LIBRARY IMPORTS
+# =========================================
+import threading
+import time
+
+# =========================================
+# THIRD-PARTY IMPORTS
+# =========================================
+from flask import current_app
+from sqlalchemy import func, select
+
+# =========================================
+# LOCAL APPLICATION IMPORTS
+# =========================================
+from app.extensions import db
+from app.models.blog_post import BlogPost
+from app.models.home_page import Skill, TeamMember
+from app.models.inquiry import Inquiry
+from app.models.project import Project
+from app.models.service import Service
+from app.models.study_material import StudyMaterial
+from app.models.user import User
+from app.models.youtube_video import YouTubeVideo
+from app.utils.cache import bump_version, read_version
+
+
+# =========================================
+# DASHBOARD COUNTS
+# =========================================
+# Template variable -> model counted
+DASHBOARD_COUNTS = {
+    'user_count': User,
+    'service_count': Service,
+    'project_count': Project,
+    'material_count': StudyMaterial,
+    'video_count': YouTubeVideo,
+    'inquiry_count': Inquiry,
+    'blog_count': BlogPost,
+    'skill_count': Skill,
+    'team_count': TeamMember,
+}
+
+
+# =========================================
+# DASHBOARD STATS PROVIDER
+# =========================================
+
+class DashboardStats:
+    """
+    Cached dashboard counts, refreshed only where they changed.
+
+    Each count keeps the version stamp it was loaded under. Create/delete
+    routes call invalidate() for the counts they affect, which bumps the
+    stamp in every worker; the next get() recounts just those in a single
+    query. ADMIN_STATS_TTL bounds staleness for rows added outside the
+    instrumented routes (e.g. create_admin.py).
+    """
+
+    def __init__(self):
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _stamp_key(name):
+        return f"stats_{name}"
+
+    def get(self):
+        """
+        Return every dashboard count, recounting stale ones in one SELECT.
+
+        Returns:
+            dict: Template variable name -> row count
+        """
+        now = time.monotonic()
+        versions = {name: read_version(self._stamp_key(name)) for name in DASHBOARD_COUNTS}
+        stale = [name for name in DASHBOARD_COUNTS
+                 if name not in self._counts
+                 or self._counts[name][0] != versions[name]
+                 or self._counts[name][1] < now]
+
+        if stale:
+            statement = select(*(
+                select(func.count()).select_from(DASHBOARD_COUNTS[name]).scalar_subquery().label(name)
+                for name in stale
+            ))
+            row = db.session.execute(statement).one()
+            expires_at = now + current_app.config.get('ADMIN_STATS_TTL', 60)
+            with self._lock:
+                for name in stale:
+                    self._counts[name] = (versions[name], expires_at, row._mapping[name])
+
+        return {name: self._counts[name][2] for name in DASHBOARD_COUNTS}
+
+    def invalidate(self, *names):
+        """Mark counts as changed in every worker"""
+        for name in names:
+            bump_version(self._stamp_key(name))
+
+
+# =========================================
+# STATS INSTANCES
+# =========================================
+dashboard_stats = DashboardStats()
@@ -0,0 +1,56 @@
+"""
+Templating Utilities Module
+Jinja environment tuning shared by all gunicorn workers:
+- Persistent Filesystem Bytecode Cache
+- Template Warm-up at Worker Boot
+"""
+
+# =========================================
+# STANDARD LIBRARY IMPORTS
+# =========================================
+import os
+
+# =========================================
+# THIRD-PARTY IMPORTS
+# =========================================
+from jinja2 import FileSystemBytecodeCache, TemplateError
+
+
+# =========================================
+# APPLICATION SETUP
+# =========================================
+
+def init_templating(app):
+    """
+    Attach the bytecode cache and optionally precompile every template.
+
+    Compiled templates are written to JINJA_BYTECODE_CACHE_DIR (defaults to
+    instance/jinja_cache), so after a deploy only the first worker pays the
+    compile cost and the others load bytecode from disk. With
+    TEMPLATE_WARMUP enabled, every template is loaded before the worker
+    serves its first request.
+    """
+    cache_dir = app.config.get('JINJA_BYTECODE_CACHE_DIR') or os.path.join(app.instance_path, 'jinja_cache')
+    os.makedirs(cache_dir, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+
+    if app.config.get('TEMPLATE_WARMUP'):
+        warm_templates(app)
+
+
+def warm_templates(app):
+    """
+    Compile every HTML template into the environment's in-memory cache.
+
+    Returns:
+        int: Number of templates compiled
+    """
+    compiled = 0
+    for name in app.jinja_env.list_templates(extensions=['html']):
+        try:
+            app.jinja_env.get_template(name)
+            compiled += 1
+        except TemplateError as e:
+            # A broken template should not keep the worker from booting
+            app.logger.warning(f"Template warm-up skipped {name}: {e}")
+    return compiled
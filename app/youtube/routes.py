@@ -10,7 +10,7 @@ Handles YouTube video listing and details:
 # =========================================
 # THIRD-PARTY IMPORTS
 # =========================================
-from flask import render_template, request
+from flask import current_app, render_template, request
 
 # =========================================
 # LOCAL APPLICATION IMPORTS
@@ -19,6 +19,10 @@ from app.extensions import db
 from app.youtube import youtube
 from app.models.youtube_video import YouTubeVideo
 from app.models.youtube_category import YouTubeCategory
+from app.utils.decorators import cache_page, conditional_get
+from app.utils.cache import PAGE_TAG_VIDEOS
+from app.utils.pagination import keyset_paginate
+from app.utils.query_options import video_listing_options
 
 
 # =========================================
@@ -26,25 +30,27 @@ from app.models.youtube_category import YouTubeCategory
 # =========================================
 
 @youtube.route("/videos")
+@cache_page(timeout=300, tags=(PAGE_TAG_VIDEOS,))
 def videos_list():
     """Display paginated list of YouTube videos with category filtering and featured carousel"""
-    page = request.args.get('page', 1, type=int)
+    cursor = request.args.get('cursor')
     category_filter = request.args.get('category')
     
     # Base query for active videos
-    query = YouTubeVideo.query.filter_by(is_active=True)
+    query = YouTubeVideo.query.options(*video_listing_options()).filter_by(is_active=True)
     
     # Apply category filter if specified
     if category_filter:
-        query = query.filter_by(category=category_filter)
+        query = query.join(YouTubeVideo.video_category).filter(YouTubeCategory.name == category_filter)
         
-    videos_paginated = query.order_by(YouTubeVideo.created_at.desc()).paginate(page=page, per_page=9)
+    videos_paginated = keyset_paginate(query, YouTubeVideo, per_page=current_app.config['VIDEOS_PER_PAGE'], cursor=cursor,
+                                       total_key=f"videos:{category_filter or ''}")
     
     # Fetch all categories from YouTubeCategory table
     categories = [cat.name for cat in YouTubeCategory.query.all()]
     
     # Fetch latest 3 videos for featured carousel
-    featured_videos = YouTubeVideo.query.filter_by(is_active=True).order_by(YouTubeVideo.created_at.desc()).limit(3).all()
+    featured_videos = YouTubeVideo.query.options(*video_listing_options()).filter_by(is_active=True).order_by(YouTubeVideo.created_at.desc()).limit(3).all()
     
     return render_template('youtube/videos.html', 
                          title='YouTube Videos', 
@@ -59,6 +65,8 @@ def videos_list():
 # =========================================
 
 @youtube.route("/video/<int:video_id>")
+@conditional_get(YouTubeVideo, 'video_id', tags=(PAGE_TAG_VIDEOS,))
+@cache_page(timeout=600, tags=(PAGE_TAG_VIDEOS,))
 def video_detail(video_id):
     """Display individual YouTube video details"""
     video = YouTubeVideo.query.get_or_404(video_id)
@@ -0,0 +1,23 @@
+/** Admin dashboard theme, served by base/admin_base.html */
+module.exports = {
+    content: require('./content'),
+    darkMode: 'class',
+    theme: {
+        extend: {
+            colors: {
+                'primary': '#2b8cee',
+                'background-light': '#f6f7f8',
+                'background-dark': '#101922',
+                'surface-dark': '#1c2b3e', // Slightly lighter than background-dark for cards
+            },
+            fontFamily: {
+                'display': ['Inter', 'sans-serif'],
+            },
+            borderRadius: { 'DEFAULT': '0.25rem', 'lg': '0.5rem', 'xl': '0.75rem', 'full': '9999px' },
+        },
+    },
+    plugins: [
+        require('@tailwindcss/forms'),
+        require('@tailwindcss/container-queries'),
+    ],
+};
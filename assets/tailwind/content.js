@@ -0,0 +1,5 @@
+// Files scanned for class names; unused utilities are purged from the build
+module.exports = [
+    './app/templates/**/*.html',
+    './app/static/js/**/*.js',
+];
@@ -0,0 +1,21 @@
+/** Admin login theme, served by auth/admin_login.html */
+module.exports = {
+    content: require('./content'),
+    darkMode: 'class',
+    theme: {
+        extend: {
+            colors: {
+                'primary': '#3b82f6',
+                'background-dark': '#0f172a',
+                'surface-dark': '#1e293b',
+            },
+            fontFamily: {
+                'sans': ['Plus Jakarta Sans', 'sans-serif'],
+                'display': ['Outfit', 'sans-serif'],
+            },
+        },
+    },
+    plugins: [
+        require('@tailwindcss/forms'),
+    ],
+};
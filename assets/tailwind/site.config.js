@@ -0,0 +1,32 @@
+/** Public site theme, served by base/base.html */
+module.exports = {
+    content: require('./content'),
+    darkMode: 'class',
+    theme: {
+        extend: {
+            colors: {
+                'primary': '#3b82f6', // Blue 500
+                'primary-dark': '#2563eb', // Blue 600
+                'secondary': '#6366f1', // Indigo 500
+                'background-dark': '#0B1120', // Very dark blue/slate
+                'surface-dark': '#161e2e', // Slightly lighter
+                'surface-highlight': '#1f2937',
+                'border-dark': '#1f2937', // Gray 800
+                'text-primary': '#f8fafc', // Slate 50
+                'text-secondary': '#94a3b8', // Slate 400
+                'accent': '#0ea5e9', // Sky 500
+            },
+            fontFamily: {
+                'sans': ['Plus Jakarta Sans', 'sans-serif'],
+            },
+            backgroundImage: {
+                'hero-glow': 'radial-gradient(circle at center, rgba(59, 130, 246, 0.15) 0%, rgba(11, 17, 32, 0) 70%)',
+                'card-gradient': 'linear-gradient(180deg, rgba(30, 41, 59, 0.5) 0%, rgba(15, 23, 42, 0.5) 100%)',
+            },
+        },
+    },
+    plugins: [
+        require('@tailwindcss/forms'),
+        require('@tailwindcss/container-queries'),
+    ],
+};
@@ -0,0 +1,359 @@
+"""
+Gunicorn Load Benchmark
+Mixed read/write load against the real application served by gunicorn:
+- Migrates and Seeds a Throwaway Database
+- Anonymous Listing Reads (page cache off) and Admin Service Edits as Writes
+- Stock vs Tuned SQLite Settings (journal mode, sync, mmap, cache size)
+- Connection Pool Usage and Checkout Waits per Worker (pool_metrics)
+
+Run from the repository root:
+
+    python -m benchmarks.gunicorn_load --workers 4 --threads 4 --clients 16
+
+With --database-url the run targets that database instead, under the
+production profile (APP_CONFIG=production), whose PostgreSQL pool records
+checkout waits. The database is migrated and seeded, so only point it at a
+throwaway database.
+"""
+
+# =========================================
+# STANDARD LIBRARY IMPORTS
+# =========================================
+import argparse
+import http.cookiejar
+import json
+import os
+import random
+import re
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import Counter
+
+
+# =========================================
+# BENCHMARK SETTINGS
+# =========================================
+READ_URLS = ('/projects', '/services', '/study-materials', '/videos', '/blog')
+
+ADMIN_EMAIL = 'bench-admin@example.com'
+ADMIN_PASSWORD = 'bench-password'
+SEEDED_SERVICES = 20
+SEEDED_ROWS = 200
+
+# SQLITE_* settings per profile; 'stock' is SQLite's own behaviour with
+# pysqlite's 5 s busy timeout, 'tuned' is the Config defaults
+SQLITE_PROFILES = {
+    'stock': {
+        'SQLITE_JOURNAL_MODE': 'DELETE',
+        'SQLITE_SYNCHRONOUS': 'FULL',
+        'SQLITE_BUSY_TIMEOUT': '5000',
+        'SQLITE_MMAP_SIZE': '0',
+        'SQLITE_CACHE_SIZE': '-2000',
+    },
+    'tuned': {},
+}
+
+CSRF_PATTERN = re.compile(r'name="csrf_token"[^>]*value="([^"]+)"')
+
+
+# =========================================
+# DATABASE SETUP
+# =========================================
+
+def migrate_and_seed(database_url, env):
+    """Upgrade a database to the latest migration and fill it with listing rows and an admin"""
+    subprocess.run([sys.executable, '-m', 'flask', 'db', 'upgrade'], env=env, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    from app import create_app
+    from app.config import Config
+    from app.extensions import db
+    from app.models.blog_post import BlogPost
+    from app.models.project import Project
+    from app.models.service import Service
+    from app.models.service_category import ServiceCategory
+    from app.models.study_material import StudyMaterial
+    from app.models.user import User
+    from app.models.youtube_video import YouTubeVideo
+    from app.utils.constants import ROLE_ADMIN
+    from app.utils.search import search_index
+
+    class SeedConfig(Config):
+        SQLALCHEMY_DATABASE_URI = database_url
+        SQLALCHEMY_BINDS = {}
+        CACHE_VERSION_DIR = env['CACHE_VERSION_DIR']
+        SQLITE_JOURNAL_MODE = 'DELETE'
+
+    app = create_app(SeedConfig)
+    with app.app_context():
+        admin = User(username='bench-admin', email=ADMIN_EMAIL, password=ADMIN_PASSWORD, role=ROLE_ADMIN)
+        category = ServiceCategory(name='Benchmark')
+        db.session.add_all([admin, category])
+        db.session.flush()
+        db.session.add_all(Service(title=f"Service {i}", description='Benchmark service', price=10,
+                                   user_id=admin.id, category_id=category.id) for i in range(SEEDED_SERVICES))
+        for i in range(SEEDED_ROWS):
+            post = BlogPost(title=f"Post {i}", content='<p>Benchmark post body</p>')
+            post.update_excerpt()
+            db.session.add_all([
+                post,
+                Project(title=f"Project {i}", description='Benchmark project'),
+                StudyMaterial(title=f"Material {i}", description='Benchmark material'),
+                YouTubeVideo(title=f"Video {i}", video_id=f"vid{i:08d}", description='Benchmark video'),
+            ])
+        db.session.commit()
+        search_index.rebuild()
+        service_ids = [row.id for row in db.session.query(Service.id)]
+        category_id = category.id
+    return service_ids, category_id
+
+
+# =========================================
+# GUNICORN SERVER
+# =========================================
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_gunicorn(args, env, port):
+    """Start gunicorn on run:app and wait until it answers"""
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-w', str(args.workers), '--threads', str(args.threads),
+         '-b', f"127.0.0.1:{port}", '--log-level', 'warning', 'run:app'],
+        env=env,
+    )
+    deadline = time.monotonic() + 60
+    try:
+        while time.monotonic() < deadline:
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/projects", timeout=5).read()
+                return process
+            except OSError:
+                # Refused, reset or timed out while the workers are still booting
+                time.sleep(0.5)
+        raise RuntimeError('gunicorn did not start within 60 s')
+    except BaseException:
+        process.terminate()
+        process.wait()
+        raise
+
+
+# =========================================
+# LOAD CLIENTS
+# =========================================
+
+class NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class AdminSession:
+    """
+    Cookie-carrying client signed in as the benchmark admin.
+
+    One session is shared by every writer thread: the login route allows
+    5 attempts per minute per worker, and the cookie jar is thread-safe.
+    """
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()), NoRedirect())
+        login_page = self.opener.open(f"{base_url}/admin/login").read().decode()
+        self.csrf_token = CSRF_PATTERN.search(login_page).group(1)
+        status = self.post('/admin/login', {'email': ADMIN_EMAIL, 'password': ADMIN_PASSWORD})
+        if status != 302:
+            raise RuntimeError(f"Admin login failed ({status})")
+
+    def get(self, path):
+        return self.opener.open(f"{self.base_url}{path}", timeout=30).read()
+
+    def post(self, path, data):
+        body = urllib.parse.urlencode({**data, 'csrf_token': self.csrf_token}).encode()
+        try:
+            with self.opener.open(f"{self.base_url}{path}", data=body, timeout=30) as response:
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+
+
+def run_load(args, base_url, service_ids, category_id):
+    """
+    Drive reads and writes from client threads for args.duration seconds.
+
+    Returns:
+        dict: Latencies and status counts for reads and writes
+    """
+    results = {kind: {'latencies': [], 'statuses': Counter()} for kind in ('read', 'write')}
+    lock = threading.Lock()
+    writers = round(args.clients * args.write_ratio)
+    session = AdminSession(base_url)
+    stop_at = time.monotonic() + args.duration
+
+    def record(kind, started, status):
+        with lock:
+            results[kind]['latencies'].append(time.perf_counter() - started)
+            results[kind]['statuses'][status] += 1
+
+    def reader():
+        while time.monotonic() < stop_at:
+            started = time.perf_counter()
+            try:
+                with urllib.request.urlopen(base_url + random.choice(READ_URLS), timeout=30) as response:
+                    response.read()
+                    status = response.status
+            except urllib.error.HTTPError as e:
+                status = e.code
+            record('read', started, status)
+
+    def writer():
+        while time.monotonic() < stop_at:
+            service_id = random.choice(service_ids)
+            started = time.perf_counter()
+            status = session.post(f"/admin/service/{service_id}/edit", {
+                'title': f"Service {service_id} {random.randint(0, 10 ** 6)}",
+                'description': 'Benchmark service, edited',
+                'price': '10',
+                'category_id': str(category_id),
+                'is_active': 'True',
+            })
+            record('write', started, status)
+
+    threads = [threading.Thread(target=writer) for _ in range(writers)]
+    threads += [threading.Thread(target=reader) for _ in range(args.clients - writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    results['admin'] = session
+    return results
+
+
+def collect_pool_metrics(session, workers):
+    """
+    Poll the pool metrics endpoint until every worker has answered (or give up after 10 rounds).
+
+    Each round sends one concurrent request per worker; sequential requests
+    tend to be accepted by the same idle worker every time.
+    """
+    by_pid = {}
+
+    def poll():
+        report = json.loads(session.get('/admin/metrics/db-pool'))
+        with lock:
+            by_pid[report['pid']] = report
+
+    lock = threading.Lock()
+    for _ in range(10):
+        threads = [threading.Thread(target=poll) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if len(by_pid) == workers:
+            break
+    return [by_pid[pid] for pid in sorted(by_pid)]
+
+
+# =========================================
+# REPORTING
+# =========================================
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def report(label, results, pools, duration):
+    print(f"\n{'=' * 72}\n{label}\n{'=' * 72}")
+    for kind in ('read', 'write'):
+        latencies = results[kind]['latencies']
+        statuses = dict(results[kind]['statuses'])
+        print(f"{kind + 's':<7} {len(latencies) / duration:8.1f}/s   "
+              f"p50 {percentile(latencies, 0.5) * 1000:7.1f} ms   p95 {percentile(latencies, 0.95) * 1000:7.1f} ms   "
+              f"statuses {statuses}")
+    print(f"pool per worker ({len(pools)} answered the metrics endpoint):")
+    for pool in pools:
+        waits = ''
+        if 'checkouts' in pool:
+            waits = (f" checkouts {pool['checkouts']} timeouts {pool['timeouts']} avg wait {pool['avg_wait_ms']} ms "
+                     f"max wait {pool['max_wait_ms']} ms histogram {pool['wait_histogram']}")
+        print(f"  pid {pool['pid']} {pool['pool']} size {pool.get('size')} checked_out {pool.get('checked_out')} "
+              f"overflow {pool.get('overflow')}{waits}")
+    if pools and not any('checkouts' in pool for pool in pools):
+        print('  (checkout waits are recorded by the production PostgreSQL pool; use --database-url)')
+
+
+# =========================================
+# ENTRY POINT
+# =========================================
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=4, help='gunicorn worker processes')
+    parser.add_argument('--threads', type=int, default=4, help='gunicorn threads per worker')
+    parser.add_argument('--clients', type=int, default=16, help='Concurrent client threads')
+    parser.add_argument('--write-ratio', type=float, default=0.2, help='Share of clients sending admin writes')
+    parser.add_argument('--duration', type=float, default=15, help='Seconds of load per run')
+    parser.add_argument('--database-url', help='Throwaway database to use instead of SQLite (production profile)')
+    parser.add_argument('--profile', choices=['stock', 'tuned', 'both'], default='both',
+                        help='SQLite settings to compare (ignored with --database-url)')
+    args = parser.parse_args()
+    # Turn SIGTERM into SystemExit so the gunicorn server is still shut down
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(1))
+
+    workdir = tempfile.mkdtemp(prefix='gunicorn-load-')
+    base_env = {
+        **os.environ,
+        'FLASK_APP': 'run.py',
+        'PAGE_CACHE_ENABLED': 'false',
+        'CACHE_VERSION_DIR': os.path.join(workdir, 'cache_versions'),
+        'WEB_CONCURRENCY': str(args.workers),
+        'GUNICORN_THREADS': str(args.threads),
+    }
+
+    if args.database_url:
+        runs = [('production', args.database_url, {'APP_CONFIG': 'production'})]
+        seed_url = args.database_url
+    else:
+        seed_url = f"sqlite:///{os.path.join(workdir, 'seed.db')}"
+        profiles = ['stock', 'tuned'] if args.profile == 'both' else [args.profile]
+        runs = [(name, f"sqlite:///{os.path.join(workdir, f'{name}.db')}", SQLITE_PROFILES[name]) for name in profiles]
+
+    seed_env = {**base_env, 'DATABASE_URL': seed_url, 'SQLITE_JOURNAL_MODE': 'DELETE'}
+    service_ids, category_id = migrate_and_seed(seed_url, seed_env)
+
+    for name, database_url, overrides in runs:
+        if database_url != seed_url:
+            # Every SQLite profile starts from an identical copy of the seeded file
+            shutil.copy(seed_url[len('sqlite:///'):], database_url[len('sqlite:///'):])
+        env = {**base_env, 'DATABASE_URL': database_url, **overrides}
+        port = free_port()
+        server = start_gunicorn(args, env, port)
+        try:
+            results = run_load(args, f"http://127.0.0.1:{port}", service_ids, category_id)
+            pools = collect_pool_metrics(results['admin'], args.workers)
+        finally:
+            server.terminate()
+            server.wait()
+        report(f"{name}: {args.workers} workers x {args.threads} threads, {args.clients} clients, "
+               f"{args.write_ratio:.0%} writers, {args.duration:g} s", results, pools, args.duration)
+    print(f"\nFiles left in {workdir}")
+
+
+if __name__ == '__main__':
+    main()
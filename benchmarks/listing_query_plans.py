@@ -0,0 +1,201 @@
+"""
+Listing Query Plan Benchmark
+Shows that the public listing queries use the composite listing indexes:
+- Seeds a Throwaway SQLite Database with N Rows per Listing Table
+  (the home page renders every skill and team member, so those get fewer)
+- Captures the SQL the Real Listing Routes Issue (first and second page)
+- Prints EXPLAIN QUERY PLAN and Timings with the Indexes, Then Without Them
+
+Run from the repository root:
+
+    python -m benchmarks.listing_query_plans --rows 100000 --home-rows 2000
+"""
+
+# =========================================
+# STANDARD LIBRARY IMPORTS
+# =========================================
+import argparse
+import os
+import re
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# =========================================
+# THIRD-PARTY IMPORTS
+# =========================================
+from sqlalchemy import Boolean, DateTime, Float, Integer, event
+
+# =========================================
+# LOCAL APPLICATION IMPORTS
+# =========================================
+from app import create_app
+from app.config import Config
+from app.extensions import db
+from app.models.blog_post import BlogPost
+from app.models.home_page import Skill, TeamMember
+from app.models.project import Project
+from app.models.service import Service
+from app.models.study_material import StudyMaterial
+from app.models.youtube_video import YouTubeVideo
+
+
+# =========================================
+# BENCHMARK SETTINGS
+# =========================================
+LISTING_MODELS = (Project, Service, StudyMaterial, YouTubeVideo, BlogPost, Skill, TeamMember)
+
+# Rendered in full on the home page rather than paginated
+HOME_MODELS = (Skill, TeamMember)
+
+# Listing pages whose queries are explained: the first page and the page its "next" link leads to
+LISTING_URLS = ('/', '/projects', '/services', '/study-materials', '/videos', '/blog')
+
+NEXT_CURSOR_PATTERN = re.compile(r'cursor=([^"&]+)')
+
+TIMING_RUNS = 20
+
+
+# =========================================
+# DATA SEEDING
+# =========================================
+
+def _column_value(column, i, now):
+    """Return a plausible value of a column for row i"""
+    if column.name == 'is_active':
+        # Roughly one row in ten is inactive, like unpublished drafts
+        return i % 10 != 0
+    if column.name == 'created_at':
+        return now - timedelta(minutes=i)
+    if column.name == 'order':
+        return i
+    if isinstance(column.type, Boolean):
+        return True
+    if isinstance(column.type, DateTime):
+        return now
+    if isinstance(column.type, (Integer, Float)):
+        return 1
+    return f"{column.name} {i}"
+
+
+def seed(model, rows, batch_size=10000):
+    """Insert `rows` rows into a model's table with executemany batches"""
+    table = model.__table__
+    columns = [column for column in table.columns if not column.primary_key and not column.foreign_keys]
+    now = datetime.utcnow()
+    for start in range(0, rows, batch_size):
+        batch = [{column.name: _column_value(column, i, now) for column in columns}
+                 for i in range(start, min(start + batch_size, rows))]
+        db.session.execute(table.insert(), batch)
+    db.session.commit()
+
+
+def listing_indexes():
+    """Return (table, index name) for every listing index declared on the models"""
+    return [(model.__tablename__, index.name) for model in LISTING_MODELS
+            for index in model.__table__.indexes if '_active_' in index.name]
+
+
+# =========================================
+# PLAN CAPTURE
+# =========================================
+
+def capture_listing_sql(app):
+    """
+    Request every listing page (and its second page) and record the SELECTs they run.
+
+    Returns:
+        list: Unique (statement, parameters) pairs in the order they ran
+    """
+    captured = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT') and (statement, parameters) not in captured:
+            captured.append((statement, parameters))
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        client = app.test_client()
+        for url in LISTING_URLS:
+            response = client.get(url)
+            match = NEXT_CURSOR_PATTERN.search(response.get_data(as_text=True))
+            if match:
+                client.get(f"{url}?cursor={match.group(1)}")
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+
+    tables = {model.__tablename__ for model in LISTING_MODELS}
+    return [(statement, parameters) for statement, parameters in captured
+            if any(re.search(rf'\bFROM {table}\b', statement) for table in tables)]
+
+
+def report(path, statements, label):
+    """Print the plan and the median run time of each captured statement"""
+    print(f"\n{'=' * 72}\n{label}\n{'=' * 72}")
+    connection = sqlite3.connect(path)
+    try:
+        for statement, parameters in statements:
+            plan = connection.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+            timings = []
+            for _ in range(TIMING_RUNS):
+                started = time.perf_counter()
+                connection.execute(statement, parameters).fetchall()
+                timings.append(time.perf_counter() - started)
+            timings.sort()
+            print(f"\n{' '.join(statement.split())[:160]}")
+            for row in plan:
+                print(f"    {row[-1]}")
+            print(f"    median {timings[len(timings) // 2] * 1000:.3f} ms")
+    finally:
+        connection.close()
+
+
+# =========================================
+# ENTRY POINT
+# =========================================
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000, help='Rows seeded into each listing table')
+    parser.add_argument('--home-rows', type=int, default=2000, help='Rows seeded into skills and team_members')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='listing-plans-')
+    path = os.path.join(workdir, 'bench.db')
+
+    class BenchmarkConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{path}"
+        SQLALCHEMY_BINDS = {}
+        CACHE_VERSION_DIR = os.path.join(workdir, 'cache_versions')
+        PAGE_CACHE_ENABLED = False
+        RATELIMIT_ENABLED = False
+
+    app = create_app(BenchmarkConfig)
+    with app.app_context():
+        db.create_all()
+        for model in LISTING_MODELS:
+            rows = args.home_rows if model in HOME_MODELS else args.rows
+            started = time.perf_counter()
+            seed(model, rows)
+            print(f"Seeded {rows} {model.__tablename__} rows in {time.perf_counter() - started:.1f} s")
+        db.session.execute(db.text('ANALYZE'))
+        db.session.commit()
+
+    statements = capture_listing_sql(app)
+    report(path, statements, f"WITH listing indexes ({args.rows} rows per listing table)")
+
+    connection = sqlite3.connect(path)
+    for _, index_name in listing_indexes():
+        connection.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+    connection.execute('ANALYZE')
+    connection.commit()
+    connection.close()
+    report(path, statements, 'WITHOUT listing indexes')
+    print(f"\nDatabase left at {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""Blog post excerpts
+
+Adds blog_posts.excerpt, the plain-text preview shown on the blog listing,
+and fills it for existing posts. The excerpt logic is copied here (instead of
+importing BlogPost.build_excerpt) so the migration keeps working if the model
+changes later.
+
+Revision ID: 065ccf1adb31
+Revises: 60c779620ac8
+Create Date: 2026-10-18 17:12:40.227141
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from markupsafe import Markup
+
+
+# revision identifiers, used by Alembic.
+revision = '065ccf1adb31'
+down_revision = '60c779620ac8'
+branch_labels = None
+depends_on = None
+
+
+EXCERPT_LENGTH = 120
+
+
+def build_excerpt(content):
+    text = Markup(content or '').striptags()
+    if len(text) <= EXCERPT_LENGTH + 5:
+        return text
+    return text[:EXCERPT_LENGTH - 3].rsplit(' ', 1)[0] + '...'
+
+
+def upgrade():
+    with op.batch_alter_table('blog_posts', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('excerpt', sa.String(length=200), nullable=True))
+
+    blog_posts = sa.table('blog_posts', sa.column('id', sa.Integer), sa.column('content', sa.Text),
+                          sa.column('excerpt', sa.String))
+    connection = op.get_bind()
+    rows = connection.execute(sa.select(blog_posts.c.id, blog_posts.c.content)).all()
+    if rows:
+        connection.execute(
+            blog_posts.update().where(blog_posts.c.id == sa.bindparam('post_id'))
+            .values(excerpt=sa.bindparam('new_excerpt')),
+            [{'post_id': row.id, 'new_excerpt': build_excerpt(row.content)} for row in rows],
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('blog_posts', schema=None) as batch_op:
+        batch_op.drop_column('excerpt')
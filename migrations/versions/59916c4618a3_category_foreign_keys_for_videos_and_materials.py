@@ -0,0 +1,73 @@
+"""Category foreign keys for videos and materials
+
+Replaces the free-text youtube_videos.category and study_materials.category
+columns with indexed category_id foreign keys. Existing names are matched
+to their category rows; names with no matching category are created as
+categories first, so no assignment is lost.
+
+Revision ID: 59916c4618a3
+Revises: ca62fac7182b
+Create Date: 2026-10-18 16:56:51.544999
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '59916c4618a3'
+down_revision = 'ca62fac7182b'
+branch_labels = None
+depends_on = None
+
+
+# (item table, category table)
+CATEGORIZED_TABLES = (
+    ('youtube_videos', 'youtube_categories'),
+    ('study_materials', 'study_material_categories'),
+)
+
+
+def upgrade():
+    for table, category_table in CATEGORIZED_TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column('category_id', sa.Integer(), nullable=True))
+            batch_op.create_index(batch_op.f(f'ix_{table}_category_id'), ['category_id'], unique=False)
+            batch_op.create_foreign_key(batch_op.f(f'fk_{table}_category_id_{category_table}'),
+                                        category_table, ['category_id'], ['id'])
+
+        # Names that were typed in but never created as categories
+        op.execute(f"""
+            INSERT INTO {category_table} (name, created_at, updated_at)
+            SELECT DISTINCT {table}.category, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+            FROM {table}
+            WHERE {table}.category IS NOT NULL AND {table}.category <> ''
+              AND NOT EXISTS (SELECT 1 FROM {category_table} WHERE {category_table}.name = {table}.category)
+        """)
+        op.execute(f"""
+            UPDATE {table}
+            SET category_id = (SELECT {category_table}.id FROM {category_table}
+                               WHERE {category_table}.name = {table}.category)
+            WHERE {table}.category IS NOT NULL
+        """)
+
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_column('category')
+
+
+def downgrade():
+    for table, category_table in reversed(CATEGORIZED_TABLES):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column('category', sa.VARCHAR(length=50), nullable=True))
+
+        op.execute(f"""
+            UPDATE {table}
+            SET category = (SELECT {category_table}.name FROM {category_table}
+                            WHERE {category_table}.id = {table}.category_id)
+            WHERE {table}.category_id IS NOT NULL
+        """)
+
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_constraint(batch_op.f(f'fk_{table}_category_id_{category_table}'), type_='foreignkey')
+            batch_op.drop_index(batch_op.f(f'ix_{table}_category_id'))
+            batch_op.drop_column('category_id')
@@ -0,0 +1,34 @@
+"""Category listing index for study materials
+
+The study materials page filters by category and pages newest first, so
+(category_id, is_active, created_at) serves it as an index range scan. The
+composite index also covers category_id lookups, replacing the single-column
+index added with the foreign key.
+
+Revision ID: 60c779620ac8
+Revises: 59916c4618a3
+Create Date: 2026-10-18 17:08:05.894017
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '60c779620ac8'
+down_revision = '59916c4618a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('study_materials', schema=None) as batch_op:
+        batch_op.drop_index('ix_study_materials_category_id')
+        batch_op.create_index('ix_study_materials_category_active_created_at',
+                              ['category_id', 'is_active', 'created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('study_materials', schema=None) as batch_op:
+        batch_op.drop_index('ix_study_materials_category_active_created_at')
+        batch_op.create_index('ix_study_materials_category_id', ['category_id'], unique=False)
@@ -0,0 +1,77 @@
+"""Full-text search index
+
+Creates search_index, the unified full-text index over blog posts, projects,
+services, study materials and videos, and fills it with the active items.
+SQLite gets an FTS5 virtual table; PostgreSQL gets a table with a stored,
+weighted tsvector (title A, body B) and a GIN index on it. The table is not
+part of the model metadata (see exclude_search_tables in app/utils/search.py).
+
+Revision ID: 83ce116017e9
+Revises: 065ccf1adb31
+Create Date: 2026-10-18 17:16:02.418305
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from markupsafe import Markup
+
+
+# revision identifiers, used by Alembic.
+revision = '83ce116017e9'
+down_revision = '065ccf1adb31'
+branch_labels = None
+depends_on = None
+
+
+# (item_type, table, body column, body is HTML)
+INDEXED_TABLES = (
+    ('blog', 'blog_posts', 'content', True),
+    ('project', 'projects', 'description', False),
+    ('service', 'services', 'description', False),
+    ('material', 'study_materials', 'description', False),
+    ('video', 'youtube_videos', 'description', False),
+)
+
+
+def upgrade():
+    connection = op.get_bind()
+    if connection.dialect.name == 'postgresql':
+        op.execute("""
+            CREATE TABLE search_index (
+                item_type VARCHAR(20) NOT NULL,
+                item_id INTEGER NOT NULL,
+                title TEXT NOT NULL,
+                body TEXT NOT NULL DEFAULT '',
+                document TSVECTOR GENERATED ALWAYS AS (
+                    setweight(to_tsvector('english', title), 'A') ||
+                    setweight(to_tsvector('english', body), 'B')
+                ) STORED,
+                CONSTRAINT pk_search_index PRIMARY KEY (item_type, item_id)
+            )
+        """)
+        op.execute("CREATE INDEX ix_search_index_document ON search_index USING GIN (document)")
+    else:
+        op.execute("""
+            CREATE VIRTUAL TABLE search_index USING fts5(
+                title, body, item_type UNINDEXED, item_id UNINDEXED,
+                tokenize = 'porter unicode61 remove_diacritics 2'
+            )
+        """)
+
+    # Index the items that are already published
+    insert = sa.text("INSERT INTO search_index (item_type, item_id, title, body) "
+                     "VALUES (:item_type, :item_id, :title, :body)")
+    for item_type, table, body_column, is_html in INDEXED_TABLES:
+        rows = connection.execute(sa.text(
+            f"SELECT id, title, {body_column} AS body FROM {table} WHERE is_active = :active"
+        ), {'active': True}).all()
+        if rows:
+            connection.execute(insert, [
+                {'item_type': item_type, 'item_id': row.id, 'title': row.title or '',
+                 'body': (Markup(row.body or '').striptags() if is_html else row.body) or ''}
+                for row in rows
+            ])
+
+
+def downgrade():
+    op.execute("DROP TABLE search_index")
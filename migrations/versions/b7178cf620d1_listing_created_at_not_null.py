@@ -0,0 +1,42 @@
+"""Listing created_at not null
+
+The public listings are keyset-paginated on (created_at, id). A NULL
+created_at cannot be encoded into a cursor and falls outside the
+(created_at, id) < (...) filter, so existing NULLs are filled from
+updated_at (or the current time) and the columns become NOT NULL.
+
+Revision ID: b7178cf620d1
+Revises: 83ce116017e9
+Create Date: 2026-10-18 17:48:42.411791
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7178cf620d1'
+down_revision = '83ce116017e9'
+branch_labels = None
+depends_on = None
+
+
+LISTING_TABLES = ('projects', 'services', 'study_materials', 'youtube_videos', 'blog_posts')
+
+
+def upgrade():
+    connection = op.get_bind()
+    for table_name in LISTING_TABLES:
+        table = sa.table(table_name, sa.column('created_at', sa.DateTime), sa.column('updated_at', sa.DateTime))
+        connection.execute(
+            table.update().where(table.c.created_at.is_(None))
+            .values(created_at=sa.func.coalesce(table.c.updated_at, sa.func.current_timestamp()))
+        )
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade():
+    for table_name in reversed(LISTING_TABLES):
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=True)
@@ -0,0 +1,42 @@
+"""Add listing indexes
+
+Public listings filter on is_active and order by created_at (newest first);
+the home page orders skills and team members by (order, id). On PostgreSQL
+the indexes are partial (WHERE is_active), so inactive rows are not indexed.
+
+Revision ID: ca62fac7182b
+Revises: 5952f6e8a588
+Create Date: 2026-10-18 16:52:10.487947
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ca62fac7182b'
+down_revision = '5952f6e8a588'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns)
+LISTING_INDEXES = (
+    ('ix_blog_posts_active_created_at', 'blog_posts', ['is_active', 'created_at']),
+    ('ix_projects_active_created_at', 'projects', ['is_active', 'created_at']),
+    ('ix_services_active_created_at', 'services', ['is_active', 'created_at']),
+    ('ix_study_materials_active_created_at', 'study_materials', ['is_active', 'created_at']),
+    ('ix_youtube_videos_active_created_at', 'youtube_videos', ['is_active', 'created_at']),
+    ('ix_skills_active_order', 'skills', ['is_active', 'order', 'id']),
+    ('ix_team_members_active_order', 'team_members', ['is_active', 'order', 'id']),
+)
+
+
+def upgrade():
+    for name, table, columns in LISTING_INDEXES:
+        op.create_index(name, table, columns, unique=False, postgresql_where=sa.text('is_active'))
+
+
+def downgrade():
+    for name, table, _ in reversed(LISTING_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,103 @@
+"""
+Shared Test Fixtures
+- Application on a Throwaway SQLite Database
+- Test Client and Admin Login
+- SQL Statement Counter
+"""
+
+# =========================================
+# THIRD-PARTY IMPORTS
+# =========================================
+import pytest
+from sqlalchemy import event
+
+# =========================================
+# LOCAL APPLICATION IMPORTS
+# =========================================
+from app import create_app
+from app.config import Config
+from app.extensions import db
+from app.models.user import User
+from app.utils.constants import ROLE_ADMIN
+
+
+ADMIN_EMAIL = 'admin@example.com'
+ADMIN_PASSWORD = 'test-password'
+
+
+# =========================================
+# APPLICATION FIXTURES
+# =========================================
+
+@pytest.fixture(scope='session')
+def app(tmp_path_factory):
+    """One application for the test session (the admin extension binds only once per process)"""
+    tmp_path = tmp_path_factory.mktemp('app')
+
+    class TestConfig(Config):
+        TESTING = True
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'test.db'}"
+        SQLALCHEMY_BINDS = {}
+        CACHE_VERSION_DIR = str(tmp_path / 'cache_versions')
+        WTF_CSRF_ENABLED = False
+        RATELIMIT_ENABLED = False
+        PAGE_CACHE_ENABLED = False
+        # Recount listing totals on every request so each one runs the same statements
+        PAGINATION_TOTAL_TTL = 0
+
+    app = create_app(TestConfig)
+    with app.app_context():
+        db.create_all()
+        admin = User(username='admin', email=ADMIN_EMAIL, password=ADMIN_PASSWORD, role=ROLE_ADMIN)
+        db.session.add(admin)
+        db.session.commit()
+    yield app
+
+
+@pytest.fixture
+def client(app):
+    """Test client for the session application"""
+    return app.test_client()
+
+
+@pytest.fixture
+def admin_client(client):
+    """Test client signed in as an admin"""
+    response = client.post('/admin/login', data={'email': ADMIN_EMAIL, 'password': ADMIN_PASSWORD})
+    assert response.status_code == 302
+    return client
+
+
+# =========================================
+# QUERY COUNTING
+# =========================================
+
+class QueryCounter:
+    """Counts the SQL statements sent to the database while active"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        self.statements = []
+        event.listen(self.engine, 'before_cursor_execute', self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, 'before_cursor_execute', self._record)
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+
+@pytest.fixture
+def count_queries(app):
+    """Return a context manager counting the statements of the code inside it"""
+    with app.app_context():
+        engine = db.engine
+    return lambda: QueryCounter(engine)
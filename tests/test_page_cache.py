@@ -0,0 +1,115 @@
+"""
+Page Cache Tests
+The full-page cache may only store and serve anonymous 200 responses:
+- Anonymous Repeat Requests Are Served from the Cache
+- Session Cookies and Flashed Messages Bypass It
+- Non-200 Responses Are Never Stored
+- Admin Saves Purge the Pages Tagged for Their Section
+"""
+
+# =========================================
+# THIRD-PARTY IMPORTS
+# =========================================
+import pytest
+
+# =========================================
+# LOCAL APPLICATION IMPORTS
+# =========================================
+from app.extensions import db
+from app.models.project import Project
+from app.models.project_category import ProjectCategory
+from app.utils.cache import page_cache
+
+
+# =========================================
+# FIXTURES
+# =========================================
+
+@pytest.fixture(scope='module', autouse=True)
+def seed(app):
+    """Seed one category with an active and an inactive project"""
+    with app.app_context():
+        category = ProjectCategory(name='Cached Category')
+        db.session.add(category)
+        db.session.flush()
+        active = Project(title='Cached Project', description='Description', category_id=category.id)
+        inactive = Project(title='Hidden Project', description='Description', category_id=category.id,
+                           is_active=False)
+        db.session.add_all([active, inactive])
+        db.session.commit()
+        return {'category_id': category.id, 'active_id': active.id, 'inactive_id': inactive.id}
+
+
+@pytest.fixture(autouse=True)
+def page_cache_enabled(app, monkeypatch):
+    """Turn the page cache on for each test, starting and ending empty"""
+    monkeypatch.setitem(app.config, 'PAGE_CACHE_ENABLED', True)
+    page_cache.clear()
+    yield
+    page_cache.clear()
+
+
+# =========================================
+# PAGE CACHE TESTS
+# =========================================
+
+def test_anonymous_repeat_request_is_a_cache_hit(client):
+    first = client.get('/projects')
+    second = client.get('/projects')
+
+    assert first.status_code == second.status_code == 200
+    assert first.headers['X-Cache'] == 'MISS'
+    assert second.headers['X-Cache'] == 'HIT'
+    assert second.get_data() == first.get_data()
+
+
+def test_session_cookie_bypasses_the_cache(app, client):
+    client.get('/projects')
+
+    visitor = app.test_client()
+    with visitor.session_transaction() as session:
+        session['cart'] = [1]
+    response = visitor.get('/projects')
+
+    assert response.status_code == 200
+    assert 'X-Cache' not in response.headers
+
+
+def test_flashed_messages_are_neither_served_from_nor_stored_in_the_cache(app, client):
+    visitor = app.test_client()
+    with visitor.session_transaction() as session:
+        session['_flashes'] = [('success', 'Only for this visitor')]
+    flashed = visitor.get('/projects')
+
+    assert 'X-Cache' not in flashed.headers
+    assert 'Only for this visitor' in flashed.get_data(as_text=True)
+
+    anonymous = client.get('/projects')
+    assert anonymous.headers['X-Cache'] == 'MISS'
+    assert 'Only for this visitor' not in anonymous.get_data(as_text=True)
+
+
+def test_non_200_responses_are_not_cached(client, seed):
+    url = f"/project/{seed['inactive_id']}"
+    first = client.get(url)
+    second = client.get(url)
+
+    assert first.status_code == second.status_code == 404
+    assert first.headers['X-Cache'] == second.headers['X-Cache'] == 'MISS'
+
+
+def test_admin_save_purges_the_tagged_pages(app, admin_client, seed):
+    visitor = app.test_client()
+    detail_url = f"/project/{seed['active_id']}"
+    for url in ('/projects', detail_url):
+        visitor.get(url)
+        assert visitor.get(url).headers['X-Cache'] == 'HIT'
+
+    response = admin_client.post(f"/admin/project-category/{seed['category_id']}/edit",
+                                 data={'name': 'Renamed Category', 'description': ''})
+    assert response.status_code == 302
+
+    for url in ('/projects', detail_url):
+        refreshed = visitor.get(url)
+        assert refreshed.headers['X-Cache'] == 'MISS'
+        assert 'Renamed Category' in refreshed.get_data(as_text=True)
@@ -0,0 +1,62 @@
+"""
+Query Count Tests
+Project listings must issue a fixed number of statements per page, so
+rendering `project.category` on every card never adds a query per project.
+"""
+
+# =========================================
+# THIRD-PARTY IMPORTS
+# =========================================
+import pytest
+
+# =========================================
+# LOCAL APPLICATION IMPORTS
+# =========================================
+from app.extensions import db
+from app.models.project import Project
+from app.models.project_category import ProjectCategory
+
+
+# =========================================
+# FIXTURES
+# =========================================
+
+@pytest.fixture(scope='module', autouse=True)
+def projects(app):
+    """Seed enough categorized projects to fill the largest page size"""
+    with app.app_context():
+        categories = [ProjectCategory(name=f"Category {i}") for i in range(4)]
+        db.session.add_all(categories)
+        db.session.flush()
+        db.session.add_all(
+            Project(title=f"Project {i}", description='Description', category_id=categories[i % 4].id)
+            for i in range(30)
+        )
+        db.session.commit()
+
+
+def _count_page(app, client, count_queries, url, config_key, per_page):
+    app.config[config_key] = per_page
+    # Warm per-worker caches (signed-in identity) so only the listing is measured
+    client.get(url)
+    with count_queries() as counter:
+        response = client.get(url)
+    assert response.status_code == 200
+    return counter.count
+
+
+# =========================================
+# PROJECT LISTING TESTS
+# =========================================
+
+def test_public_project_listing_query_count_is_independent_of_page_size(app, client, count_queries):
+    small = _count_page(app, client, count_queries, '/projects', 'PROJECTS_PER_PAGE', 3)
+    large = _count_page(app, client, count_queries, '/projects', 'PROJECTS_PER_PAGE', 24)
+    assert small == large
+
+
+def test_admin_project_listing_query_count_is_independent_of_page_size(app, admin_client, count_queries):
+    small = _count_page(app, admin_client, count_queries, '/admin/projects', 'ADMIN_PROJECTS_PER_PAGE', 3)
+    large = _count_page(app, admin_client, count_queries, '/admin/projects', 'ADMIN_PROJECTS_PER_PAGE', 24)
+    assert small == large
+